@@ -75,6 +75,7 @@ class BaseIRModule(ABC):
     _path: Path
     _symbol_table: SymbolTable
     _main: BaseIRBlock
+    __slots__ = ("_path", "_symbol_table", "_main")
 
     @property
     def path(self) -> Path:
@@ -122,6 +123,7 @@ class BaseIR(ABC):
 
     _ref_table: RefTable
     _module: BaseIRModule
+    __slots__ = ("_ref_table", "_module")
 
     def __init__(self, ref_table: RefTable, module: BaseIRModule, **kwargs: Any):
         self._ref_table = ref_table
@@ -149,12 +151,17 @@ class RefTypeTable:
     """Reference to types from another IR"""
 
     _table: dict[Symbol | CompositeSymbol, IRHash]
-    __slots__ = ("_table",)
+    _frozen: bool
+    __slots__ = ("_table", "_frozen")
 
     def __init__(self):
         self._table = dict()
+        self._frozen = False
 
     def add_ref(self, type_name: Symbol | CompositeSymbol, ir_path: Path) -> None:
+        if self._frozen:
+            raise ValueError(f"cannot add {type_name} to a frozen reference type table")
+
         if isinstance(type_name, Symbol | CompositeSymbol) and isinstance(
             ir_path, Path
         ):
@@ -163,6 +170,11 @@ class RefTypeTable:
         else:
             raise ValueError(f"wrong reference type table input ({type_name})")
 
+    def freeze(self) -> None:
+        """Make the table read-only; no references can be added afterward."""
+
+        self._frozen = True
+
     def get_irpath(self, type_name: Symbol | CompositeSymbol) -> Path:
         return self.get_irhash(type_name).key
 
@@ -170,7 +182,7 @@ class RefTypeTable:
         return self._table[type_name]
 
     def __hash__(self) -> int:
-        return hash(self._table)
+        return hash(frozenset(self._table.items()))
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, RefTypeTable):
@@ -192,18 +204,28 @@ class RefFnTable:
     """Reference to functions from another IR"""
 
     _table: dict[FnHeader, IRHash]
-    __slots__ = ("_table",)
+    _frozen: bool
+    __slots__ = ("_table", "_frozen")
 
     def __init__(self):
         self._table = dict()
+        self._frozen = False
 
     def add_ref(self, fn_name: FnHeader, ir_path: Path) -> None:
+        if self._frozen:
+            raise ValueError(f"cannot add {fn_name} to a frozen reference function table")
+
         if isinstance(fn_name, FnHeader) and isinstance(ir_path, Path):
             self._table[fn_name] = IRHash(ir_path)
 
         else:
             raise ValueError(f"wrong reference type table input ({fn_name})")
 
+    def freeze(self) -> None:
+        """Make the table read-only; no references can be added afterward."""
+
+        self._frozen = True
+
     def get_irpath(self, fn_name: FnHeader) -> Path:
         return self.get_irhash(fn_name).key
 
@@ -211,7 +233,7 @@ class RefFnTable:
         return self._table[fn_name]
 
     def __hash__(self) -> int:
-        return hash(self._table)
+        return hash(frozenset(self._table.items()))
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, RefFnTable):
@@ -262,6 +284,12 @@ class RefTable:
     def fns(self) -> RefFnTable:
         return self._fns
 
+    def freeze(self) -> None:
+        """Make both types and functions tables read-only."""
+
+        self._types.freeze()
+        self._fns.freeze()
+
     def __hash__(self) -> int:
         return hash(hash(self._types) + hash(self._fns))
 
@@ -266,6 +266,7 @@ class BaseIRInstr(ABC):
     _name: BaseIRFlag
     args: tuple[BaseIRBlock | SimpleObj | ObjArray, ...] | tuple
     _hash_value: int
+    __slots__ = ("_name", "args", "_hash_value")
 
     def __init__(self, *args: Any, **kwargs: Any):
         self._hash_value = hash((hash(self.name), hash(self.args)))
@@ -11,6 +11,7 @@ from hhat_lang.core.code.base import (
     BaseIRInstr,
 )
 from hhat_lang.core.data.core import (
+    CompositeSymbol,
     Literal,
     ObjArray,
     SimpleObj,
@@ -118,16 +119,15 @@ class IRInstr(BaseIRInstr):
     """
 
     _name: IRFlag
-    args: tuple[IRBlock | SimpleObj | ObjArray, ...] | tuple
+    args: tuple[IRBlock | SimpleObj | CompositeSymbol | ObjArray, ...] | tuple
+    __slots__ = ()
 
     def __init__(
         self,
-        *args: IRBlock | BaseIRInstr | SimpleObj | ObjArray,
+        *args: IRBlock | BaseIRInstr | SimpleObj | CompositeSymbol | ObjArray,
         name: IRFlag,
     ):
-        if all(
-            isinstance(k, IRBlock | BaseIRInstr | SimpleObj | ObjArray) for k in args
-        ) and isinstance(name, IRFlag):
+        if isinstance(name, IRFlag) and all(isinstance(k, _INSTR_ARGS_TYPES) for k in args):
             self._name = name
             self.args = args
             super().__init__()
@@ -138,5 +138,23 @@ class IRInstr(BaseIRInstr):
                 f" args as {[type(k) for k in args]}. Check for correct types."
             )
 
+    def _init_checked(
+        self,
+        *args: IRBlock | BaseIRInstr | SimpleObj | CompositeSymbol | ObjArray,
+        name: IRFlag,
+    ) -> None:
+        """
+        Set the instruction content without validating it again. To be used by child
+        classes that already checked ``args`` against narrower types than ``IRInstr``.
+        """
+
+        self._name = name
+        self.args = args
+        BaseIRInstr.__init__(self)
+
     def __repr__(self) -> str:
         return f"{self.name}({', '.join(str(k) for k in self.args)})"
+
+
+_INSTR_ARGS_TYPES = (IRBlock, BaseIRInstr, SimpleObj, CompositeSymbol, ObjArray)
+"""Valid ``IRInstr`` arguments types, checked on every instruction instantiation."""
@@ -79,6 +79,9 @@ class NodeSet:
 
     _data: tuple[IRNode, ...] | tuple
     _phf: ResultPHF | None
+    _paths: dict[Path, IRNode]
+    """nodes by their module path, for membership checks without scanning ``_data``"""
+    __slots__ = ("_data", "_phf", "_paths")
 
     def __init__(self, *data: IRNode, phf: ResultPHF | None = None):
         if (
@@ -88,6 +91,7 @@ class NodeSet:
         ):
             self._data = data
             self._phf = phf
+            self._paths = {k.path: k for k in data}
 
         else:
             raise ValueError("node set accepts only IRNode instances")
@@ -112,22 +116,14 @@ class NodeSet:
                 return item in self._data
 
             case IRHash():
-                for node in self._data:
-                    if item == node.irhash:
-                        return True
+                return item.key in self._paths
 
             case Path():
-                for node in self._data:
-                    if item == node.path:
-                        return True
+                return item in self._paths
 
             case tuple():
-                for node in self._data:
-                    _path = item[0]
-                    _symbol = item[1]
-
-                    if _path == node.path and _symbol in node.ir.module:
-                        return True
+                node = self._paths.get(item[0])
+                return node is not None and item[1] in node.ir.module
 
         return False
 
@@ -162,13 +158,22 @@ class IRGraph:
 
     _is_built: bool
     _nodes: NodeSet
-    _tmp_nodes: tuple[IRNode, ...] | tuple
-    _main_node: IRHash
+    _tmp_nodes: list[IRNode]
+    _tmp_index: dict[IRHash, int]
+    """position of each node in ``_tmp_nodes`` by its key"""
+    _edges: dict[tuple[IRHash, IRHash], dict[Symbol | CompositeSymbol, None]]
+    """imported references by (importing, imported) nodes keys; dicts as ordered sets"""
+    _main_node: IRHash | None
+    """main node key, or ``None`` if the program has no main"""
+    __slots__ = ("_is_built", "_nodes", "_tmp_nodes", "_tmp_index", "_edges", "_main_node")
 
     def __init__(self):
         self._is_built = False
         self._nodes = NodeSet()
-        self._tmp_nodes = ()
+        self._tmp_nodes = []
+        self._tmp_index = dict()
+        self._edges = dict()
+        self._main_node = None
 
     @property
     def nodes(self) -> NodeSet:
@@ -176,20 +181,110 @@ class IRGraph:
         return self._nodes
 
     @property
-    def main_node(self) -> IRHash:
+    def main_node(self) -> IRHash | None:
         return self._main_node
 
     @property
     def is_built(self) -> bool:
         return self._is_built
 
+    @property
+    def tmp_nodes(self) -> tuple[IRNode, ...] | tuple:
+        """Nodes added to the graph and not built yet."""
+        return tuple(self._tmp_nodes)
+
+    @property
+    def edges(self) -> dict[tuple[IRHash, IRHash], tuple[Symbol | CompositeSymbol, ...]]:
+        """Imported references by (importing, imported) nodes keys."""
+        return {k: tuple(v) for k, v in self._edges.items()}
+
     def add_node(self, ir: BaseIR) -> IRHash:
-        """Add an IR to the graph node."""
+        """
+        Add an IR to the graph node. An IR from a module already in the graph is
+        not added again; the existing node key is returned instead.
+        """
 
         node = IRNode(ir)
-        self._tmp_nodes += (node,)
+
+        if node.irhash not in self._tmp_index:
+            self._tmp_index[node.irhash] = len(self._tmp_nodes)
+            self._tmp_nodes.append(node)
+
         return node.irhash
 
+    def add_edge(
+        self,
+        *refs: Symbol | CompositeSymbol,
+        node_key: IRHash,
+        link_key: IRHash,
+    ) -> None:
+        """
+        Link the node ``node_key`` to the node ``link_key`` it imports ``refs`` from.
+        References already linked between the two nodes are not added again.
+        """
+
+        self._edges.setdefault((node_key, link_key), dict()).update(dict.fromkeys(refs))
+
+    def update_node(self, cur_node_key: IRHash, new_ir: BaseIR) -> IRHash:
+        """
+        Replace the node ``cur_node_key`` by a node for ``new_ir``, keeping its
+        position and its edges.
+
+        Returns:
+            The new node key
+        """
+
+        new_node = IRNode(new_ir)
+        new_key = new_node.irhash
+
+        if self._is_built:
+            # the built node set is indexed by a perfect hash of the keys
+            if new_key != cur_node_key or cur_node_key not in self._nodes:
+                raise ValueError(
+                    f"cannot update node {cur_node_key} to {new_key} on a built ir graph"
+                )
+
+            nodes = tuple(new_node if k.irhash == cur_node_key else k for k in self._nodes)
+            self._nodes = NodeSet.new_set(*nodes, phf=self._nodes.phf)
+            return new_key
+
+        if (idx := self._tmp_index.get(cur_node_key)) is None:
+            raise ValueError(f"node {cur_node_key} not found in the ir graph")
+
+        if new_key != cur_node_key and new_key in self._tmp_index:
+            raise ValueError(f"node {new_key} already in the ir graph")
+
+        del self._tmp_index[cur_node_key]
+        self._tmp_nodes[idx] = new_node
+        self._tmp_index[new_key] = idx
+
+        if new_key != cur_node_key:
+            self._edges = {
+                (
+                    new_key if p == cur_node_key else p,
+                    new_key if q == cur_node_key else q,
+                ): refs
+                for (p, q), refs in self._edges.items()
+            }
+
+            if self._main_node == cur_node_key:
+                self._main_node = new_key
+
+        return new_key
+
+    def reset(self) -> None:
+        """
+        Empty the graph in place so the same instance can hold another program. Every
+        slot is set back to its initial state, as on ``__init__``.
+        """
+
+        self._is_built = False
+        self._nodes = NodeSet()
+        self._tmp_nodes = []
+        self._tmp_index = dict()
+        self._edges = dict()
+        self._main_node = None
+
     def add_main_node(self, ir: BaseIR) -> IRHash:
         """Add main IR to the graph node."""
         self._main_node = self.add_node(ir)
@@ -217,7 +312,8 @@ class IRGraph:
         if not self._is_built and len(self._tmp_nodes) > 0:
             node_res, node_phf = gen_phf(self._tmp_nodes)
             self._nodes = NodeSet.new_set(*node_res, phf=node_phf)  # type: ignore [arg-type]
-            self._tmp_nodes = ()
+            self._tmp_nodes = []
+            self._tmp_index = dict()
 
             if self._check_refs():
                 self._is_built = True
@@ -233,16 +329,14 @@ class IRGraph:
 
     def update(self, cur_node_key: IRHash, new_node: BaseIR) -> None:
         """
-        TODO: implement it
-
         Update to a new node (IR module) from a given current node key (``IRHash``)
 
         Args:
-            cur_node_key:
-            new_node:
+            cur_node_key: the current node key
+            new_node: the new IR instance
         """
 
-        raise NotImplementedError()
+        self.update_node(cur_node_key, new_node)
 
     def get_fns(self, module_path: Path, item: Symbol) -> tuple[FnHeader, ...]:
         """
@@ -269,8 +363,11 @@ class IRGraph:
                     return True
 
         if isinstance(item, Path):
+            if IRHash(item) in self._tmp_index:
+                return True
+
             for tmp_node in self._tmp_nodes:
-                if item in tmp_node:
+                if item in tmp_node.ir.module:
                     return True
 
         return False
@@ -2,21 +2,23 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Any, Generic, Iterable, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Iterable, TypeVar
 
 from hhat_lang.core.code.base import FnHeader, FnHeaderDef
 from hhat_lang.core.data.core import CompositeSymbol, Symbol
 from hhat_lang.core.data.fn_def import BuiltinFnDef, FnDef, ModifierDef
-from hhat_lang.core.data.var_def import DataDef
 from hhat_lang.core.types.new_base_type import TypeDef
 
+if TYPE_CHECKING:
+    from hhat_lang.core.data.var_def import DataDef
+
 K = TypeVar("K")
 V = TypeVar("V")
 
 
 class BaseTable(ABC, Generic[K, V]):
-    @abstractmethod
     @property
+    @abstractmethod
     def table(self) -> OrderedDict[K, V]:
         raise NotImplementedError()
 
@@ -79,6 +81,26 @@ class TypeTable(BaseTable[Symbol | CompositeSymbol, TypeDef]):
                 f"known type structure"
             )
 
+    def bulk_add(self, items: Iterable[tuple[Symbol | CompositeSymbol, TypeDef]]) -> None:
+        """
+        Add many ``(name, data)`` type entries at once, with the same checks as ``add``;
+        the first definition of a name is the one kept.
+        """
+
+        new_items: dict[Symbol | CompositeSymbol, TypeDef] = dict()
+
+        for name, data in items:
+            if not (isinstance(name, Symbol | CompositeSymbol) and isinstance(data, TypeDef)):
+                raise ValueError(
+                    f"type {name} must be symbol/composite symbol and its data must be "
+                    f"known type structure"
+                )
+
+            new_items.setdefault(name, data)
+
+        table = self._table
+        table.update({k: v for k, v in new_items.items() if k not in table})
+
     def get(
         self, name: Symbol | CompositeSymbol, default: Any | None = None
     ) -> TypeDef | Any | None:
@@ -158,6 +180,35 @@ class FnTable(
             else:
                 raise ValueError(f"fn_entry is of wrong type ({type(fn_entry)})")
 
+    def bulk_add(self, items: Iterable[tuple[FnHeader, FnDef | BuiltinFnDef]]) -> None:
+        """
+        Add many ``(fn_entry, data)`` function entries at once, with the same checks
+        as ``add``. Entries are grouped by function name before updating the table.
+        """
+
+        groups: dict[Symbol | CompositeSymbol, dict[FnHeader, FnDef | BuiltinFnDef]] = dict()
+
+        for fn_entry, data in items:
+            if not isinstance(data, FnDef | BuiltinFnDef):
+                continue
+
+            if isinstance(fn_entry, FnHeaderDef):
+                fn_entry = FnHeader(fn_name=fn_entry.name, args_types=fn_entry.args_types)
+
+            elif not isinstance(fn_entry, FnHeader):
+                raise ValueError(f"fn_entry is of wrong type ({type(fn_entry)})")
+
+            groups.setdefault(fn_entry.name, dict())[fn_entry] = data
+
+        table = self._table
+
+        for name, fns in groups.items():
+            if name in table:
+                table[name].update(fns)
+
+            else:
+                table[name] = fns
+
     def get(
         self,
         fn_entry: Symbol | CompositeSymbol | FnHeader,
@@ -214,7 +265,7 @@ class FnTable(
         return f"\n    - fns:\n        {content}"
 
 
-class ConstTable(BaseTable[Symbol | CompositeSymbol, DataDef]):
+class ConstTable(BaseTable[Symbol | CompositeSymbol, "DataDef"]):
     """
     This class holds all constants in a module
     """
@@ -230,6 +281,9 @@ class ConstTable(BaseTable[Symbol | CompositeSymbol, DataDef]):
         return self._table
 
     def add(self, item: DataDef) -> None:
+        # imported here, as the data definitions import the code modules
+        from hhat_lang.core.data.var_def import DataDef
+
         if isinstance(item, DataDef) and item.is_constant:
             self._table[item.name] = item
 
@@ -66,6 +66,11 @@ def build_reftable(
     types: Mapping[Symbol | CompositeSymbol, Path] | None = None,
     fns: Mapping[FnHeader, Path] | None = None,
 ) -> RefTable:
+    """
+    Build the reference table of an IR from the types and functions it imports. The
+    table is frozen: references are only added here, and read-only afterward.
+    """
+
     types = types or dict()
     fns = fns or dict()
     ref_table = RefTable()
@@ -76,4 +81,5 @@ def build_reftable(
     for f_name, ir_ref in fns.items():
         ref_table.fns.add_ref(f_name, ir_ref)
 
+    ref_table.freeze()
     return ref_table
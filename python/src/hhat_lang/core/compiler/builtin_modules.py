@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 
 from hhat_lang.core.code.abstract import BaseIR, BaseIRModule
 from hhat_lang.core.code.base import CompositeSymbol, FnHeader, Symbol
@@ -23,12 +23,37 @@ def _get_table(value: Any, st: SymbolTable) -> BaseTable:
     return st.type
 
 
+def _build_builtin_irs(
+    ir_module: Callable[[Path, SymbolTable, ...], BaseIRModule],
+    ir: type[BaseIR],
+    builtin_dict: Mapping[
+        Path, Mapping[Symbol | CompositeSymbol, TypeDef] | Mapping[FnHeader, BuiltinFnDef]
+    ],
+    **kwargs: Any,
+) -> tuple[BaseIR, ...]:
+    irs: list[BaseIR] = []
+
+    for mod_path, mod_objs in builtin_dict.items():
+        st = SymbolTable()
+        table: BaseTable = _get_table(mod_objs, st)
+
+        for name, obj in mod_objs.items():
+            table.add(name, obj)
+
+        # TODO: include any dependencies as ref tables below:
+        ref_table = build_reftable()
+        ir_mod = ir_module(mod_path, st, **kwargs)
+        irs.append(ir(ref_table, ir_mod))
+
+    return tuple(irs)
+
+
 def add_builtin_modules(
     ir_graph: IRGraph,
     ir_module: Callable[[Path, SymbolTable, ...], BaseIRModule],
     ir: type[BaseIR],
-    builtin_dict: dict[
-        Path, dict[Symbol | CompositeSymbol, TypeDef] | dict[FnHeader, BuiltinFnDef]
+    builtin_dict: Mapping[
+        Path, Mapping[Symbol | CompositeSymbol, TypeDef] | Mapping[FnHeader, BuiltinFnDef]
     ],
     **kwargs: Any,
 ) -> None:
@@ -41,18 +66,24 @@ def add_builtin_modules(
         builtin_dict: the dictionary containing the objects to be built (functions or types)
     """
 
-    for mod_path, mod_objs in builtin_dict.items():
-        st = SymbolTable()
-        table: BaseTable = _get_table(mod_objs, st)
+    for ir_obj in _build_builtin_irs(ir_module, ir, builtin_dict, **kwargs):
+        ir_graph.add_node(ir_obj)
 
-        for name, obj in mod_objs.items():
-            table.add(name, obj)
 
-        # TODO: include any dependencies as ref tables below:
-        ref_table = build_reftable()
-        ir_mod = ir_module(mod_path, st, **kwargs)
-        ir_obj = ir(ref_table, ir_mod)
-        ir_graph.add_node(ir_obj)
+_builtin_irs_cache: dict[tuple, tuple[BaseIR, ...]] = dict()
+"""
+Built-in IR objects already generated, keyed by the IR module and IR classes and the
+built-in paths, with their entries names, at the time. Newly included built-in
+functions or types change the key, even on an already known path.
+"""
+
+
+def _builtins_key(
+    builtin_dict: Mapping[
+        Path, Mapping[Symbol | CompositeSymbol, TypeDef] | Mapping[FnHeader, BuiltinFnDef]
+    ],
+) -> tuple[tuple[Path, tuple], ...]:
+    return tuple((path, tuple(objs)) for path, objs in builtin_dict.items())
 
 
 def gen_builtin_modules(
@@ -74,8 +105,21 @@ def gen_builtin_modules(
         **kwargs: extra arguments to be used on the IR object
     """
 
-    add_builtin_modules(ir_graph, ir_module, ir, builtin_fns_path, **kwargs)
-    add_builtin_modules(ir_graph, ir_module, ir, builtin_types, **kwargs)
+    if kwargs:
+        add_builtin_modules(ir_graph, ir_module, ir, builtin_fns_path, **kwargs)
+        add_builtin_modules(ir_graph, ir_module, ir, builtin_types, **kwargs)
+
+    else:
+        key = (ir_module, ir, _builtins_key(builtin_fns_path), _builtins_key(builtin_types))
+
+        if (irs := _builtin_irs_cache.get(key)) is None:
+            irs = _build_builtin_irs(ir_module, ir, builtin_fns_path) + (
+                _build_builtin_irs(ir_module, ir, builtin_types)
+            )
+            _builtin_irs_cache[key] = irs
+
+        for ir_obj in irs:
+            ir_graph.add_node(ir_obj)
 
     if to_build:
         ir_graph.build()
@@ -5,11 +5,13 @@ H-hat core's super-module does not have any syntax or grammar definitions.
 
 from __future__ import annotations
 
+import builtins
 import struct
 import sys
 from enum import Enum, auto
 from functools import reduce
 from typing import Any, Iterable
+from weakref import WeakValueDictionary
 
 from hhat_lang.core.data.utils import has_same_paradigm, isquantum
 from hhat_lang.core.error_handlers.errors import (
@@ -69,12 +71,24 @@ class Symbol:
     _value: str
     _is_quantum: bool
     _hash_value: int
-    __slots__ = ("_value", "_is_quantum", "_hash_value")
+    __slots__ = ("_value", "_is_quantum", "_hash_value", "__weakref__")
 
-    def __init__(self, value: str):
-        self._value = value
-        self._is_quantum = value.startswith("@")
-        self._hash_value = hash(self._value)
+    def __new__(cls, value: str) -> Symbol:
+        # plain symbols are interned: the same names show up many times over a
+        # project (types, functions, imports), so they share one instance; the
+        # subclasses (e.g. ``Tmp``, that can change its name) get a new one each time
+        if cls is Symbol and (symbol := _SYMBOLS.get(value)) is not None:
+            return symbol
+
+        symbol = super().__new__(cls)
+        symbol._value = value
+        symbol._is_quantum = value.startswith("@")
+        symbol._hash_value = hash(value)
+
+        if cls is Symbol:
+            symbol = _SYMBOLS.setdefault(value, symbol)
+
+        return symbol
 
     @property
     def value(self) -> str:
@@ -88,7 +102,11 @@ class Symbol:
         return self._hash_value
 
     def __eq__(self, other: Any) -> bool:
-        return hash(self) == hash(other)
+        return self is other or hash(self) == hash(other)
+
+    def __reduce__(self) -> tuple[type, tuple[str]]:
+        # unpickled plain symbols go through ``__new__``, so they are interned too
+        return self.__class__, (self._value,)
 
     def __bool__(self) -> bool:
         """
@@ -105,6 +123,13 @@ class Symbol:
         return f"{self._value}"
 
 
+_SYMBOLS: WeakValueDictionary[str, Symbol] = WeakValueDictionary()
+"""
+Interned ``Symbol`` instances by their value; see ``Symbol.__new__``. Symbols no
+longer referenced anywhere else are dropped.
+"""
+
+
 class Tmp(Symbol):
     """
     To be used as a temporary symbol only. Especially useful when handling
@@ -117,6 +142,8 @@ class Tmp(Symbol):
     container.
     """
 
+    __slots__ = ()
+
     def append_to_name(self, text: str) -> Tmp:
         self._value += f"({text})"
         return self
@@ -127,8 +154,7 @@ class Alias(Symbol):
     Alias to a type or function name
     """
 
-    def __init__(self, value: str):
-        super().__init__(value)
+    __slots__ = ()
 
 
 class CompositeSymbol:
@@ -148,13 +174,26 @@ class CompositeSymbol:
     _type: CompositeGroup
     _is_quantum: bool
     _hash_value: int
-    __slots__ = ("_value", "_type", "_is_quantum", "_hash_value")
+    __slots__ = ("_value", "_type", "_is_quantum", "_hash_value", "__weakref__")
 
-    def __init__(self, value: tuple[Symbol, ...]):
-        self._value = value
-        self._type = CompositeGroup.SymbolAttrs
-        self._is_quantum = value[0].is_quantum
-        self._hash_value = hash((hash(self._value), hash(self._type), hash(self._is_quantum)))
+    def __new__(cls, value: tuple[Symbol, ...]) -> CompositeSymbol:
+        # made only of plain (interned) symbols, composite symbols are interned too;
+        # see ``Symbol.__new__``
+        key = tuple(k._value for k in value) if all(type(k) is Symbol for k in value) else None
+
+        if key is not None and (symbol := _COMPOSITE_SYMBOLS.get(key)) is not None:
+            return symbol
+
+        symbol = super().__new__(cls)
+        symbol._value = value
+        symbol._type = CompositeGroup.SymbolAttrs
+        symbol._is_quantum = value[0].is_quantum
+        symbol._hash_value = hash((hash(value), hash(symbol._type), hash(symbol._is_quantum)))
+
+        if key is not None:
+            symbol = _COMPOSITE_SYMBOLS.setdefault(key, symbol)
+
+        return symbol
 
     @property
     def value(self) -> tuple[Symbol, ...]:
@@ -169,11 +208,14 @@ class CompositeSymbol:
         return self._is_quantum
 
     def __eq__(self, other: Any) -> bool:
-        return hash(self) == hash(other)
+        return self is other or hash(self) == hash(other)
 
     def __hash__(self) -> int:
         return self._hash_value
 
+    def __reduce__(self) -> tuple[builtins.type, tuple[tuple[Symbol, ...]]]:
+        return self.__class__, (self._value,)
+
     def __iter__(self) -> Iterable:
         return iter(self._value)
 
@@ -181,6 +223,10 @@ class CompositeSymbol:
         return ".".join(str(k) for k in self._value)
 
 
+_COMPOSITE_SYMBOLS: WeakValueDictionary[tuple[str, ...], CompositeSymbol] = WeakValueDictionary()
+"""Interned ``CompositeSymbol`` instances by their symbols values; see ``_SYMBOLS``."""
+
+
 class AsArray:
     """
     A class to resolve the representation of array of symbols, as in ``[u32]``.
@@ -219,19 +265,19 @@ class Atomic(Symbol):
     An atomic data.
     """
 
-    pass
+    __slots__ = ()
 
 
 class Pointer(Symbol):
     """A pointer representation."""
 
-    pass
+    __slots__ = ()
 
 
 class Reference(Symbol):
     """A reference representation"""
 
-    pass
+    __slots__ = ()
 
 
 ###################
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from hhat_lang.core.code.base import FnHeader, BaseIRBlock
 from hhat_lang.core.code.ir_custom import ArgsBlock, ArgsValuesBlock
@@ -11,8 +11,10 @@ from hhat_lang.core.data.core import (
     SimpleObj,
     Symbol,
 )
-from hhat_lang.core.data.var_def import DataDef
-from hhat_lang.core.memory.core import MemoryManager
+
+if TYPE_CHECKING:
+    from hhat_lang.core.data.var_def import DataDef
+    from hhat_lang.core.memory.core import MemoryManager
 
 
 class FnDef:
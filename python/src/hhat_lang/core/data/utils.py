@@ -36,3 +36,5 @@ def has_same_paradigm(data1: Any, data2: Any) -> bool:
 
 class AbstractDataDef(ABC):
     """Abstract data container. To prevent circular imports"""
+
+    __slots__ = ()
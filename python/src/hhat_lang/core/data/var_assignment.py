@@ -14,16 +14,12 @@ from hhat_lang.core.data.var_def import (
     expand_type_as_container,
     type_members_recursive,
 )
-from hhat_lang.core.types import BUILTIN_STD_TYPE_MODULE_PATH, POINTER_SIZE
+from hhat_lang.core.types import POINTER_SIZE
 from hhat_lang.core.types.new_base_type import QSize, Size
-from hhat_lang.core.types.new_builtin_core import builtin_types
+from hhat_lang.core.types.new_builtin_core import I32, Str, builtin_types
 from hhat_lang.core.types.new_core import SingleTypeDef, StructTypeDef
 
-i32 = builtin_types[BUILTIN_STD_TYPE_MODULE_PATH][Symbol("i32")]
-str_t = builtin_types[BUILTIN_STD_TYPE_MODULE_PATH][Symbol("str")]
-qu3 = builtin_types[BUILTIN_STD_TYPE_MODULE_PATH][Symbol("@u3")]
-
-i_t = SingleTypeDef(Symbol("i_t")).add_member(i32).set_sizes(i32.size)
+i_t = SingleTypeDef(Symbol("i_t")).add_member(I32).set_sizes(I32.size)
 qarru3_t = (
     SingleTypeDef(Symbol("@arra-u3_t"))
     .add_member(AsArray(Symbol("@u3")))
@@ -33,28 +29,28 @@ qarru3_t = (
 
 point = (
     StructTypeDef(Symbol("point"), num_members=2)
-    .add_member(Symbol("x"), i32)
-    .add_member(Symbol("y"), i32)
-    .set_sizes(i32.size + i32.size)
+    .add_member(Symbol("x"), I32)
+    .add_member(Symbol("y"), I32)
+    .set_sizes(I32.size + I32.size)
 )
 
 place = (
     StructTypeDef(Symbol("place"), num_members=2)
-    .add_member(Symbol("name"), str_t)
+    .add_member(Symbol("name"), Str)
     .add_member(Symbol("coords"), point)
-    .set_sizes(str_t.size + point.size)
+    .set_sizes(Str.size + point.size)
 )
 
 qdataset = (
     StructTypeDef(Symbol("@dataset"), num_members=2)
-    .add_member(Symbol("tag"), str_t)
+    .add_member(Symbol("tag"), Str)
     .add_member(Symbol("@values"), AsArray(Symbol("@u3")))
     .set_sizes(Size(POINTER_SIZE), QSize(0, None))
 )
 
 qdataframe = (
     StructTypeDef(Symbol("@dataframe"), num_members=2)
-    .add_member(Symbol("name"), str_t)
+    .add_member(Symbol("name"), Str)
     .add_member(Symbol("@data"), AsArray(Symbol("@dataset")))
     .set_sizes(Size(POINTER_SIZE), QSize(0, None))
 )
@@ -76,7 +72,7 @@ if __name__ == "__main__":
     print(point.size)
     print(place)
     print(place.size)
-    print(expand_type_as_container(i32))
+    print(expand_type_as_container(I32))
     print(expand_type_as_container(i_t))
     print(expand_type_as_container(point))
     print(expand_type_as_container(place))
@@ -52,6 +52,7 @@ class DataDef(AbstractDataDef):
     _header: DataHeader
     _data_type: BaseCollection
     _borrowed: DataHeader | None
+    __slots__ = ("_header", "_data_type", "_borrowed")
 
     def __init__(self, *_args: Any, **kwargs: Any):
         self.check_type()
@@ -24,6 +24,24 @@ def sys_exit(*args: Any, error_fn: ErrorHandler) -> NoReturn:
     sys.exit(error_fn.error_code.value)
 
 
+def raise_error(*args: Any, error_fn: ErrorHandler) -> NoReturn:
+    """
+    Raise the ``ErrorHandler`` instance instead of exiting right away. The arguments
+    are kept on the instance so a top-level catcher can later call ``sys_exit`` with
+    them, e.g.::
+
+        except ErrorHandler as err:
+            sys_exit(*err.msg_args, error_fn=err)
+
+    Args:
+        *args: the arguments to be placed when calling `error_fn` instance
+        error_fn: a callable ``ErrorHandler`` instance
+    """
+
+    error_fn.msg_args = args
+    raise error_fn
+
+
 class ErrorCodes(Enum):
     """
     Enum listing all possible error codes for the H-hat language system.
@@ -149,6 +167,7 @@ class ErrorCodes(Enum):
 
 class ErrorHandler(BaseException, ABC):
     err_code: ErrorCodes
+    msg_args: tuple = ()
 
     def __init__(self, *_args: Any, **_kwargs: Any):
         pass
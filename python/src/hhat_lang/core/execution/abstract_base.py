@@ -21,6 +21,7 @@ class BaseIRManager(ABC):
     """
 
     _graph: IRGraph
+    __slots__ = ("_graph",)
 
     @property
     def ir_graph(self) -> IRGraph:
@@ -125,6 +126,7 @@ class BaseExecutor(ABC):
 
     _cexec: BaseClassicalEvaluator
     _qexec: BaseQuantumEvaluator
+    __slots__ = ("_cexec", "_qexec")
 
     @property
     def cexec(self) -> BaseClassicalEvaluator:
@@ -176,6 +178,10 @@ class BaseExecutor(ABC):
 class BaseClassicalEvaluator(ABC):
     """Base evaluator for overall classical instructions"""
 
+    __slots__ = ()
+
 
 class BaseQuantumEvaluator(ABC):
     """Base evaluator for quantum programs"""
+
+    __slots__ = ()
@@ -21,6 +21,7 @@ class BaseQuantumProgram(ABC):
     _mem: MemoryManager
     _node: IRNode
     _ir_graph: IRGraph
+    __slots__ = ("_qdata", "_executor", "_qlang", "_mem", "_node", "_ir_graph")
 
     @abstractmethod
     def run(self, *args: Any, **kwargs: Any) -> Any | ErrorHandler:
@@ -42,6 +43,8 @@ class QuantumProgram(BaseQuantumProgram):
     they must be present on target backend, otherwise an error must be raised.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         qdata: DataDef | Literal,
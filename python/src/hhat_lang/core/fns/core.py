@@ -2,14 +2,16 @@ from __future__ import annotations
 
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from hhat_lang.core.code.base import FnHeader, FnHeaderDef
 from hhat_lang.core.code.ir_custom import ArgsValuesBlock
 from hhat_lang.core.data.core import Literal
 from hhat_lang.core.data.fn_def import BuiltinFnDef
-from hhat_lang.core.data.var_def import DataDef
-from hhat_lang.core.memory.core import MemoryManager
+
+if TYPE_CHECKING:
+    from hhat_lang.core.data.var_def import DataDef
+    from hhat_lang.core.memory.core import MemoryManager
 
 builtin_fns_path: dict[
     Path,
@@ -105,6 +105,12 @@ class BaseImporter(ABC):
 
         return Path().joinpath(self._base, *path[:-1], str(path[-1]) + ".hat")
 
+    def module_path(self, name: CompositeSymbol) -> Path:
+        """The path of the module an imported ``name`` is retrieved from."""
+
+        dir_name, file_name, _ = self._path_parts(name)
+        return self._get_module_path(*dir_name, file_name)
+
     def _add_module(self, module_path: Path, ir_graph: IRGraph) -> None:
         """To add a new IR module to the graph based on the ``module_path``"""
         raw_code: str = module_path.read_text()
@@ -244,12 +250,12 @@ class FnImporter(BaseImporter):
         names: Iterable[CompositeSymbol],
         ir_graph: IRGraph,
     ) -> dict[FnHeader, Path]:
-        res: tuple | tuple[tuple[FnHeader, Path]] = ()
+        res: dict[FnHeader, Path] = dict()
 
         for name in names:
-            res += self._retrieve_fn_reference(name, ir_graph)
+            res.update(self._retrieve_fn_reference(name, ir_graph))
 
-        return dict(res)
+        return res
 
 
 class ModifierImporter(BaseImporter):
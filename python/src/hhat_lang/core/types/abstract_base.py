@@ -11,6 +11,7 @@ class Size:
     """Size in bits"""
 
     _size: int
+    __slots__ = ("_size",)
 
     def __init__(self, size: int):
         self._size = size
@@ -31,6 +32,7 @@ class QSize:
 
     _min: int
     _max: int | None
+    __slots__ = ("_min", "_max")
 
     def __init__(self, min_num: int, max_num: int | None = None):
         self._min = min_num
@@ -80,7 +82,17 @@ class BaseTypeDef(AbstractTypeDef, Generic[T, M]):
     _size: Size
     _qsize: QSize
     _is_array: bool
-    _is_size_set: bool = False
+    _is_size_set: bool
+    # ``_type`` and ``_is_builtin`` are class attributes on the concrete types
+    __slots__ = (
+        "_name",
+        "_container",
+        "_is_quantum",
+        "_size",
+        "_qsize",
+        "_is_array",
+        "_is_size_set",
+    )
 
     @property
     def name(self) -> Symbol:
@@ -88,7 +100,7 @@ class BaseTypeDef(AbstractTypeDef, Generic[T, M]):
 
     @property
     def type(self) -> BaseTypeEnum:
-        return self._t_type
+        return self._type
 
     @property
     def is_quantum(self) -> bool:
@@ -123,7 +135,8 @@ class BaseTypeDef(AbstractTypeDef, Generic[T, M]):
         return self
 
     def is_size_set(self) -> bool:
-        return self._is_size_set
+        # only set once ``set_sizes`` is called
+        return getattr(self, "_is_size_set", False)
 
     def __contains__(self, item: Any) -> bool:
         return item in self._container
@@ -148,6 +161,7 @@ class BaseTypeDataBin(ABC, Generic[T, C, M]):
     """
 
     _container: C
+    __slots__ = ()
 
     @property
     def container(self) -> C:
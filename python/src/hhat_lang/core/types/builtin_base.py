@@ -53,6 +53,7 @@ class BuiltinSingleTypeDef(BaseTypeDef[SingleT, None]):
     _container: SingleDataBin
     _type = BaseTypeEnum.SINGLE
     _is_builtin = True
+    __slots__ = ()
 
     def __init__(self, name: Symbol, size: Size, qsize: QSize | None = None):
         self._name = name
@@ -79,6 +80,7 @@ class BuiltinStructTypeDef(BaseTypeDef[StructT, StructM]):
     _container: StructDataBin
     _type = BaseTypeEnum.STRUCT
     _is_builtin = True
+    __slots__ = ()
 
     def __init__(self, name: Symbol, size: Size, qsize: QSize | None = None):
         self._name = name
@@ -104,6 +106,8 @@ class BuiltinStructTypeDef(BaseTypeDef[StructT, StructM]):
 
 
 class BuiltinEnumTypeDef(BaseTypeDef[EnumT, EnumM]):
+    __slots__ = ()
+
     def add_member(
         self, type_name: T | None, member_name: M | None, **kwargs: Any
     ) -> BaseTypeDef:
@@ -19,6 +19,7 @@ from hhat_lang.core.error_handlers.errors import (
     TypeQuantumOnClassicalError,
     TypeInvalidMemberError,
     TypeInvalidIndexOnContentError,
+    TypeAndMemberNoMatchError,
 )
 from hhat_lang.core.types.abstract_base import BaseTypeDataBin, BaseTypeDef, M
 from hhat_lang.core.types.utils import BaseTypeEnum
@@ -53,6 +54,7 @@ SingleM = NoneType
 class SingleDataBin(BaseTypeDataBin[SingleT, SingleC, SingleM]):
     _container: SingleC
     _locked: bool
+    __slots__ = ("_container", "_locked")
 
     def __init__(self):
         self._container = ()
@@ -78,6 +80,7 @@ class SingleDataBin(BaseTypeDataBin[SingleT, SingleC, SingleM]):
 class SingleTypeDef(BaseTypeDef[SingleT, None]):
     _container: SingleDataBin
     _type = BaseTypeEnum.SINGLE
+    __slots__ = ()
 
     def __init__(self, name: Symbol):
         self._name = name
@@ -89,7 +92,7 @@ class SingleTypeDef(BaseTypeDef[SingleT, None]):
 
             match res := self._container.add_member(type_name=type_name):
                 case TypeMemberOverflowError():
-                    sys.exit(res(self._name, self._t_type))
+                    sys.exit(res(self._name, self._type))
 
                 case _:
                     return self
@@ -118,16 +121,21 @@ StructM = Symbol
 class StructDataBin(BaseTypeDataBin[StructT, StructC, StructM]):
     _container: StructC
     _num_members: int
+    _members: list[StructM]
+    __slots__ = ("_container", "_num_members", "_members")
 
     def __init__(self):
         self._container = HatOrderedDict()
         self._num_members = 0
+        # members names in order, for positional access
+        self._members = []
 
     def add_member(
         self, type_name: StructT, member_name: StructM, **kwargs: Any
     ) -> BaseTypeDataBin | ErrorHandler:
         if member_name not in self._container:
             self._container[member_name] = type_name
+            self._members.append(member_name)
             self._num_members += 1
             return self
 
@@ -135,7 +143,8 @@ class StructDataBin(BaseTypeDataBin[StructT, StructC, StructM]):
 
     def __getitem__(self, item: int | Symbol) -> StructT | tuple[StructM, StructT]:
         if isinstance(item, int):
-            return tuple(self._container.items())[item]
+            member = self._members[item]
+            return member, self._container[member]
 
         return self._container[item]
 
@@ -147,6 +156,7 @@ class StructTypeDef(BaseTypeDef[StructT, StructM]):
     _num_members: int
     _container: StructDataBin
     _type = BaseTypeEnum.STRUCT
+    __slots__ = ("_num_members",)
 
     def __init__(self, name: Symbol, num_members: int):
         self._name = name
@@ -157,6 +167,15 @@ class StructTypeDef(BaseTypeDef[StructT, StructM]):
     def add_member(
         self, type_name: StructT, member_name: StructM, **kwargs: Any
     ) -> StructTypeDef:
+        # paradigm flags are cached on the symbols and on the struct itself,
+        # so both checks are plain bool comparisons
+        type_q = type_name.is_quantum
+        if type_q != member_name.is_quantum:
+            sys_exit(error_fn=TypeAndMemberNoMatchError(type_name, member_name))
+
+        if type_q and not self._is_quantum:
+            sys_exit(error_fn=TypeQuantumOnClassicalError(type_name, self._name))
+
         if self._num_members > 0:
             match res := self._container.add_member(
                 type_name=type_name, member_name=member_name
@@ -168,7 +187,7 @@ class StructTypeDef(BaseTypeDef[StructT, StructM]):
                     self._num_members -= 1
                     return self
 
-        sys.exit(TypeMemberOverflowError()(self._name, self._t_type))
+        sys.exit(TypeMemberOverflowError()(self._name, self._type))
 
     def __getitem__(self, item: int | Symbol) -> StructT | tuple[StructM, StructT]:
         return self._container[item]
@@ -193,10 +212,14 @@ EnumM = Symbol | StructTypeDef
 class EnumDataBin(BaseTypeDataBin[EnumT, EnumC, EnumM]):
     _container: EnumC
     _counter: int
+    _members: list[Symbol]
+    __slots__ = ("_container", "_counter", "_members")
 
     def __init__(self, num_members: int):
-        self._data = HatOrderedDict()
+        self._container = HatOrderedDict()
         self._counter = 1 if num_members else 0
+        # members keys in order, for positional access
+        self._members = []
 
     def add_member(
         self, member_name: EnumM | None, **kwargs: Any
@@ -208,9 +231,11 @@ class EnumDataBin(BaseTypeDataBin[EnumT, EnumC, EnumM]):
                     self._container[member_name] = Literal(
                         str(self._counter), lit_type=Symbol("int")
                     )
+                    self._members.append(member_name)
 
                 case StructTypeDef():
                     self._container[member_name.name] = member_name
+                    self._members.append(member_name.name)
 
                 case _:
                     return TypeInvalidMemberError()
@@ -225,7 +250,7 @@ class EnumDataBin(BaseTypeDataBin[EnumT, EnumC, EnumM]):
                 return self._container[item]
 
             case int():
-                return tuple(self._container.values())[item]
+                return self._container[self._members[item]]
 
             case _:
                 sys_exit(
@@ -242,6 +267,7 @@ class EnumTypeDef(BaseTypeDef[EnumT, StructM]):
     _num_members: int
     _container: EnumDataBin
     _type = BaseTypeEnum.ENUM
+    __slots__ = ("_num_members",)
 
     def __init__(self, name: Symbol, num_members: int):
         self._name = name
@@ -265,7 +291,7 @@ class EnumTypeDef(BaseTypeDef[EnumT, StructM]):
                     self._num_members -= 1
                     return self
 
-        sys_exit(self._name, self._t_type, error_fn=TypeMemberOverflowError())
+        sys_exit(self._name, self._type, error_fn=TypeMemberOverflowError())
 
     def __getitem__(self, item: int | Symbol) -> EnumT:
         return self._container[item]
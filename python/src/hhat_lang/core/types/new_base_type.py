@@ -102,6 +102,11 @@ class TypeDef(AbstractTypeDef, ABC, Generic[K, V]):
         return self._hash_value
 
     def __eq__(self, other: Any) -> bool:
+        # the same type object is compared far more often than two equal
+        # copies; the identity check also skips types with no hash set yet
+        if self is other:
+            return True
+
         if isinstance(other, self.__class__):
             return hash(self) == hash(other)
 
@@ -157,4 +162,4 @@ class TypeMembers(ABC, Generic[K, V]):
         return self._hash_value
 
     def __eq__(self, other: Any) -> bool:
-        return hash(self) == hash(other)
+        return self is other or hash(self) == hash(other)
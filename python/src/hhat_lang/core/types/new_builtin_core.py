@@ -142,3 +142,20 @@ def builtin_qu4_t():
     _t = CoreTypeDef(Symbol("@u4"))
     _t.set_sizes(Size(getsizeof(_t)), QSize(4, 4))
     return _t
+
+
+# the standard built-in types bound by name, so callers skip the path and symbol lookups
+_std_types = builtin_types[BUILTIN_STD_TYPE_MODULE_PATH]
+
+Bool = _std_types[Symbol("bool")]
+U32 = _std_types[Symbol("u32")]
+I32 = _std_types[Symbol("i32")]
+F32 = _std_types[Symbol("f32")]
+U64 = _std_types[Symbol("u64")]
+I64 = _std_types[Symbol("i64")]
+F64 = _std_types[Symbol("f64")]
+Str = _std_types[Symbol("str")]
+QBool = _std_types[Symbol("@bool")]
+QU2 = _std_types[Symbol("@u2")]
+QU3 = _std_types[Symbol("@u3")]
+QU4 = _std_types[Symbol("@u4")]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class BaseTypeEnum(Enum):
-    """Enum data type structures for types definitions instances"""
+class BaseTypeEnum(IntEnum):
+    """
+    Enum data type structures for types definitions instances.
+
+    An ``IntEnum``, so type-kind comparisons are plain ``int`` comparisons.
+    """
 
     CORE = auto()
     """the core types, such as bool, integers and floats types, string"""
@@ -25,6 +29,7 @@ class AbstractTypeDef(ABC):
     """Abstract data type structure. To avoid circular imports."""
 
     _type: BaseTypeEnum
+    __slots__ = ()
 
     @property
     def type(self) -> BaseTypeEnum:
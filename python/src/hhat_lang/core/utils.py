@@ -63,15 +63,16 @@ Keys = KeyObj | KeyObjType
 
 class HatOrderedDict(Mapping, Generic[Key, Value]):
     """
-    A special OrderedDict that accepts Symbol as keys but transforms them
+    A special ordered dict that accepts Symbol as keys but transforms them
     as str to unpack the class. Useful for building data structures such
-    as ``SingleTypeDef``, ``StructTypeDef``, etc.
+    as ``SingleTypeDef``, ``StructTypeDef``, etc. Items are kept in insertion
+    order by a plain ``dict``.
     """
 
-    _data: OrderedDict[Key, Value]
+    _data: dict[Key, Value]
 
     def __init__(self, data: dict | OrderedDict | None = None):
-        self._data = OrderedDict() if data is None else OrderedDict(data)
+        self._data = dict() if data is None else dict(data)
 
     def __setitem__(self, key: Key, value: Value) -> None:
         if isinstance(key, Keys):
@@ -105,7 +106,8 @@ class HatOrderedDict(Mapping, Generic[Key, Value]):
         return iter(self._data)
 
     def __repr__(self) -> str:
-        return str(self._data)
+        # keep the ``OrderedDict(...)`` representation of the original container
+        return repr(OrderedDict(self._data))
 
 
 class Result(ABC):
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from hhat_lang.core.data.core import SimpleObj, ObjArray, Symbol
+from hhat_lang.core.data.core import Symbol
 
 
 def builtin_fn__match(*option_body: Any, match_arg: Any) -> Symbol:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from functools import reduce
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from hhat_lang.core.code.base import FnHeaderDef
 from hhat_lang.core.data.core import (
@@ -11,11 +11,13 @@ from hhat_lang.core.data.core import (
 )
 from hhat_lang.core.error_handlers.errors import FunctionExecutionError
 from hhat_lang.core.fns.core import include_builtin_fn
-from hhat_lang.core.memory.core import MemoryManager
 from hhat_lang.dialects.heather.code.builtins.fns.math.arithmetic import (
     ARITHMETIC_MODULE_PATH,
 )
 
+if TYPE_CHECKING:
+    from hhat_lang.core.memory.core import MemoryManager
+
 ####################
 # ADDITION SECTION #
 ####################
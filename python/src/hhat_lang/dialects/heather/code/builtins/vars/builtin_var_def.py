@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import sys
+from functools import cache
 from typing import Any, Iterable
 
 from hhat_lang.core.code.ir_block import IRBlock, IRInstr
-from hhat_lang.core.data.core import Literal, LiteralArray, Symbol, has_same_type
-from hhat_lang.core.data.utils import DataKind, has_same_paradigm
+from hhat_lang.core.data.core import Literal, LiteralArray, Symbol
+from hhat_lang.core.data.utils import DataKind
 from hhat_lang.core.data.var_def import DataDef
 from hhat_lang.core.data.var_utils import (
     DataHeader,
@@ -17,11 +17,25 @@ from hhat_lang.core.error_handlers.errors import (
     ImmutableDataReassignmentError,
     InvalidContentDataError,
     LazySequenceConsumedError,
-    sys_exit,
+    raise_error,
 )
 from hhat_lang.core.types.abstract_base import BaseTypeDef
 
 ContentType = IRBlock | IRInstr | Literal | LiteralArray
+_CONTENT_TYPES = (IRBlock, IRInstr, Literal, LiteralArray)
+
+
+@cache
+def _kwarg_member(name: str) -> Symbol:
+    """
+    Member symbol for an ``assign`` keyword argument. Quantum members cannot be
+    python identifiers, so ``q__d`` stands for ``@d``. Resolved once per name.
+    """
+
+    if name.startswith("q__"):
+        return Symbol("@" + name[3:])
+
+    return Symbol(name)
 
 
 class Constant(DataDef):
@@ -31,6 +45,8 @@ class Constant(DataDef):
     Constants are importable, global reaching pieces of immutable data.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: Symbol, data_type: BaseTypeDef, counter: int):
         super().__init__()
         self._header = DataHeader(
@@ -56,6 +72,8 @@ class Constant(DataDef):
 class Immutable(DataDef):
     """Immutable data container class. To be used for immutable variables."""
 
+    __slots__ = ()
+
     def __init__(self, name: Symbol, data_type: BaseTypeDef, counter: int):
         super().__init__()
         self._header = DataHeader(
@@ -67,40 +85,35 @@ class Immutable(DataDef):
         super().__init__()
 
     def assign(self, *args: ContentType, **kwargs: Any) -> Immutable:
+        insert = self._data_type.insert
+        get_member = self.get_type_member
+
         for n, k in enumerate(args):
-            if isinstance(k, ContentType):
-                match res := self._data_type.insert(
-                    member=self.get_type_member(n), data=k
-                ):
-                    case ImmutableDataReassignmentError():
-                        sys_exit(self.name, error_fn=res)
+            if not isinstance(k, _CONTENT_TYPES):
+                raise_error(k, error_fn=ContainerVarError(self.name))
 
-                    case InvalidContentDataError():
-                        sys_exit(self.name, k, error_fn=res)
+            if (res := insert(member=get_member(n), data=k)) is None:
+                continue
 
-                    case LazySequenceConsumedError():
-                        sys_exit(self.name, error_fn=res)
+            match res:
+                case ImmutableDataReassignmentError():
+                    raise_error(self.name, error_fn=res)
 
-                    case ErrorHandler():
-                        sys_exit(error_fn=res)
+                case InvalidContentDataError():
+                    raise_error(self.name, k, error_fn=res)
 
-                    case _:
-                        continue
+                case LazySequenceConsumedError():
+                    raise_error(self.name, error_fn=res)
 
-            else:
-                sys_exit(error_fn=ContainerVarError(self.name))
+                case ErrorHandler():
+                    raise_error(error_fn=res)
 
         for k, v in kwargs.items():
-            if isinstance(v, ContentType):
-                match res := self._data_type.insert(member=Symbol(k), data=v):
-                    case ErrorHandler():
-                        sys_exit(error_fn=res)
+            if not isinstance(v, _CONTENT_TYPES):
+                raise_error(v, error_fn=ContainerVarError(self.name))
 
-                    case _:
-                        continue
-
-            else:
-                sys_exit(error_fn=ContainerVarError(self.name))
+            if isinstance(res := insert(member=_kwarg_member(k), data=v), ErrorHandler):
+                raise_error(error_fn=res)
 
         return self
 
@@ -123,6 +136,8 @@ class Mutable(DataDef):
     information.)
     """
 
+    __slots__ = ()
+
     def __init__(self, name: Symbol, data_type: BaseTypeDef, counter: int):
         super().__init__()
         self._header = DataHeader(
@@ -153,6 +168,8 @@ class Appendable(DataDef):
     information about lazy sequence.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: Symbol, data_type: BaseTypeDef, counter: int):
         super().__init__()
         self._header = DataHeader(
@@ -164,48 +181,44 @@ class Appendable(DataDef):
         super().__init__()
 
     def assign(self, *args: ContentType, **kwargs: Any) -> Appendable:
-        print(f"assign {args=} | {kwargs=}")
+        # appending happens in tight loops (quantum instructions), so the
+        # bound methods are fetched once and the error dispatch only runs
+        # when ``insert`` does not succeed
+        insert = self._data_type.insert
+        get_member = self.get_type_member
+
         for n, k in enumerate(args):
-            if isinstance(k, ContentType):
-                match res := self._data_type.insert(
-                    member=self.get_type_member(n), data=k
-                ):
-                    case ImmutableDataReassignmentError():
-                        sys.exit(res(self.name))
+            if not isinstance(k, _CONTENT_TYPES):
+                raise_error(k, error_fn=ContainerVarError(self.name))
 
-                    case InvalidContentDataError():
-                        sys.exit(res(self.name, k))
+            if (res := insert(member=get_member(n), data=k)) is None:
+                continue
 
-                    case LazySequenceConsumedError():
-                        sys.exit(res(self.name))
+            match res:
+                case ImmutableDataReassignmentError():
+                    raise_error(self.name, error_fn=res)
 
-                    case ErrorHandler():
-                        sys.exit(res())
+                case InvalidContentDataError():
+                    raise_error(self.name, k, error_fn=res)
 
-                    case _:
-                        continue
+                case LazySequenceConsumedError():
+                    raise_error(self.name, error_fn=res)
 
-            else:
-                sys.exit(ContainerVarError(self.name)())
+                case ErrorHandler():
+                    raise_error(error_fn=res)
 
         for k, v in kwargs.items():
-            if isinstance(v, ContentType):
-                match res := self._data_type.insert(Symbol(k), v):
-                    case ErrorHandler():
-                        sys_exit(error_fn=res)
-
-                    case _:
-                        continue
+            if not isinstance(v, _CONTENT_TYPES):
+                raise_error(v, error_fn=ContainerVarError(self.name))
 
-            else:
-                sys_exit(error_fn=ContainerVarError(self.name))
+            if isinstance(res := insert(_kwarg_member(k), v), ErrorHandler):
+                raise_error(error_fn=res)
 
         return self
 
     def get(
         self, member: Symbol | BaseTypeDef | None = None, **_kwargs: Any
     ) -> ContentType:
-        print(f"{self._data_type._data=}")
         return self._data_type.get(member)
 
     def borrow_to(self):
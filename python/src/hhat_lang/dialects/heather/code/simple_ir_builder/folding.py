@@ -0,0 +1,243 @@
+"""
+Build-time constant folding for the IR main body. Calls to pure built-in functions
+with only classical literals as arguments are computed once, when the IR is built,
+and replaced by their resulting literal, so the executor never runs them.
+
+Classical variables assigned only once in the whole body, with a literal of their
+declared type, are propagated to the calls using them after that assignment.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterable, cast
+
+from hhat_lang.core.code.base import BaseIRInstr, FnHeader
+from hhat_lang.core.code.ir_block import IRBlock, IRFlag
+from hhat_lang.core.code.ir_custom import (
+    ArgsBlock,
+    ArgsValuesBlock,
+    BodyBlock,
+    ModifierBlock,
+    ReturnBlock,
+)
+from hhat_lang.core.data.core import CompositeSymbol, Literal, Symbol
+from hhat_lang.core.data.fn_def import BuiltinFnDef
+from hhat_lang.core.data.utils import isquantum
+from hhat_lang.core.fns.core import builtin_fns_path
+from hhat_lang.dialects.heather.code.builtins.fns.math.arithmetic import (
+    ARITHMETIC_MODULE_PATH,
+)
+from hhat_lang.dialects.heather.code.builtins.fns.math.arithmetic import (
+    fn_def as _arithmetic_fns,  # registers the arithmetic functions on builtin_fns_path
+)
+from hhat_lang.dialects.heather.code.simple_ir_builder.ir import (
+    AssignInstr,
+    CallInstr,
+    CastInstr,
+    DeclareAssignInstr,
+    DeclareInstr,
+)
+
+PURE_FNS_PATHS: tuple[Path, ...] = (ARITHMETIC_MODULE_PATH,)
+"""
+Built-in modules whose functions have no side effects and depend only on their
+arguments, so they can be folded.
+"""
+
+
+def _pure_fns() -> dict[FnHeader, BuiltinFnDef]:
+    fns: dict[FnHeader, BuiltinFnDef] = dict()
+
+    for path in PURE_FNS_PATHS:
+        fns.update(builtin_fns_path.get(path, dict()))
+
+    return fns
+
+
+def _var_symbol(var: Symbol | CompositeSymbol | ModifierBlock) -> Symbol | CompositeSymbol:
+    # a variable with a modifier holds the variable itself as the modifier object
+    return cast(Symbol | CompositeSymbol, var.obj) if isinstance(var, ModifierBlock) else var
+
+
+def _count_assigns(obj: Any, counts: dict[Symbol | CompositeSymbol, int]) -> None:
+    """Count the assignments of each variable, on any depth of ``obj``."""
+
+    items: Iterable
+    match obj:
+        case AssignInstr() | DeclareAssignInstr():
+            var = _var_symbol(obj._var)
+            counts[var] = counts.get(var, 0) + 1
+            items = obj.args
+
+        case ArgsValuesBlock():
+            items = obj.values
+
+        case IRBlock() | BaseIRInstr():
+            items = obj.args
+
+        case tuple():
+            items = obj
+
+        case _:
+            return
+
+    for k in items:
+        _count_assigns(k, counts)
+
+
+class _Folder:
+    _pure: dict[FnHeader, BuiltinFnDef]
+    _counts: dict[Symbol | CompositeSymbol, int]
+    _types: dict[Symbol | CompositeSymbol, Symbol | CompositeSymbol | ModifierBlock]
+    _known: dict[Symbol, Literal]
+    __slots__ = ("_pure", "_counts", "_types", "_known")
+
+    def __init__(self, pure: dict[FnHeader, BuiltinFnDef], body: BodyBlock):
+        self._pure = pure
+        self._counts = dict()
+        self._types = dict()
+        self._known = dict()
+        _count_assigns(body, self._counts)
+
+    def _track(
+        self,
+        var: Symbol | CompositeSymbol,
+        var_type: Symbol | CompositeSymbol | Any,
+        value: Any,
+    ) -> None:
+        if (
+            isinstance(var, Symbol)
+            and not isquantum(var)
+            and self._counts.get(var) == 1
+            and isinstance(value, Literal)
+            and not value.is_quantum
+            and value.type == var_type
+        ):
+            self._known[var] = value
+
+    def body(self, block: BodyBlock) -> BodyBlock:
+        new_args: tuple[Any, ...] = ()
+
+        for k in block:
+            match k:
+                case DeclareInstr():
+                    self._types[_var_symbol(k._var)] = k._var_type
+
+                case AssignInstr():
+                    var = _var_symbol(k._var)
+
+                    if (value := self.expr(k._value)) is not k._value:
+                        k = AssignInstr(k._var, value)
+
+                    self._track(var, self._types.get(var), value)
+
+                case DeclareAssignInstr():
+                    var = _var_symbol(k._var)
+
+                    if (value := self.expr(k._value)) is not k._value:
+                        k = DeclareAssignInstr(k._var, k._var_type, value)
+
+                    self._types[var] = k._var_type
+                    self._track(var, k._var_type, value)
+
+                case CallInstr():
+                    k = self.expr(k)
+
+                    # a folded call used as a statement has nothing left to do
+                    if isinstance(k, Literal):
+                        continue
+
+                case CastInstr():
+                    k = self.expr(k)
+
+                case ReturnBlock():
+                    values = tuple(self.expr(v) for v in k)
+
+                    if any(p is not q for p, q in zip(values, k)):
+                        k = ReturnBlock(*values)
+
+            new_args += (k,)
+
+        if len(new_args) == len(block) and all(p is q for p, q in zip(new_args, block)):
+            return block
+
+        return BodyBlock(*new_args)
+
+    def expr(self, obj: Any) -> Any:
+        match obj:
+            case Symbol():
+                return self._known.get(obj, obj)
+
+            case CastInstr():
+                if (data := self.expr(obj._data)) is not obj._data:
+                    return CastInstr(data, obj._to_type)
+
+            case CallInstr() if obj.name == IRFlag.FN_CALL:
+                return self._call(obj)
+
+        return obj
+
+    def _call(self, obj: CallInstr) -> Any:
+        args = obj.args[1]
+
+        if isinstance(args, ArgsBlock):
+            values = tuple(self.expr(k) for k in args)
+            changed = any(p is not q for p, q in zip(values, args))
+            new_args = ArgsBlock(*values) if changed else args
+
+        elif isinstance(args, Literal | Symbol):
+            values = (self.expr(args),)
+            new_args = values[0]
+
+        else:
+            return obj
+
+        if isinstance(caller := obj._caller, Symbol) and all(
+            isinstance(k, Literal) and not k.is_quantum for k in values
+        ):
+            fn_header = FnHeader(fn_name=caller, args_types=tuple(k.type for k in values))
+
+            if (fn_def := self._pure.get(fn_header)) is not None:
+                try:
+                    # pure built-in functions do not use the memory
+                    return fn_def(*values, mem=None)  # type: ignore [arg-type]
+
+                except (ValueError, ArithmeticError):
+                    # leave it to fail on execution, with the proper error handling
+                    pass
+
+        if new_args is args:
+            return obj
+
+        return CallInstr(caller, args=new_args)
+
+
+def fold_constants(
+    body: BodyBlock | None,
+    shadowed: Iterable[FnHeader] = (),
+) -> BodyBlock | None:
+    """
+    Fold the pure built-in function calls with classical literal arguments in ``body``.
+
+    Args:
+        body: the main ``BodyBlock`` or ``None``
+        shadowed: headers of the functions defined or imported by the module; calls to
+            them do not refer to the built-in ones and are never folded
+
+    Returns:
+        The folded ``BodyBlock``, or ``body`` itself if nothing could be folded
+    """
+
+    if body is None:
+        return None
+
+    pure = _pure_fns()
+
+    for fn_header in shadowed:
+        pure.pop(fn_header, None)
+
+    if not pure:
+        return body
+
+    return _Folder(pure, body).body(body)
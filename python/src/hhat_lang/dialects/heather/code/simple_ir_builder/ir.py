@@ -2,13 +2,10 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from typing import Any, cast, Callable
+from typing import Any, Callable
 
 from hhat_lang.core.code.abstract import BaseIR, BaseIRModule, IRHash, RefTable
-from hhat_lang.core.code.base import (
-    FnHeader,
-    BaseIRInstr,
-)
+from hhat_lang.core.code.base import BaseIRInstr
 from hhat_lang.core.code.ir_block import (
     IRFlag,
     IRBlock,
@@ -17,40 +14,55 @@ from hhat_lang.core.code.ir_block import (
 from hhat_lang.core.code.ir_custom import (
     ArgsValuesBlock,
     BodyBlock,
-    ReturnBlock,
     ModifierBlock,
     ArgsBlock,
     OptionBlock,
 )
-from hhat_lang.core.code.ir_graph import (
-    IRGraph,
-    IRNode,
-)
-from hhat_lang.core.code.tools import (
-    get_type,
-    get_fn,
-)
 from hhat_lang.core.code.symbol_table import SymbolTable
 from hhat_lang.core.data.core import (
-    LiteralArray,
     CompositeSymbol,
     ObjArray,
-    Literal,
     Symbol,
     SimpleObj,
 )
-from hhat_lang.core.data.fn_def import FnDef
-from hhat_lang.core.data.utils import DataKind
-from hhat_lang.core.error_handlers.errors import HeapInvalidKeyError
-from hhat_lang.core.memory.core import MemoryManager
-from hhat_lang.core.types.abstract_base import BaseTypeDef
-from hhat_lang.core.types.builtin_conversion import compatible_types
-from hhat_lang.core.types.builtin_types import builtins_types
-from hhat_lang.dialects.heather.cast.base import CastQ2C, CastC2C, CastC2Q, CastQ2Q
-from hhat_lang.core.data.var_def import DataDef
 
 # from hhat_lang.dialects.heather.code.builtins.fns import BUILTIN_FN_DICT
 
+# IR flags bound once at module level, so instructions instantiation does not
+# need to look them up on the enum class every time
+_F_CAST = IRFlag.CAST
+_F_DECLARE = IRFlag.DECLARE
+_F_ASSIGN = IRFlag.ASSIGN
+_F_DECLARE_ASSIGN = IRFlag.DECLARE_ASSIGN
+_F_FN_CALL = IRFlag.FN_CALL
+_F_OPTN_CALL = IRFlag.OPTN_CALL
+_F_BDN_CALL = IRFlag.BDN_CALL
+_F_OPTBDN_CALL = IRFlag.OPTBDN_CALL
+
+# precomputed type tuples for the instructions' arguments validation; avoids
+# building a new union type object on every instruction instantiation
+_VAR_TYPES = (Symbol, ModifierBlock)
+_VAR_TYPE_TYPES = (Symbol, CompositeSymbol, ModifierBlock)
+_VALUE_TYPES = (SimpleObj, ObjArray, IRBlock)
+_VALUE_EXT_TYPES = (SimpleObj, ObjArray, BaseIRInstr, IRBlock)
+_CAST_DATA_TYPES = (SimpleObj, ObjArray, ModifierBlock, BaseIRInstr)
+
+_CALL_DISPATCH: tuple[tuple[IRFlag, Callable[..., tuple]] | None, ...] = (
+    None,
+    (_F_FN_CALL, lambda args, option, body: (args,)),
+    (_F_OPTN_CALL, lambda args, option, body: (option,)),
+    (_F_OPTBDN_CALL, lambda args, option, body: (args, option)),
+    (_F_BDN_CALL, lambda args, option, body: (args, body)),
+    (_F_BDN_CALL, lambda args, option, body: (args, body)),
+    None,
+    None,
+)
+"""
+``CallInstr`` flag and arguments builder indexed by the mask of given call
+arguments: bit 0 for ``args``, bit 1 for ``option`` and bit 2 for ``body``.
+Invalid combinations (no content at all, or option and body together) are ``None``.
+"""
+
 
 ###########################
 # IR INSTRUCTIONS CLASSES #
@@ -58,18 +70,27 @@ from hhat_lang.core.data.var_def import DataDef
 
 
 class BuiltinInstr(BaseIRInstr):
+    _builtin_name: Symbol
+    _builtin_args: tuple[Any, ...] | tuple
+    _repr_cache: str | None
+    __slots__ = ("_builtin_name", "_builtin_args", "_repr_cache")
+
     def __init__(self, *args: Any, name: Symbol, flag: IRFlag):
-        self.args = (name, args)
+        # flat layout: name followed by the arguments, kept for generic traversal
+        self.args = (name, *args)
+        self._builtin_name = name
+        self._builtin_args = args
         self._name = flag
+        self._repr_cache = None
         super().__init__()
 
     @property
     def builtin_name(self) -> Symbol:
-        return cast(Symbol, self.args[0])
+        return self._builtin_name
 
     @property
     def builtin_args(self) -> tuple[Any, ...] | tuple:
-        return self.args[1:]
+        return self._builtin_args
 
     # def resolve(self, mem: MemoryManager, node: IRNode, ir_graph: IRGraph, **kwargs: Any) -> Any:
     #     """
@@ -93,19 +114,26 @@ class BuiltinInstr(BaseIRInstr):
     #     builtin_fn(*self.builtin_args)
 
     def __repr__(self) -> str:
-        return f"{self.name}({' '.join(str(k) for k in self.args)})"
+        # instruction content is final after instantiation, so build it only once
+        if self._repr_cache is None:
+            self._repr_cache = f"{self.name}({' '.join(str(k) for k in self.args)})"
+
+        return self._repr_cache
 
 
 class CastInstr(IRInstr):
+    _data: SimpleObj | ObjArray | ModifierBlock | BaseIRInstr
+    _to_type: Symbol | CompositeSymbol | ModifierBlock
+    __slots__ = ("_data", "_to_type")
+
     def __init__(
         self,
         data: SimpleObj | ObjArray | ModifierBlock | BaseIRInstr,
         to_type: Symbol | CompositeSymbol | ModifierBlock,
     ):
-        if isinstance(
-            data, SimpleObj | ObjArray | ModifierBlock | BaseIRInstr
-        ) and isinstance(to_type, Symbol | CompositeSymbol | ModifierBlock):
-            super().__init__(data, to_type, name=IRFlag.CAST)
+        if isinstance(data, _CAST_DATA_TYPES) and isinstance(to_type, _VAR_TYPE_TYPES):
+            self._init_checked(data, to_type, name=_F_CAST)
+            self._data, self._to_type = data, to_type
 
         else:
             raise ValueError(
@@ -114,12 +142,15 @@ class CastInstr(IRInstr):
             )
 
     # def resolve(self, mem: MemoryManager, node: IRNode, ir_graph: IRGraph, **kwargs: Any) -> None:
-    #     _data = _resolve_expr_to_data(self.args[0], mem, node, ir_graph)
-    #     _type = _resolve_type(self.args[1], mem, node, ir_graph)
+    #     _data = _resolve_expr_to_data(self._data, mem, node, ir_graph)
+    #     _type = _resolve_type(self._to_type, mem, node, ir_graph)
     #     _resolve_cast(_data, to_type=_type, mem=mem, node=node, ir_graph=ir_graph)
 
 
 class CallInstr(IRInstr):
+    _caller: Symbol | CompositeSymbol | ModifierBlock
+    __slots__ = ("_caller",)
+
     def __init__(
         self,
         name: Symbol | CompositeSymbol | ModifierBlock,
@@ -130,29 +161,18 @@ class CallInstr(IRInstr):
     ):
         instr_args: tuple[IRBlock | BaseIRInstr | SimpleObj] | tuple
 
-        if args is not None and option is None and body is None:
-            instr_args = (args,)
-            flag = IRFlag.FN_CALL
-
-        elif args is None and option is not None and body is None:
-            instr_args = (option,)
-            flag = IRFlag.OPTN_CALL
+        mask = (args is not None) | (option is not None) << 1 | (body is not None) << 2
 
-        elif args is not None and option is not None and body is None:
-            instr_args = (args, option)
-            flag = IRFlag.OPTBDN_CALL
-
-        elif option is None and body is not None:
-            instr_args = (args, body)
-            flag = IRFlag.BDN_CALL
-
-        else:
+        if (dispatch := _CALL_DISPATCH[mask]) is None:
             raise ValueError(
                 f"cannot contain option ({type(option)}) and body ({type(body)}) "
                 f"in the same instruction."
             )
 
+        flag, get_args = dispatch
+        instr_args = get_args(args, option, body)
         super().__init__(name, *instr_args, name=flag)
+        self._caller = name
 
     # def resolve(self, mem: MemoryManager, node: IRNode, ir_graph: IRGraph, **_: Any) -> None:
     #     match self.name:
@@ -197,10 +217,10 @@ class CallInstr(IRInstr):
     #     self, ir_graph: IRGraph, mem: MemoryManager, node: IRNode
     # ) -> tuple[tuple, BaseFnCheck]:
     #     caller: Symbol | CompositeSymbol | ModifierBlock = (
-    #         cast(Symbol | CompositeSymbol, self.args[0])  # type: ignore [assignment]
+    #         self.args[0]
     #         if isinstance(self.args[0], Symbol | CompositeSymbol)
     #         else (
-    #             cast(ModifierBlock, self.args[0]).name
+    #             self.args[0].name
     #             if isinstance(self.args[0], ModifierBlock)
     #             else sys.exit("call instr error")
     #         )
@@ -214,15 +234,18 @@ class CallInstr(IRInstr):
 
 
 class DeclareInstr(IRInstr):
+    _var: Symbol | ModifierBlock
+    _var_type: Symbol | CompositeSymbol | ModifierBlock
+    __slots__ = ("_var", "_var_type")
+
     def __init__(
         self,
         var: Symbol | ModifierBlock,
         var_type: Symbol | CompositeSymbol | ModifierBlock,
     ):
-        if isinstance(var, Symbol | ModifierBlock) and isinstance(
-            var_type, Symbol | CompositeSymbol | ModifierBlock
-        ):
-            super().__init__(var, var_type, name=IRFlag.DECLARE)
+        if isinstance(var, _VAR_TYPES) and isinstance(var_type, _VAR_TYPE_TYPES):
+            self._init_checked(var, var_type, name=_F_DECLARE)
+            self._var, self._var_type = var, var_type
 
         else:
             raise ValueError(
@@ -230,22 +253,37 @@ class DeclareInstr(IRInstr):
                 f" or composite symbol, got {type(var_type)}"
             )
 
+    @classmethod
+    def from_symbols(
+        cls, var: Symbol, var_type: Symbol | CompositeSymbol | ModifierBlock
+    ) -> DeclareInstr:
+        """
+        Fast constructor that skips the arguments validation. Use it only when
+        ``var`` and ``var_type`` types are already guaranteed, e.g. by the grammar.
+        """
+
+        instr = cls.__new__(cls)
+        instr._init_checked(var, var_type, name=_F_DECLARE)
+        instr._var, instr._var_type = var, var_type
+        return instr
+
     # def resolve(self, mem: MemoryManager, node: IRNode, ir_graph: IRGraph, **_: Any) -> None:
-    #     var: Symbol | ModifierBlock = cast(Symbol | ModifierBlock, self.args[0])
-    #     var_type_symbol: Symbol | CompositeSymbol = cast(Symbol | CompositeSymbol, self.args[1])
-    #     _declare_variable(var, var_type_symbol, mem, node.irhash, ir_graph)
+    #     _declare_variable(self._var, self._var_type, mem, node.irhash, ir_graph)
 
 
 class AssignInstr(IRInstr):
+    _var: Symbol | ModifierBlock
+    _value: SimpleObj | ObjArray | IRBlock
+    __slots__ = ("_var", "_value")
+
     def __init__(
         self,
         var: Symbol | ModifierBlock,
         value: SimpleObj | ObjArray | IRBlock,
     ):
-        if isinstance(var, Symbol | ModifierBlock) and isinstance(
-            value, SimpleObj | ObjArray | IRBlock
-        ):
-            super().__init__(var, value, name=IRFlag.ASSIGN)
+        if isinstance(var, _VAR_TYPES) and isinstance(value, _VALUE_TYPES):
+            self._init_checked(var, value, name=_F_ASSIGN)
+            self._var, self._value = var, value
 
         else:
             raise ValueError(
@@ -256,9 +294,8 @@ class AssignInstr(IRInstr):
     # def resolve(self, mem: MemoryManager, node: IRNode, ir_graph: IRGraph, **_: Any) -> None:
     #     # TODO: refactor this
     #
-    #     var: Symbol = cast(Symbol, self.args[0])
-    #     variable = mem.scope.heap[mem.cur_scope].get(var)
-    #     mem.scope.stack[mem.cur_scope].push(self.args[1])
+    #     variable = mem.scope.heap[mem.cur_scope].get(self._var)
+    #     mem.scope.stack[mem.cur_scope].push(self._value)
     #
     #     # # resolve value to check and assign the correct type
     #     # new_args = _get_assign_datatype(
@@ -274,6 +311,11 @@ class AssignInstr(IRInstr):
 
 
 class DeclareAssignInstr(IRInstr):
+    _var: Symbol | ModifierBlock
+    _var_type: Symbol | CompositeSymbol | ModifierBlock
+    _value: SimpleObj | ObjArray | BaseIRInstr | IRBlock
+    __slots__ = ("_var", "_var_type", "_value")
+
     def __init__(
         self,
         var: Symbol | ModifierBlock,
@@ -281,11 +323,12 @@ class DeclareAssignInstr(IRInstr):
         value: SimpleObj | ObjArray | BaseIRInstr | IRBlock,
     ):
         if (
-            isinstance(var, Symbol | ModifierBlock)
-            and isinstance(var_type, Symbol | CompositeSymbol | ModifierBlock)
-            and isinstance(value, SimpleObj | ObjArray | BaseIRInstr | IRBlock)
+            isinstance(var, _VAR_TYPES)
+            and isinstance(var_type, _VAR_TYPE_TYPES)
+            and isinstance(value, _VALUE_EXT_TYPES)
         ):
-            super().__init__(var, var_type, value, name=IRFlag.DECLARE_ASSIGN)
+            self._init_checked(var, var_type, value, name=_F_DECLARE_ASSIGN)
+            self._var, self._var_type, self._value = var, var_type, value
 
         else:
             raise ValueError(
@@ -295,10 +338,8 @@ class DeclareAssignInstr(IRInstr):
             )
 
     # def resolve(self, mem: MemoryManager, node: IRNode, ir_graph: IRGraph, **_: Any) -> None:
-    #     var: Symbol = cast(Symbol, self.args[0])
-    #     var_type_symbol: Symbol | CompositeSymbol = cast(Symbol | CompositeSymbol, self.args[1])
-    #     _declare_variable(var, var_type_symbol, mem, node.irhash, ir_graph)
-    #     variable: DataDef = cast(DataDef, mem.stack.get(var))
+    #     _declare_variable(self._var, self._var_type, mem, node.irhash, ir_graph)
+    #     variable: DataDef = mem.stack.get(self._var)
     #     mem.stack.push(variable)
     #     _assign_variable(variable=variable, mem=mem, node=node, ir_graph=ir_graph)
 
@@ -309,6 +350,9 @@ class DeclareAssignInstr(IRInstr):
 
 
 class IRModule(BaseIRModule):
+    _ir_hash: IRHash
+    __slots__ = ("_ir_hash",)
+
     def __init__(
         self,
         path: Path,
@@ -318,6 +362,11 @@ class IRModule(BaseIRModule):
         self._path = path
         self._symbol_table = symboltable
         self._main = main or BodyBlock()
+        self._ir_hash = IRHash(path)
+
+    @property
+    def ir_hash(self) -> IRHash:
+        return self._ir_hash
 
     def __str__(self) -> str:
         st = ""
@@ -332,16 +381,17 @@ class IRModule(BaseIRModule):
 
         main = ""
         if self.main:
-            main += "\n  - main:\n      "
-            main += "\n      ".join(str(k) for k in self.main)
-            main += "\n"
+            main = "\n      ".join([str(k) for k in self.main])
+            main = f"\n  - main:\n      {main}\n"
 
-        return f"{IRHash(self._path)}{st}{main}"
+        return f"{self._ir_hash}{st}{main}"
 
 
 class IR(BaseIR):
     """Hold all the IR content: IR blocks, IR types and IR functions"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         ref_table: RefTable,
@@ -357,20 +407,16 @@ class IR(BaseIR):
             )
 
     def __repr__(self) -> str:
-        rf = ""
-
-        if self.ref_table.types:
-            rf += "\n".join(f"    {t}:{t_def}" for t, t_def in self.ref_table.types)
-
-        if self.ref_table.fns:
-            rf += "\n".join(f"    {f}:{f_def}" for f, f_def in self.ref_table.fns)
+        rf = [f"    {t}:{t_def}" for t, t_def in self.ref_table.types]
+        rf.extend([f"    {f}:{f_def}" for f, f_def in self.ref_table.fns])
+        rf_txt = "\n".join(rf)
 
-        if rf:
-            rf = f"\n  ref table:\n{rf}\n"
+        if rf_txt:
+            rf_txt = f"\n  ref table:\n{rf_txt}\n"
 
         module = f"\n  module:{self.module}"
 
-        return f"\n=IR:start={rf}{module}=IR:end=\n"
+        return f"\n=IR:start={rf_txt}{module}=IR:end=\n"
 
 
 ##################
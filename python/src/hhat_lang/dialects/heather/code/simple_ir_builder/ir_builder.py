@@ -9,6 +9,7 @@ from hhat_lang.core.code.tools import build_reftable
 from hhat_lang.core.data.core import CompositeSymbol, Symbol
 from hhat_lang.core.data.fn_def import BuiltinFnDef, FnDef
 from hhat_lang.core.types.abstract_base import BaseTypeDef
+from hhat_lang.dialects.heather.code.simple_ir_builder.folding import fold_constants
 from hhat_lang.dialects.heather.code.simple_ir_builder.ir import (
     IR,
     IRModule,
@@ -44,11 +45,8 @@ def build_ir_module(
     st = SymbolTable()
     path = path if isinstance(path, Path) else Path(path)
 
-    for t in types:
-        st.type.add(t.name, t)
-
-    for f in fns:
-        st.fn.add(f.fn_header, f)
+    st.type.bulk_add((t.name, t) for t in types)
+    st.fn.bulk_add((f.fn_header, f) for f in fns)
 
     return IRModule(path=path, symboltable=st, main=main)
 
@@ -63,5 +61,10 @@ def build_ir(
     main: BodyBlock | None = None,
 ) -> IR:
     ref_table = build_reftable(types=ref_types, fns=ref_fns)
+    shadowed = (
+        *(ref_fns.keys() if ref_fns else ()),
+        *(f.fn_header if isinstance(f, BuiltinFnDef) else f.fn_check for f in fns or ()),
+    )
+    main = fold_constants(main, shadowed)
     ir_module = build_ir_module(path=path, types=types, fns=fns, main=main)
     return IR(ref_table=ref_table, ir_module=ir_module)
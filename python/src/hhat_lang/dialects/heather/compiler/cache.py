@@ -0,0 +1,157 @@
+"""
+On-disk cache for the parsed project code. It holds the IR objects generated by
+parsing some code, so an unchanged project does not go through the grammar parser
+again on the next compilation.
+
+Entries are pickled, so they are signed with a key kept on the user cache folder
+(outside any project) and only unpickled when the signature matches. A cache folder
+that comes along with a project from somewhere else is never loaded.
+"""
+
+from __future__ import annotations
+
+import hmac
+import os
+import pickle
+from functools import cache
+from hashlib import sha256
+from pathlib import Path
+
+from hhat_lang.core.code.abstract import BaseIR
+from hhat_lang.toolchain.project import CACHE_FOLDER_NAME
+
+AST_CACHE_FOLDER_NAME = "ast"
+USER_KEY_FILE_NAME = "ast_cache.key"
+
+_PACKAGE_PATH = Path(__file__).parents[3]
+
+_VERSION_PATHS = (_PACKAGE_PATH / "core", _PACKAGE_PATH / "dialects" / "heather")
+"""
+Core and heather dialect root paths; their source files define the cache version, as
+the cached IR objects are built from classes on both
+"""
+
+_SIGNATURE_SIZE = sha256().digest_size
+
+
+@cache
+def code_version() -> bytes:
+    """
+    Digest of the core and heather dialect source files (data and IR classes, types,
+    grammar, parsing and IR builder). Any change on them invalidates the cached entries.
+    """
+
+    digest = sha256()
+
+    for path in _VERSION_PATHS:
+        for file in sorted(path.rglob("*.py")):
+            digest.update(file.read_bytes())
+
+    return digest.digest()
+
+
+def cache_key(raw_code: str) -> str:
+    """Cache key for ``raw_code`` under the current code version."""
+
+    return sha256(raw_code.encode() + code_version()).hexdigest()
+
+
+def _user_key_file() -> Path:
+    user_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(user_cache) / "hhat_lang" / USER_KEY_FILE_NAME
+
+
+def _signing_key() -> bytes:
+    """The user key to sign the cache entries with, created on first use."""
+
+    key_file = _user_key_file()
+
+    if not key_file.is_file():
+        key_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+
+        with os.fdopen(fd, "wb") as f:
+            f.write(os.urandom(32))
+
+    return key_file.read_bytes()
+
+
+def _sign(data: bytes) -> bytes:
+    return hmac.new(_signing_key(), data, sha256).digest()
+
+
+def _cache_file(project_root: Path, key: str) -> Path:
+    return project_root / CACHE_FOLDER_NAME / AST_CACHE_FOLDER_NAME / f"{key}.pkl"
+
+
+def _content_hash(path: Path) -> bytes | None:
+    return sha256(path.read_bytes()).digest() if path.is_file() else None
+
+
+def load_cached(project_root: Path, key: str) -> tuple[tuple[BaseIR, ...], int] | None:
+    """
+    Load the cached IR objects for ``key``.
+
+    Args:
+        project_root: ``Path`` object of the project root path
+        key: cache key, as returned by ``cache_key``
+
+    Returns:
+        The IR objects in the order they were added to the IR graph and the index of
+        the main one (or ``-1`` if none), or ``None`` if there is no valid entry. An
+        entry is not valid when it is not signed by the user key or when any of its
+        modules' files is gone or has a different content from when it was stored.
+    """
+
+    cache_file = _cache_file(project_root, key)
+
+    if not cache_file.is_file():
+        return None
+
+    content = cache_file.read_bytes()
+    signature, data = content[:_SIGNATURE_SIZE], content[_SIGNATURE_SIZE:]
+
+    if not hmac.compare_digest(signature, _sign(data)):
+        return None
+
+    try:
+        irs, main_idx, sources = pickle.loads(data)
+
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError):
+        # entry from an older version of the IR classes; parse the code again
+        return None
+
+    for path, digest in sources:
+        if _content_hash(path) != digest:
+            return None
+
+    return irs, main_idx
+
+
+def store(
+    project_root: Path,
+    key: str,
+    irs: tuple[BaseIR, ...],
+    main_idx: int,
+    module_paths: tuple[Path, ...],
+) -> None:
+    """
+    Store the IR objects for ``key``, together with the content hash of the
+    ``module_paths`` files they came from. IR objects that cannot be pickled, or that
+    come from a module without a file, are not cached.
+    """
+
+    sources = tuple((path, _content_hash(path)) for path in module_paths)
+
+    if any(digest is None for _, digest in sources):
+        return
+
+    try:
+        data = pickle.dumps((irs, main_idx, sources), protocol=pickle.HIGHEST_PROTOCOL)
+
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return
+
+    cache_file = _cache_file(project_root, key)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_bytes(_sign(data) + data)
@@ -1,23 +1,139 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Callable
 
-from arpeggio import ParserPython
+from arpeggio import NonTerminal, ParserPython
 
+from hhat_lang.core.code.abstract import BaseIR
 from hhat_lang.core.code.ir_graph import IRGraph
 from hhat_lang.core.compiler.builtin_modules import gen_builtin_modules
 from hhat_lang.core.config.base import HhatProjectSettings
+from hhat_lang.core.imports import TypeImporter
+from hhat_lang.core.imports.importer import FnImporter
 from hhat_lang.dialects.heather.code.simple_ir_builder.ir import IR, IRModule
+from hhat_lang.dialects.heather.compiler.cache import cache_key, load_cached, store
 from hhat_lang.dialects.heather.grammar.fn_grammar import fn_program
-from hhat_lang.dialects.heather.parsing.ir_visitor import parse, parser_grammar_code
+from hhat_lang.dialects.heather.grammar.type_grammar import type_program
+from hhat_lang.dialects.heather.parsing.ir_visitor import (
+    ParserIRVisitor,
+    parse,
+    parser_grammar_code,
+    visit_tree,
+)
 from hhat_lang.toolchain.project import MAIN_PATH
 
+PARALLEL_MIN_MODULES = 2
+"""
+Minimum number of modules imported by the main code to parse them in parallel; below
+it, starting the worker processes costs more than parsing the modules on demand.
+"""
+
+
+def _parse_module(project_root: Path, module_path: Path, is_type: bool) -> tuple[BaseIR, ...]:
+    """
+    Parse a single module (and the modules it imports) on its own IR graph. Runs on a
+    worker process, so it only receives and returns picklable objects.
+
+    Returns:
+        The IR objects of the parsed modules. Parsing errors are raised back on the
+        calling process.
+    """
+
+    ir_graph = IRGraph()
+    gen_builtin_modules(ir_graph, IRModule, IR)
+    num_builtins = len(ir_graph.tmp_nodes)
+
+    parse(
+        grammar_parser=parser_grammar_code,
+        program_rule=type_program if is_type else fn_program,
+        raw_code=module_path.read_text(),
+        project_root=project_root,
+        module_path=module_path,
+        ir_graph=ir_graph,
+    )
+
+    return tuple(node.ir for node in ir_graph.tmp_nodes[num_builtins:])
+
+
+def _main_imports(
+    parse_tree: NonTerminal,
+    project_root: Path,
+    ir_graph: IRGraph,
+) -> dict[Path, bool]:
+    """
+    Modules imported by the main code, from its parse tree, and whether each of them
+    is a types module. Modules already on ``ir_graph`` (the built-in ones) or not
+    found are left to be handled when the main code is visited.
+    """
+
+    visitor = ParserIRVisitor(parser_grammar_code, project_root, project_root / MAIN_PATH, ir_graph)
+    importers = {
+        "typeimport": TypeImporter(project_root, parser_grammar_code, type_program, parse),
+        "fnimport": FnImporter(project_root, parser_grammar_code, fn_program, parse),
+    }
+    modules: dict[Path, bool] = dict()
+
+    for node in parse_tree:
+        if node.rule_name != "imports":
+            continue
+
+        for import_node in node:
+            if (importer := importers.get(import_node.rule_name)) is None:
+                continue
+
+            # the import keyword and ":" are suppressed, leaving the imported names
+            for name in visit_tree(import_node[-1], visitor):
+                module_path = importer.module_path(name)
+
+                if module_path not in ir_graph and module_path.is_file():
+                    modules.setdefault(module_path, isinstance(importer, TypeImporter))
+
+    return modules
+
+
+def _parse_modules(
+    project_root: Path,
+    ir_graph: IRGraph,
+    modules: dict[Path, bool],
+    max_workers: int,
+) -> None:
+    """
+    Parse the modules imported by the main code in parallel, one worker process per
+    module (with the modules it imports), and add them to ``ir_graph``. The main code
+    then finds them already on the graph.
+
+    Workers do not share their graphs: a module imported by more than one of
+    ``modules`` is parsed on each of their workers (and added once). The built-in
+    modules are generated once per worker process; its next modules reuse them
+    from the ``gen_builtin_modules`` cache.
+    """
+
+    if len(modules) < PARALLEL_MIN_MODULES:
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            _parse_module,
+            (project_root,) * len(modules),
+            modules.keys(),
+            modules.values(),
+        )
+
+        for irs in results:
+            for ir_obj in irs:
+                # modules imported by more than one module are only added once
+                ir_graph.add_node(ir_obj)
+
 
 def compile_project_ir(
     project_settings: HhatProjectSettings,
     raw_code: str,
     grammar_parser: Callable[[Callable], ParserPython] | None = None,
     program_rule: Callable | None = None,
+    use_cache: bool = False,
+    max_workers: int = 1,
 ) -> IRGraph:
     """
     Parse the whole project (including built-in modules), generating an IR graph instance.
@@ -27,6 +143,13 @@ def compile_project_ir(
         raw_code: code as str
         grammar_parser:
         program_rule:
+        use_cache: whether to reuse the IR objects from a previous compilation of the
+            same code instead of parsing it. Off by default; when on, the entries are
+            stored under the project cache folder and signed with a key kept on the
+            user cache folder
+        max_workers: maximum number of processes to parse the modules imported by the
+            main code in parallel (default grammar only); ``1``, the default, parses
+            them on demand instead
 
     Returns:
         An ``IRGraph`` instance for the project.
@@ -41,13 +164,59 @@ def compile_project_ir(
     # TODO: move gen_builtin_modules below parse after checking
     #  built-in load and functions are working
     gen_builtin_modules(ir_graph, ir_module, ir)
-    parse(
-        grammar_parser=grammar_parser,
-        program_rule=program_rule,
-        raw_code=raw_code,
-        project_root=project_settings.project_root,
-        module_path=project_settings.project_root / MAIN_PATH,
-        ir_graph=ir_graph,
-    )
+
+    project_root = project_settings.project_root
+    # only the default grammar has its parsed code cached or parsed in parallel
+    default_grammar = grammar_parser is parser_grammar_code and program_rule is fn_program
+    use_cache = use_cache and default_grammar
+    key = cache_key(raw_code) if use_cache else ""
+
+    if use_cache and (cached := load_cached(project_root, key)) is not None:
+        irs, main_idx = cached
+
+        for n, ir_obj in enumerate(irs):
+            if n == main_idx:
+                ir_graph.add_main_node(ir_obj)
+
+            else:
+                ir_graph.add_node(ir_obj)
+
+    else:
+        num_builtins = len(ir_graph.tmp_nodes)
+
+        if default_grammar and max_workers > 1:
+            # the main code is parsed once, to find its imports and then to visit it
+            parse_tree = grammar_parser(program_rule).parse(raw_code)
+            modules = _main_imports(parse_tree, project_root, ir_graph)
+            _parse_modules(project_root, ir_graph, modules, max_workers)
+            visit_tree(
+                parse_tree,
+                ParserIRVisitor(grammar_parser, project_root, project_root / MAIN_PATH, ir_graph),
+            )
+
+        else:
+            parse(
+                grammar_parser=grammar_parser,
+                program_rule=program_rule,
+                raw_code=raw_code,
+                project_root=project_root,
+                module_path=project_root / MAIN_PATH,
+                ir_graph=ir_graph,
+            )
+
+        if use_cache:
+            parsed_nodes = ir_graph.tmp_nodes[num_builtins:]
+            main_idx = next(
+                (n for n, node in enumerate(parsed_nodes) if node.irhash == ir_graph.main_node),
+                -1,
+            )
+            store(
+                project_root,
+                key,
+                tuple(node.ir for node in parsed_nodes),
+                main_idx,
+                tuple(node.path for node in parsed_nodes),
+            )
+
     ir_graph.build()
     return ir_graph
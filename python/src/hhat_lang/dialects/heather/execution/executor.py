@@ -12,6 +12,8 @@ from hhat_lang.core.memory.core import MemoryManager
 
 
 class Executor(BaseExecutor):
+    __slots__ = ()
+
     def __init__(self):
         self._cexec = CExecutor()
         self._qexec = QExecutor()
@@ -42,8 +44,8 @@ class Executor(BaseExecutor):
 
 
 class CExecutor(BaseClassicalEvaluator):
-    pass
+    __slots__ = ()
 
 
 class QExecutor(BaseQuantumEvaluator):
-    pass
+    __slots__ = ()
@@ -12,9 +12,20 @@ from hhat_lang.dialects.heather.code.simple_ir_builder.ir import IR
 class IRManager(BaseIRManager):
     """Handle IR codes for Heather dialect through ``IRGraph`` instance"""
 
+    __slots__ = ()
+
     def __init__(self):
         self._graph = IRGraph()
 
+    @staticmethod
+    def _key(ir: IR) -> IRHash:
+        """
+        The ``IR`` key on the graph. It is created once by its ``IRModule`` and
+        reused on every link or update, instead of being derived again.
+        """
+
+        return ir.module.ir_hash  # type: ignore [attr-defined]
+
     def add_ir(self, ir: IR) -> None:
         """
         Add a single IR
@@ -42,8 +53,8 @@ class IRManager(BaseIRManager):
             **kwargs: Extra data if needed
         """
 
-        importing = IRHash.get_key(ir_importing)
-        imported = IRHash.get_key(ir_imported)
+        importing = self._key(ir_importing)
+        imported = self._key(ir_imported)
         self._graph.add_edge(*refs, node_key=importing, link_key=imported)
 
     def update_ir(self, prev_ir: IR, new_ir: IR) -> None:
@@ -56,5 +67,5 @@ class IRManager(BaseIRManager):
             new_ir: the new ``IR`` instance, to replace the current ``IR`` instance
         """
 
-        prev_key = IRHash.get_key(prev_ir)
+        prev_key = self._key(prev_ir)
         self._graph.update_node(prev_key, new_ir)
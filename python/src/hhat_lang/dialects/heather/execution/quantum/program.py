@@ -47,13 +47,13 @@ from hhat_lang.core.execution.abstract_program import (
 from hhat_lang.core.lowlevel.abstract_qlang import BaseLLQManager, BaseLLQ
 from hhat_lang.core.memory.core import MemoryManager
 
-# TODO: the imports below must come from the config file, not hardcoded
-from hhat_lang.low_level.target_backend.qiskit.aer_simulator.code_evaluator import (
-    execute_program,
-)
-
 
 class QuantumProgram(CoreQuantumProgram):
+    _execute_program: Callable[[BaseLLQ, DataDef | Literal, bool], Any] | None = None
+    """target backend's program executor, imported on the first run"""
+
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -87,10 +87,27 @@ class QuantumProgram(CoreQuantumProgram):
             executor=executor,
         )
 
+    @classmethod
+    def _executor_fn(cls) -> Callable[[BaseLLQ, DataDef | Literal, bool], Any]:
+        """
+        The target backend is only imported when a quantum program runs, so
+        classical-only programs do not pay for loading it (and its dependencies).
+        """
+
+        if (fn := cls._execute_program) is None:
+            # TODO: the imports below must come from the config file, not hardcoded
+            from hhat_lang.low_level.target_backend.qiskit.aer_simulator.code_evaluator import (
+                execute_program,
+            )
+
+            fn = cls._execute_program = execute_program
+
+        return fn
+
     def run(self, debug: bool = False) -> Any | ErrorHandler:
         qlang_code: BaseLLQ = self._qlang.compile()
 
         if debug:
             print(qlang_code)
 
-        return execute_program(qlang_code, self._qdata, debug)
+        return self._executor_fn()(qlang_code, self._qdata, debug)
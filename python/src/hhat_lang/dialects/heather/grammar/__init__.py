@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import re
+
 WHITESPACE = "\n\t ,;"
 
 SINGLE_COMMENT = r"\/\/([^\n]*)\n"
-MULTILINE_COMMENT = r"\/\-.*?\-\/"
+# "-" runs are checked against the closing "-/" only where they appear, so the
+# comment content is consumed in a single pass; it must end on the line it starts
+MULTILINE_COMMENT = r"\/\-(?:[^\-\n]|\-(?!\/))*\-\/"
 
 STRING = r'"([^"]*)"'
 INT = r"-?([1-9]\d*|0)"
@@ -11,3 +15,12 @@ FLOAT = r"-?\d+\.\d+"
 QINT = r"\@-?([1-9]\d*|0)"
 
 ID = r"@?[a-zA-Z][a-zA-Z0-9\-_]*"
+
+# compiled once at import time and shared by every parser instance; the flags
+# are the same arpeggio uses by default for ``RegExMatch``
+COMMENT_RE = re.compile(f"{SINGLE_COMMENT}|{MULTILINE_COMMENT}", re.MULTILINE)
+STRING_RE = re.compile(STRING, re.MULTILINE)
+INT_RE = re.compile(INT, re.MULTILINE)
+FLOAT_RE = re.compile(FLOAT, re.MULTILINE)
+QINT_RE = re.compile(QINT, re.MULTILINE)
+ID_RE = re.compile(ID, re.MULTILINE)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from arpeggio import Kwd, EOF, OneOrMore, Optional, ZeroOrMore
+from arpeggio import Kwd, EOF, ZeroOrMore
 
 from hhat_lang.dialects.heather.grammar.fn_grammar import imports
 from hhat_lang.dialects.heather.grammar.generic_grammar import (
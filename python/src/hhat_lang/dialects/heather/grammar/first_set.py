@@ -0,0 +1,304 @@
+"""
+FIRST sets for the arpeggio parser model: which characters an expression can start
+with. ``DispatchedChoice`` uses them to try only the alternatives of an ordered
+choice that can match the next input character, instead of trying (and
+backtracking from) each one of them in order.
+
+Only ASCII characters are considered; an unknown set is ``None`` and means any
+character. Sets are a superset of the real ones, so no valid alternative is skipped.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from arpeggio import (
+    Decorator,
+    EndOfFile,
+    NoMatch,
+    OneOrMore,
+    OrderedChoice,
+    ParsingExpression,
+    RegExMatch,
+    Repetition,
+    Sequence,
+    StrMatch,
+    SyntaxPredicate,
+    UnorderedGroup,
+)
+
+from hhat_lang.dialects.heather.grammar.memo import RuleMemo
+
+FirstSet = frozenset[str] | None
+
+ASCII = frozenset(chr(k) for k in range(128))
+
+try:
+    # regex patterns are read with the private ``re`` parser (Python >= 3.11); without
+    # it, regex FIRST sets are unknown and their choices just try every alternative
+    from re import _constants as sre  # type: ignore [attr-defined]
+    from re import _parser as sre_parse  # type: ignore [attr-defined]
+
+    _CATEGORIES: dict[Any, frozenset[str]] = {
+        sre.CATEGORY_DIGIT: frozenset("0123456789"),
+        sre.CATEGORY_SPACE: frozenset(" \t\n\r\f\v"),
+        sre.CATEGORY_WORD: frozenset(
+            "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_"
+        ),
+    }
+    _CATEGORIES[sre.CATEGORY_NOT_DIGIT] = ASCII - _CATEGORIES[sre.CATEGORY_DIGIT]
+    _CATEGORIES[sre.CATEGORY_NOT_SPACE] = ASCII - _CATEGORIES[sre.CATEGORY_SPACE]
+    _CATEGORIES[sre.CATEGORY_NOT_WORD] = ASCII - _CATEGORIES[sre.CATEGORY_WORD]
+
+    _REPEATS = (sre.MIN_REPEAT, sre.MAX_REPEAT, sre.POSSESSIVE_REPEAT)
+    _ZERO_WIDTH = (sre.AT, sre.ASSERT, sre.ASSERT_NOT)
+
+except (ImportError, AttributeError):
+    sre_parse = None
+
+
+def _union(a: FirstSet, b: FirstSet) -> FirstSet:
+    return None if a is None or b is None else a | b
+
+
+def _with_cases(chars: frozenset[str]) -> frozenset[str]:
+    return chars | {k.swapcase() for k in chars}
+
+
+def _in_first(items: list[tuple[Any, Any]]) -> FirstSet:
+    """FIRST set of a regex character class (``[...]``)."""
+
+    chars: set[str] = set()
+    negate = False
+
+    for op, av in items:
+        if op is sre.NEGATE:
+            negate = True
+
+        elif op is sre.LITERAL:
+            chars.add(chr(av))
+
+        elif op is sre.RANGE:
+            chars.update(chr(k) for k in range(av[0], min(av[1], 127) + 1))
+
+        elif op is sre.CATEGORY and av in _CATEGORIES:
+            chars.update(_CATEGORIES[av])
+
+        else:
+            return None
+
+    return ASCII - chars if negate else frozenset(chars)
+
+
+def _regex_seq_first(items: Any) -> tuple[FirstSet, bool]:
+    """FIRST set and whether it can match empty, for a parsed regex sequence."""
+
+    first: FirstSet = frozenset()
+
+    for op, av in items:
+        if op in _ZERO_WIDTH:
+            continue
+
+        if op is sre.LITERAL:
+            return _union(first, frozenset(chr(av))), False
+
+        if op is sre.NOT_LITERAL:
+            return _union(first, ASCII - {chr(av)}), False
+
+        if op is sre.ANY:
+            return _union(first, ASCII), False
+
+        if op is sre.IN:
+            return _union(first, _in_first(av)), False
+
+        if op is sre.SUBPATTERN:
+            sub_first, nullable = _regex_seq_first(av[-1])
+
+        elif op is sre.ATOMIC_GROUP:
+            sub_first, nullable = _regex_seq_first(av)
+
+        elif op is sre.BRANCH:
+            sub_first, nullable = frozenset(), False
+
+            for branch in av[1]:
+                branch_first, branch_nullable = _regex_seq_first(branch)
+                sub_first = _union(sub_first, branch_first)
+                nullable = nullable or branch_nullable
+
+        elif op in _REPEATS:
+            sub_first, nullable = _regex_seq_first(av[2])
+            nullable = nullable or av[0] == 0
+
+        else:
+            return None, True
+
+        first = _union(first, sub_first)
+
+        if not nullable:
+            return first, False
+
+    return first, True
+
+
+def regex_first(regex: re.Pattern) -> tuple[FirstSet, bool]:
+    """FIRST set and whether it can match empty, for a compiled regex."""
+
+    if sre_parse is None or not isinstance(regex.pattern, str):
+        return None, True
+
+    first, nullable = _regex_seq_first(sre_parse.parse(regex.pattern, regex.flags))
+
+    if first is not None and regex.flags & re.IGNORECASE:
+        first = _with_cases(first)
+
+    return first, nullable
+
+
+def first_set(expr: ParsingExpression, _visiting: set[int] | None = None) -> tuple[FirstSet, bool]:
+    """
+    FIRST set of an arpeggio parsing expression and whether it can match empty.
+
+    Args:
+        expr: parsing expression from a parser model
+        _visiting: expressions being computed, to stop on recursive rules
+
+    Returns:
+        A tuple with the set of first characters (``None`` for any character) and
+        a boolean for the expression being able to match empty
+    """
+
+    _visiting = _visiting if _visiting is not None else set()
+
+    if id(expr) in _visiting:
+        return None, True
+
+    _visiting.add(id(expr))
+    first: FirstSet
+
+    try:
+        match expr:
+            case EndOfFile() | SyntaxPredicate():
+                return frozenset(), True
+
+            case StrMatch():
+                if not expr.to_match:
+                    return frozenset(), True
+
+                first = frozenset(expr.to_match[0])
+                return (_with_cases(first) if expr.ignore_case else first), False
+
+            case RegExMatch():
+                return regex_first(expr.regex)
+
+            case OrderedChoice():
+                first = frozenset()
+                nullable = False
+
+                for node in expr.nodes:
+                    node_first, node_nullable = first_set(node, _visiting)
+                    first = _union(first, node_first)
+                    nullable = nullable or node_nullable
+
+                return first, nullable
+
+            case Sequence():
+                first = frozenset()
+
+                for node in expr.nodes:
+                    node_first, node_nullable = first_set(node, _visiting)
+                    first = _union(first, node_first)
+
+                    if not node_nullable:
+                        return first, False
+
+                return first, True
+
+            case UnorderedGroup():
+                return None, True
+
+            case OneOrMore() | Decorator():
+                return first_set(expr.nodes[0], _visiting)
+
+            case Repetition():
+                return first_set(expr.nodes[0], _visiting)[0], True
+
+            case _:
+                return None, True
+
+    finally:
+        _visiting.discard(id(expr))
+
+
+class DispatchedChoice(RuleMemo, OrderedChoice):
+    """
+    ``OrderedChoice`` that peeks the next input character and tries, in order,
+    only the alternatives that can start with it. It falls back to trying all of
+    them for characters without a dispatch entry (non-ASCII, comments start or no
+    alternative found). It is also selectively memoized, as ``MemoSequence``.
+    When no alternative matches a dispatched character, the parsing error lists only
+    the expected tokens of the alternatives tried, at the same position.
+
+    To be given to the parser as ``syntax_classes={"OrderedChoice": DispatchedChoice}``.
+    """
+
+    _dispatch: dict[str, tuple[ParsingExpression, ...]] | None = None
+
+    def _build_dispatch(self, parser: Any) -> dict[str, tuple[ParsingExpression, ...]]:
+        firsts = []
+
+        for node in self.nodes:
+            node_first, nullable = first_set(node)
+            firsts.append(None if nullable else node_first)
+
+        comment_first: FirstSet = frozenset()
+
+        if parser.comments_model is not None:
+            comment_first = first_set(parser.comments_model)[0]
+
+        if comment_first is None:
+            return dict()
+
+        dispatch: dict[str, tuple[ParsingExpression, ...]] = dict()
+
+        for char in ASCII - comment_first:
+            nodes = tuple(
+                node for node, first in zip(self.nodes, firsts) if first is None or char in first
+            )
+
+            if nodes:
+                dispatch[char] = nodes
+
+        return dispatch
+
+    def _parse(self, parser: Any) -> Any:
+        if self.ws is not None or self.skipws is not None:
+            return super()._parse(parser)
+
+        if self._dispatch is None:
+            self._dispatch = self._build_dispatch(parser)
+
+        c_pos = pos = parser.position
+        text = parser.input
+        length = len(text)
+
+        if parser.skipws and not parser.in_lex_rule:
+            ws = parser.ws
+
+            while pos < length and text[pos] in ws:
+                pos += 1
+
+        if pos >= length or (nodes := self._dispatch.get(text[pos])) is None:
+            return super()._parse(parser)
+
+        for node in nodes:
+            try:
+                result = node.parse(parser)
+
+                if result is not None:
+                    return [result]
+
+            except NoMatch:
+                parser.position = c_pos  # backtracking
+
+        parser._nm_raise(self, c_pos, parser)
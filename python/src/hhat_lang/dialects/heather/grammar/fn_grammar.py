@@ -10,9 +10,7 @@ from hhat_lang.dialects.heather.grammar.generic_grammar import (
     assignargs,
     body,
     const_import,
-    declare,
-    declareassign,
-    declareassign_ds,
+    declaration,
     expr,
     full_id,
     id_composite_value,
@@ -61,9 +59,7 @@ def fn_body() -> Any:
         ZeroOrMore(
             [
                 fn_return,
-                declareassign,
-                declareassign_ds,
-                declare,
+                declaration,
                 assignargs,
                 assign_ds,
                 assign,
@@ -107,9 +103,7 @@ def metafn_body() -> Any:
         OneOrMore(
             [
                 option,
-                declareassign,
-                declareassign_ds,
-                declare,
+                declaration,
                 assignargs,
                 assign_ds,
                 assign,
@@ -1,19 +1,44 @@
 from __future__ import annotations
 
+import re
 from typing import Any
 
-from arpeggio import Kwd, OneOrMore, Optional, ZeroOrMore
-from arpeggio import RegExMatch as _
+from arpeggio import Kwd, OneOrMore, Optional, RegExMatch, ZeroOrMore
 
 from hhat_lang.dialects.heather.grammar import (
-    FLOAT,
-    ID,
-    INT,
-    MULTILINE_COMMENT,
-    QINT,
-    SINGLE_COMMENT,
-    STRING,
+    COMMENT_RE,
+    FLOAT_RE,
+    ID_RE,
+    INT_RE,
+    QINT_RE,
+    STRING_RE,
 )
+from hhat_lang.dialects.heather.grammar.skip import SkipMatch
+
+
+class PatternMatch(SkipMatch, RegExMatch):
+    """
+    ``RegExMatch`` that also accepts an already compiled pattern, used as it is
+    instead of being compiled again by each parser. Parser-wide ``ignore_case``
+    and ``multiline`` settings do not apply to compiled patterns. Whitespace and
+    comments before it are skipped by ``SkipMatch``.
+    """
+
+    def __init__(self, to_match: str | re.Pattern, *args: Any, **kwargs: Any):
+        if isinstance(to_match, re.Pattern):
+            kwargs.setdefault("str_repr", to_match.pattern)
+
+        super().__init__(to_match, *args, **kwargs)
+
+    def compile(self) -> None:
+        if isinstance(self.to_match_regex, re.Pattern):
+            self.regex = self.to_match_regex
+
+        else:
+            super().compile()
+
+
+_ = PatternMatch
 
 
 def id_composite_value() -> Any:
@@ -33,7 +58,7 @@ def array() -> Any:
 
 
 def simple_id() -> Any:
-    return _(ID)
+    return _(ID_RE)
 
 
 def trait_name_id() -> Any:
@@ -125,15 +150,15 @@ def t_bool() -> Any:
 
 
 def t_str() -> Any:
-    return _(STRING)
+    return _(STRING_RE)
 
 
 def t_int() -> Any:
-    return _(INT)
+    return _(INT_RE)
 
 
 def t_float() -> Any:
-    return _(FLOAT)
+    return _(FLOAT_RE)
 
 
 def qt_bool() -> Any:
@@ -141,11 +166,11 @@ def qt_bool() -> Any:
 
 
 def qt_int() -> Any:
-    return _(QINT)
+    return _(QINT_RE)
 
 
 def comment() -> Any:
-    return [_(SINGLE_COMMENT), _(MULTILINE_COMMENT)]
+    return _(COMMENT_RE)
 
 
 def single_import() -> Any:
@@ -159,7 +184,7 @@ def many_import() -> Any:
 def body() -> Any:
     return (
         "{",
-        ZeroOrMore([declareassign, declareassign_ds, declare, assign, expr]),
+        ZeroOrMore([declaration, assign, expr]),
         "}",
     )
 
@@ -178,35 +203,41 @@ def expr() -> Any:
     ]
 
 
-def declare() -> Any:
-    return simple_id, Optional(modifier), ":", full_id
-
-
-def assign() -> Any:
-    return full_id, "=", expr
-
-
-def assign_ds() -> Any:
-    return full_id, ".{", [OneOrMore(assignargs), OneOrMore(expr)], "}"
-
-
-def declareassign() -> Any:
-    return simple_id, Optional(modifier), ":", full_id, "=", expr
+def declaration() -> Any:
+    """
+    Variable declaration, with or without assignment. The shared ``var:type`` prefix
+    is parsed only once and what follows it (if anything) defines the kind::
 
+        var:type
+        var:type=expr
+        var:type=.{arg=expr ...}
+    """
 
-def declareassign_ds() -> Any:
     return (
         simple_id,
         Optional(modifier),
         ":",
         full_id,
-        "=",
-        ".{",
-        OneOrMore(assignargs),
-        "}",
+        Optional([declaration_ds_value, declaration_value]),
     )
 
 
+def declaration_value() -> Any:
+    return "=", expr
+
+
+def declaration_ds_value() -> Any:
+    return "=", ".{", OneOrMore(assignargs), "}"
+
+
+def assign() -> Any:
+    return full_id, "=", expr
+
+
+def assign_ds() -> Any:
+    return full_id, ".{", [OneOrMore(assignargs), OneOrMore(expr)], "}"
+
+
 def cast() -> Any:
     return [call, literal, full_id], "*", full_id
 
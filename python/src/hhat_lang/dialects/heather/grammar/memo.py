@@ -0,0 +1,102 @@
+"""
+Selective memoization for the arpeggio parser model. Instead of the parser-wide
+packrat memoization, only the rules in ``MEMOIZED_RULES`` keep their results by
+input position: they are re-entered from many alternatives (``cast`` starts with
+``call``, ``literal`` or ``full_id``, ``expr`` and ``args`` hold all call variants,
+etc.), while caching every other rule costs more than parsing it again.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from arpeggio import NoMatch, ParserPython, Sequence, StrMatch, Terminal
+
+MEMOIZED_RULES = frozenset(
+    {"expr", "full_id", "call", "cast", "args", "valonly", "literal", "composite_id"}
+)
+"""Grammar rules whose parsing results are memoized."""
+
+_NO_MATCH = object()
+
+
+class MemoParserPython(ParserPython):
+    """
+    ``ParserPython`` holding the ``RuleMemo`` results of the current input. They are
+    dropped at the start and at the end of each ``parse`` call, so a parser instance
+    can be reused for many inputs without keeping the previous ones' results.
+    """
+
+    rule_memo: dict[tuple[int, int], tuple[Any, int]]
+    """parsing result and end position, by memoized expression id and start position"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self.rule_memo = dict()
+        super().__init__(*args, **kwargs)
+
+    def parse(self, _input: str, file_name: str | None = None) -> Any:
+        self.rule_memo = dict()
+
+        try:
+            return super().parse(_input, file_name)
+
+        finally:
+            self.rule_memo = dict()
+
+
+class RuleMemo:
+    """
+    Mixin for arpeggio parsing expressions that memoizes the results of the root
+    expression of the ``MEMOIZED_RULES`` rules. To be used with the parser
+    ``memoization`` option off, on a ``MemoParserPython`` parser, which holds the
+    cached results; nothing is memoized on other parsers.
+    """
+
+    rule_name: str
+    root: bool
+    _memoize: bool | None = None
+
+    def parse(self, parser: MemoParserPython) -> Any:
+        if self._memoize is None:
+            self._memoize = self.root and self.rule_name in MEMOIZED_RULES
+
+        if not self._memoize or not isinstance(parser, MemoParserPython):
+            return super().parse(parser)  # type: ignore [misc]
+
+        key = id(self), parser.position
+
+        if (cached := parser.rule_memo.get(key)) is not None:
+            result, parser.position = cached
+
+            if result is _NO_MATCH:
+                raise parser.nm
+
+            return result
+
+        try:
+            result = super().parse(parser)  # type: ignore [misc]
+
+        except NoMatch:
+            parser.rule_memo[key] = (_NO_MATCH, key[1])
+            raise
+
+        parser.rule_memo[key] = (result, parser.position)
+        return result
+
+
+class MemoSequence(RuleMemo, Sequence):
+    """
+    ``Sequence`` with selective memoization. To be given to the parser as
+    ``syntax_classes={"Sequence": MemoSequence}``.
+    """
+
+    def _parse(self, parser: Any) -> Any:
+        results = super()._parse(parser)
+
+        # arpeggio suppresses string matches (and keywords) only inside an exact
+        # ``Sequence``, so they are suppressed here as well
+        for k in results:
+            if isinstance(k, Terminal) and isinstance(k.rule, StrMatch):
+                k.suppress = True
+
+        return results
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from arpeggio import Kwd, EOF, OneOrMore, Optional, ZeroOrMore, RegExMatch as _
+from arpeggio import Kwd, EOF, OneOrMore, Optional, ZeroOrMore
 
 from hhat_lang.dialects.heather.grammar.generic_grammar import (
     trait_name_id,
@@ -0,0 +1,122 @@
+"""
+Whitespace and comments skipping for the arpeggio parser model. Before each match,
+arpeggio skips whitespace and then tries the comment rule at every new input
+position, which fails (raising and catching ``NoMatch``) almost everywhere. Here
+each character is classified by a single lookup on ``CHAR_CLASS`` instead, and the
+comment rule is only tried where the next character can start a comment.
+
+``SkipMatch.parse`` follows arpeggio's ``Match.parse`` and its private parser state
+(``comment_positions``, ``in_parse_comments``, ``in_lex_rule``), so arpeggio is
+pinned on the ``heather`` dependencies; check both again when upgrading it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from arpeggio import NoMatch, StrMatch
+
+from hhat_lang.dialects.heather.grammar import COMMENT_RE, WHITESPACE
+from hhat_lang.dialects.heather.grammar.first_set import regex_first
+
+TOKEN = 0
+"""character that starts a token"""
+
+WS = 1
+"""whitespace character, skipped"""
+
+COMMENT = 2
+"""character that can start a comment"""
+
+_comment_first = regex_first(COMMENT_RE)[0]
+
+
+def _char_class(char: str) -> int:
+    if char in WHITESPACE:
+        return WS
+
+    if _comment_first is None or char in _comment_first:
+        return COMMENT
+
+    return TOKEN
+
+
+CHAR_CLASS = bytes(_char_class(chr(k)) for k in range(256))
+"""Class of each Latin-1 character, by its code point; the others are tokens."""
+
+
+def skip_ws(text: str, pos: int, length: int) -> int:
+    """Position of the first non-whitespace character of ``text`` from ``pos``."""
+
+    while pos < length and (code := ord(text[pos])) < 256 and CHAR_CLASS[code] == WS:
+        pos += 1
+
+    return pos
+
+
+class SkipMatch:
+    """
+    Mixin for arpeggio ``Match`` expressions that skips whitespace and comments
+    through ``CHAR_CLASS``. It expects a parser built with ``ws=WHITESPACE`` and
+    ``comment_def=comment``, as ``parser_grammar_code`` does.
+    """
+
+    suppress: bool
+
+    def _skip_comments(self, parser: Any) -> None:
+        if (model := parser.comments_model) is None:
+            return
+
+        text = parser.input
+        length = len(text)
+        pos = parser.position
+
+        try:
+            parser.in_parse_comments = True
+
+            while pos < length and (code := ord(text[pos])) < 256:
+                if CHAR_CLASS[code] != COMMENT:
+                    break
+
+                try:
+                    parser.comments.append(model.parse(parser))
+
+                except NoMatch:
+                    # not a comment, e.g. a single "/"
+                    break
+
+                pos = parser.position
+
+                if parser.skipws:
+                    pos = parser.position = skip_ws(text, pos, length)
+
+        finally:
+            parser.in_parse_comments = False
+
+    def parse(self, parser: Any) -> Any:
+        if parser.skipws and not parser.in_lex_rule:
+            parser.position = skip_ws(parser.input, parser.position, len(parser.input))
+
+        if parser.debug:
+            return super().parse(parser)  # type: ignore [misc]
+
+        if parser.skipws and parser.position in parser.comment_positions:
+            # comments already skipped from this position
+            parser.position = parser.comment_positions[parser.position]
+
+        elif not parser.in_parse_comments and not parser.in_lex_rule:
+            comment_start = parser.position
+            self._skip_comments(parser)
+            parser.comment_positions[comment_start] = parser.position
+
+        result = self._parse(parser)  # type: ignore [attr-defined]
+
+        if not self.suppress:
+            return result
+
+
+class SkipStrMatch(SkipMatch, StrMatch):
+    """
+    ``StrMatch`` skipping whitespace and comments through ``CHAR_CLASS``. To be
+    given to the parser as ``syntax_classes={"StrMatch": SkipStrMatch}``.
+    """
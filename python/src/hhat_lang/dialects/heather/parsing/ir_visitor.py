@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
-from itertools import chain
+import logging
+from functools import cache
 from pathlib import Path
-from typing import Any, Callable, Iterable
+from types import UnionType
+from typing import Any, Callable, Iterator
 
 from arpeggio import (
     NonTerminal,
     ParserPython,
+    ParseTreeNode,
     PTNodeVisitor,
     SemanticActionResults,
     Terminal,
     visit_parse_tree,
 )
-from typing_extensions import deprecated
 
 from hhat_lang.core.code.base import FnHeader
 from hhat_lang.core.code.ir_block import (
@@ -45,7 +47,7 @@ from hhat_lang.core.data.fn_def import BuiltinFnDef, FnDef
 from hhat_lang.core.error_handlers.errors import ErrorHandler
 from hhat_lang.core.imports import TypeImporter
 from hhat_lang.core.imports.importer import FnImporter
-from hhat_lang.core.types.abstract_base import BaseTypeDef, QSize, Size
+from hhat_lang.core.types.abstract_base import BaseTypeDef
 from hhat_lang.core.types.builtin_types import builtins_types
 from hhat_lang.core.types.core import EnumTypeDef, SingleTypeDef, StructTypeDef
 from hhat_lang.dialects.heather.code.simple_ir_builder.ir import (
@@ -58,19 +60,29 @@ from hhat_lang.dialects.heather.code.simple_ir_builder.ir import (
 )
 from hhat_lang.dialects.heather.code.simple_ir_builder.ir_builder import build_ir
 from hhat_lang.dialects.heather.grammar import WHITESPACE
+from hhat_lang.dialects.heather.grammar.first_set import DispatchedChoice
 from hhat_lang.dialects.heather.grammar.fn_grammar import fn_program
 from hhat_lang.dialects.heather.grammar.generic_grammar import comment
+from hhat_lang.dialects.heather.grammar.memo import MemoParserPython, MemoSequence
+from hhat_lang.dialects.heather.grammar.skip import SkipStrMatch
 from hhat_lang.dialects.heather.grammar.type_grammar import type_program
 from hhat_lang.dialects.heather.parsing.utils import FnsDict, ImportDicts, TypesDict
 
 #########################
 
 
+_logger = logging.getLogger(__name__)
+"""unexpected children found by the visitor are only reported on debug level"""
+
+
+@cache
 def read_grammar() -> str:
+    """The grammar file is read only once; later calls return the same content."""
+
     grammar_path = Path(__file__).parent.parent / "grammar" / "grammar.peg"
 
     if grammar_path.exists():
-        return open(grammar_path, "r").read()
+        return grammar_path.read_text(encoding="utf-8")
 
     raise ValueError("No grammar found on the grammar directory.")
 
@@ -80,19 +92,151 @@ def read_grammar() -> str:
 ############################
 
 
-def parser_grammar_code(program_fn: Callable) -> ParserPython:
+_parsers: dict[tuple[Callable, bool], ParserPython] = dict()
+"""``ParserPython`` instances already built, by their program function and memoization"""
+
+
+def parser_grammar_code(program_fn: Callable, memoization: bool = False) -> ParserPython:
     """
+    Building the parser walks the whole grammar, so it is done only once for each
+    ``program_fn`` and the same instance is returned afterward.
 
     Args:
         program_fn: the function that starts the grammar (probably "<something>_program").
+        memoization: whether to memoize every rule (arpeggio's packrat parsing). Off by
+            default: the grammar backtracks mostly on the rules in ``MEMOIZED_RULES``,
+            which are memoized anyway, and caching all the others costs more than
+            parsing them again
 
     Returns:
         The ``ParserPython`` constructor
     """
 
-    return ParserPython(
-        program_fn, comment_def=comment, ws=WHITESPACE, memoization=True
-    )
+    if (parser := _parsers.get((program_fn, memoization))) is None:
+        parser = MemoParserPython(
+            program_fn,
+            comment_def=comment,
+            syntax_classes={
+                "StrMatch": SkipStrMatch,
+                "OrderedChoice": DispatchedChoice,
+                "Sequence": MemoSequence,
+            },
+            ws=WHITESPACE,
+            # the rules in ``MEMOIZED_RULES`` are memoized by the syntax classes either way
+            memoization=memoization,
+        )
+        _parsers[program_fn, memoization] = parser
+
+    return parser
+
+
+_visit_actions: dict[type, dict[str, tuple[Callable | None, bool]]] = dict()
+"""
+Visit function and whether it has a second pass, by rule name, for each visitor class.
+Kept across parses, so each rule is looked up once per class instead of once per parse.
+"""
+
+
+def _visit_action(cls: type, rule_name: str) -> tuple[Callable | None, bool]:
+    actions = _visit_actions.setdefault(cls, dict())
+
+    if (action := actions.get(rule_name)) is None:
+        method = getattr(cls, f"visit_{rule_name}", None)
+        action = (method, method is not None and hasattr(cls, f"second_{rule_name}"))
+        actions[rule_name] = action
+
+    return action
+
+
+def visit_tree(parse_tree: ParseTreeNode, visitor: PTNodeVisitor) -> Any:
+    """
+    Same as arpeggio's ``visit_parse_tree``, in a single iterative walk over the
+    parse tree: each rule's visit method is looked up once per visitor class (instead
+    of once per node) and the semantic actions run as soon as each node's children
+    are done. Terminal nodes are visited straight from their parent's loop, without
+    going through the walk stack.
+
+    Args:
+        parse_tree: the parse tree root node
+        visitor: the ``PTNodeVisitor`` instance
+
+    Returns:
+        The result of the root node semantic action
+    """
+
+    if visitor.debug:
+        return visit_parse_tree(parse_tree, visitor)
+
+    cls = type(visitor)
+    actions = _visit_actions.setdefault(cls, dict())
+    default = cls.visit__default__ if visitor.defaults else None
+    second_pass = visitor.for_second_pass
+
+    # the root is handled as the only child of a placeholder parent
+    root_children = SemanticActionResults()
+    stack: list[tuple[ParseTreeNode | None, Iterator, SemanticActionResults]] = [
+        (None, iter((parse_tree,)), root_children)
+    ]
+
+    while stack:
+        node, nodes_iter, children = stack[-1]
+
+        for child in nodes_iter:
+            if isinstance(child, NonTerminal):
+                stack.append((child, iter(child), SemanticActionResults()))
+                break
+
+            rule_name = child.rule_name
+
+            if (action := actions.get(rule_name)) is None:
+                action = _visit_action(cls, rule_name)
+
+            if (method := action[0]) is not None:
+                result = method(visitor, child, SemanticActionResults())
+
+                if action[1]:
+                    second_pass.append((rule_name, result))
+
+            elif default is not None:
+                result = default(visitor, child, SemanticActionResults())
+
+            else:
+                continue
+
+            # a ``None`` result suppresses the node from its parent's children
+            if result is not None:
+                children.append_result(rule_name, result)
+
+        else:
+            stack.pop()
+
+            if node is None:
+                break
+
+            rule_name = node.rule_name
+
+            if (action := actions.get(rule_name)) is None:
+                action = _visit_action(cls, rule_name)
+
+            if (method := action[0]) is not None:
+                result = method(visitor, node, children)
+
+                if action[1]:
+                    second_pass.append((rule_name, result))
+
+            elif default is not None:
+                result = default(visitor, node, children)
+
+            else:
+                continue
+
+            if result is not None:
+                stack[-1][2].append_result(rule_name, result)
+
+    for sa_name, asg_node in second_pass:
+        getattr(visitor, f"second_{sa_name}")(asg_node)
+
+    return root_children[0] if root_children else None
 
 
 ###################
@@ -127,7 +271,7 @@ def parse(
     """
 
     parse_tree = grammar_parser(program_rule).parse(raw_code)
-    return visit_parse_tree(
+    return visit_tree(
         parse_tree,
         ParserIRVisitor(
             grammar_parser,
@@ -143,6 +287,69 @@ def parse(
 ###########################
 
 
+class _TypeBuckets:
+    """
+    Sort visited children into buckets, given by the index of the first class (or
+    union of classes) they are instance of, or ``-1`` for none. The bucket is
+    found through ``isinstance`` once for each exact type and then looked up.
+    """
+
+    _classes: tuple[type | UnionType, ...]
+    _cache: dict[type, int]
+    __slots__ = ("_classes", "_cache")
+
+    def __init__(self, *classes: type | UnionType):
+        self._classes = classes
+        self._cache = dict()
+
+    def __call__(self, obj: Any) -> int:
+        if (bucket := self._cache.get(type(obj))) is None:
+            bucket = next(
+                (n for n, cls in enumerate(self._classes) if isinstance(obj, cls)), -1
+            )
+            self._cache[type(obj)] = bucket
+
+        return bucket
+
+
+_BODY_BUCKETS = _TypeBuckets(IRInstr | IRBlock)
+"""body statements"""
+
+_ARGS_BUCKETS = _TypeBuckets(
+    ArgsValuesBlock,
+    IRInstr | ModifierBlock | Symbol | CompositeSymbol | Literal | LiteralArray,
+)
+"""key-value pairs arguments, then value only arguments"""
+
+_OPTBDN_BUCKETS = _TypeBuckets(ArgsBlock | ArgsValuesBlock, BodyBlock, OptionBlock)
+"""call arguments, body and options"""
+
+_CALL_BUCKETS = _TypeBuckets(
+    ArgsBlock | ArgsValuesBlock,
+    ModifierArgsBlock,
+    Symbol | CompositeSymbol | ModifierBlock,
+)
+"""call arguments, modifier and trait id"""
+
+
+@cache
+def _type_importer(project_root: Path, grammar_parser: Callable) -> TypeImporter:
+    """
+    Importers only hold the project paths and the parsing functions, so a single one
+    is built for each project and grammar, and shared by all the visited modules.
+    Modules already in the ``IRGraph`` are never parsed again by them.
+    """
+
+    return TypeImporter(project_root, grammar_parser, type_program, parse)
+
+
+@cache
+def _fn_importer(project_root: Path, grammar_parser: Callable) -> FnImporter:
+    """Same as ``_type_importer``, for functions."""
+
+    return FnImporter(project_root, grammar_parser, fn_program, parse)
+
+
 class ParserIRVisitor(PTNodeVisitor):
     """Visitor for parsing using IR code logic instead of AST's"""
 
@@ -152,6 +359,7 @@ class ParserIRVisitor(PTNodeVisitor):
     _module_path: Path
     _ir_graph: IRGraph
     _grammar: Callable[[Callable], ParserPython]
+    __slots__ = ("_root", "_module_path", "_ir_graph", "_grammar")
 
     def __init__(
         self,
@@ -184,24 +392,23 @@ class ParserIRVisitor(PTNodeVisitor):
 
     def visit_type_program(self, _: NonTerminal, child: SemanticActionResults) -> IR:
         refs: dict[Symbol | CompositeSymbol, Path] = dict()
-        types: tuple[BaseTypeDef, ...] | tuple = ()
+        types: list[BaseTypeDef] = []
 
         for k in child:
-            match k:
-                case ImportDicts():
-                    refs.update(k.types)
+            if isinstance(k, BaseTypeDef):
+                types.append(k)
 
-                case BaseTypeDef():
-                    types += (k,)
+            elif isinstance(k, ImportDicts):
+                refs.update(k.types)
 
-                case _:
-                    print(f"[type-program] ?? {type(k)}")
+            elif _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("unknown child of type program: %s", type(k))
 
         visited_ir = build_ir(
             path=self._module_path,
             ref_types=refs,
             ref_fns=dict(),
-            types=types,
+            types=tuple(types),
             fns=(),
             main=None,
         )
@@ -214,34 +421,33 @@ class ParserIRVisitor(PTNodeVisitor):
         main: BodyBlock | None = None
         ref_types: dict[Symbol | CompositeSymbol, Path] = dict()
         ref_fns: dict[FnHeader, Path] = dict()
-        types: tuple[BaseTypeDef, ...] | tuple = ()
-        fns: tuple[FnDef | BuiltinFnDef, ...] | tuple = ()
+        types: list[BaseTypeDef] = []
+        fns: list[FnDef | BuiltinFnDef] = []
 
         for k in child:
-            match k:
-                case IRBlock():
-                    if isinstance(k, BodyBlock):
-                        main = k
+            if isinstance(k, FnDef | BuiltinFnDef):
+                fns.append(k)
 
-                case ImportDicts():
-                    ref_types.update(k.types)
-                    ref_fns.update(k.fns)
+            elif isinstance(k, IRBlock):
+                if isinstance(k, BodyBlock):
+                    main = k
 
-                case BaseTypeDef():
-                    types += (k,)
+            elif isinstance(k, ImportDicts):
+                ref_types.update(k.types)
+                ref_fns.update(k.fns)
 
-                case FnDef() | BuiltinFnDef():
-                    fns += (k,)
+            elif isinstance(k, BaseTypeDef):
+                types.append(k)
 
-                case _:
-                    print(f"[?] unknown child of type {type(k)}")
+            elif _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("unknown child of fn program: %s", type(k))
 
         visited_ir = build_ir(
             path=self._module_path,
             ref_types=ref_types,
             ref_fns=ref_fns,
-            types=types,
-            fns=fns,
+            types=tuple(types),
+            fns=tuple(fns),
             main=main,
         )
 
@@ -259,21 +465,30 @@ class ParserIRVisitor(PTNodeVisitor):
         return child[0]
 
     def visit_typesingle(
-        self, _: NonTerminal, child: SemanticActionResults
+        self,
+        _: NonTerminal,
+        child: SemanticActionResults,
+        *,
+        _builtins: dict = builtins_types,
     ) -> SingleTypeDef | ErrorHandler:
         # TODO: implement a better resolver to account for custom and circular imports;
         #  for now, just check if it's built-in.
 
-        btype = builtins_types[child[1]]
+        # the built-in types table is bound as a default to be a local name on every call
+        btype = _builtins[child[1]]
         single = SingleTypeDef(name=child[0])
         return single.add_member(btype)
 
     def visit_typemember(
-        self, _: NonTerminal, child: SemanticActionResults
+        self,
+        _: NonTerminal,
+        child: SemanticActionResults,
+        *,
+        _builtins_get: Callable = builtins_types.get,
     ) -> tuple[Symbol | CompositeSymbol | BaseTypeDef, Symbol | CompositeSymbol]:
         # Fow now, it will try to fetch built-in types, otherwise it will
         # save the check for later
-        member_type = builtins_types.get(child[1], child[1])
+        member_type = _builtins_get(child[1], child[1])
         member_name = child[0]
         return member_type, member_name
 
@@ -330,25 +545,42 @@ class ParserIRVisitor(PTNodeVisitor):
         return BodyBlock(*child)
 
     def visit_body(self, _: NonTerminal, child: SemanticActionResults) -> BodyBlock:
-        values: tuple[IRInstr | IRBlock, ...] | tuple = ()
-        for k in child:
-            match k:
-                case IRInstr():
-                    values += (k,)
-
-                case IRBlock():
-                    values += (k,)
+        values: list[IRInstr | IRBlock] = [k for k in child if _BODY_BUCKETS(k) == 0]
 
-                case _:
-                    print(f"    -> something else: {k} ({type(k)})")
+        if len(values) != len(child) and _logger.isEnabledFor(logging.DEBUG):
+            for k in child:
+                if _BODY_BUCKETS(k) != 0:
+                    _logger.debug("unknown child of body: %s (%s)", k, type(k))
 
         return BodyBlock(*values)
 
-    def visit_declare(
+    def visit_declaration(
+        self, node: NonTerminal, child: SemanticActionResults
+    ) -> DeclareInstr | DeclareAssignInstr:
+        # the optional tail (if any) tells which kind of declaration it is
+        match node[-1].rule_name:
+            case "declaration_value":
+                return self._declareassign(child)
+
+            case "declaration_ds_value":
+                return self._declareassign_ds([*child[:-1], *child[-1]])
+
+            case _:
+                return self._declare(child)
+
+    def visit_declaration_value(self, _: NonTerminal, child: SemanticActionResults) -> Any:
+        return child[0]
+
+    def visit_declaration_ds_value(
         self, _: NonTerminal, child: SemanticActionResults
-    ) -> DeclareInstr:
+    ) -> tuple[ArgsValuesBlock, ...]:
+        return tuple(child)
+
+    @staticmethod
+    def _declare(child: SemanticActionResults) -> DeclareInstr:
         if len(child) == 2:
-            return DeclareInstr(var=child[0], var_type=child[1])
+            # grammar guarantees a simple id for var and a full id for its type
+            return DeclareInstr.from_symbols(child[0], child[1])
 
         if len(child) == 3:
             return DeclareInstr(
@@ -365,9 +597,8 @@ class ParserIRVisitor(PTNodeVisitor):
     ) -> AssignInstr:
         return AssignInstr(var=child[0], value=ArgsBlock(*child[1:]))
 
-    def visit_declareassign(
-        self, _: NonTerminal, child: SemanticActionResults
-    ) -> DeclareAssignInstr:
+    @staticmethod
+    def _declareassign(child: SemanticActionResults) -> DeclareAssignInstr:
         if len(child) == 3:
             return DeclareAssignInstr(var=child[0], var_type=child[1], value=child[2])
 
@@ -380,9 +611,8 @@ class ParserIRVisitor(PTNodeVisitor):
 
         raise ValueError("declaring and assigning cannot contain more than 4 elements")
 
-    def visit_declareassign_ds(
-        self, _: NonTerminal, child: SemanticActionResults
-    ) -> Any:
+    @staticmethod
+    def _declareassign_ds(child: list) -> DeclareAssignInstr:
         if isinstance(child[1], ModifierArgsBlock):
             return DeclareAssignInstr(
                 var=ModifierBlock(obj=child[0], args=child[1]),
@@ -411,46 +641,29 @@ class ParserIRVisitor(PTNodeVisitor):
     def visit_call(
         self, _: NonTerminal, child: SemanticActionResults
     ) -> CallInstr | ModifierBlock:
-        if len(child) == 1:
-            # only the caller is present
-            return CallInstr(name=child[0])
+        if not 0 < len(child) <= 4:
+            raise ValueError("call cannot have len 0 or > 4")
 
-        if len(child) == 2:
-            # possible cases: trait_id, args, or modifier
-            match child[1]:
-                # args option
-                case ArgsBlock() | ArgsValuesBlock():
-                    return CallInstr(name=child[0], args=child[1])
-
-                # modifier option
-                case ModifierArgsBlock():
-                    return ModifierBlock(obj=CallInstr(name=child[0]), args=child[1])
-
-                # trait_id option
-                case Symbol() | CompositeSymbol() | ModifierBlock():
-                    raise NotImplementedError("trait not implemented yet")
+        # children after the caller are, in order: trait_id, args and modifier, all optional
+        args: ArgsBlock | ArgsValuesBlock | None = None
+        modifier: ModifierArgsBlock | None = None
 
-                case _:
-                    raise NotImplementedError("unknown case")
+        for k in child[1:]:
+            match _CALL_BUCKETS(k):
+                case 0:
+                    args = k
 
-        if len(child) == 3:
-            # possible cases: trait_id and args, trait_id and modifier, args and modifier
-            match (child[1], child[2]):
-                # args and modifier
-                case (ArgsBlock() | ArgsValuesBlock(), ModifierArgsBlock()):
-                    return ModifierBlock(
-                        CallInstr(name=child[0], args=child[1]), args=child[2]
-                    )
+                case 1:
+                    modifier = k
 
-                # trait and something
-                case _:
-                    raise NotImplementedError()
+                case 2:
+                    raise NotImplementedError("trait not implemented yet")
 
-        if len(child) == 4:
-            # everything together :)
-            raise NotImplementedError()
+                case _:
+                    raise NotImplementedError("unknown case")
 
-        raise ValueError("call cannot have len 0 or > 4")
+        call = CallInstr(name=child[0], args=args)
+        return call if modifier is None else ModifierBlock(obj=call, args=modifier)
 
     def visit_trait_id(self, _: NonTerminal, child: SemanticActionResults) -> Any:
         raise NotImplementedError()
@@ -458,22 +671,16 @@ class ParserIRVisitor(PTNodeVisitor):
     def visit_args(
         self, _: NonTerminal, child: SemanticActionResults
     ) -> ArgsBlock | ArgsValuesBlock:
-        argsvalues: tuple[ArgsValuesBlock, ...] | tuple = ()
-        args: tuple[SimpleObj | ObjArray | IRInstr | ModifierBlock] | tuple = ()
-
-        for k in child:
-            match k:
-                case ArgsValuesBlock():
-                    argsvalues += (k,)
+        argsvalues: list[ArgsValuesBlock] = []
+        args: list[SimpleObj | ObjArray | IRInstr | ModifierBlock] = []
 
-                case IRInstr() | ModifierBlock():
-                    args += (k,)
+        buckets = (argsvalues, args)
 
-                case Symbol() | CompositeSymbol() | Literal() | LiteralArray():
-                    args += (k,)
+        for k in child:
+            if (bucket := _ARGS_BUCKETS(k)) < 0:
+                raise ValueError(f"unexpected value from args ({k}, {type(k)})")
 
-                case _:
-                    raise ValueError(f"unexpected value from args ({k}, {type(k)})")
+            buckets[bucket].append(k)
 
         if len(argsvalues) != 0 and len(args) != 0:
             raise ValueError(
@@ -515,20 +722,20 @@ class ParserIRVisitor(PTNodeVisitor):
     def visit_call_optbdn(
         self, _: NonTerminal, child: SemanticActionResults
     ) -> CallInstr:
-        args: tuple = ()
+        args: list[ArgsBlock | ArgsValuesBlock] = []
         body: BodyBlock | None = None
-        option: tuple[OptionBlock] | tuple = ()
+        option: list[OptionBlock] = []
 
         for k in child[1:]:
-            match k:
-                case ArgsBlock() | ArgsValuesBlock():
-                    args += (k,)
+            match _OPTBDN_BUCKETS(k):
+                case 0:
+                    args.append(k)
 
-                case BodyBlock():
+                case 1:
                     body = k
 
-                case OptionBlock():
-                    option += (k,)
+                case 2:
+                    option.append(k)
 
                 case _:
                     raise ValueError(
@@ -557,12 +764,11 @@ class ParserIRVisitor(PTNodeVisitor):
         fns = FnsDict()
 
         for k in child:
-            match k:
-                case TypesDict():
-                    types.update(k)
+            if isinstance(k, TypesDict):
+                types.update(k)
 
-                case FnsDict():
-                    fns.update(k)
+            elif isinstance(k, FnsDict):
+                fns.update(k)
 
         parsed_imports = ImportDicts(types=types, fns=fns)
         return parsed_imports
@@ -571,27 +777,16 @@ class ParserIRVisitor(PTNodeVisitor):
         self, _: NonTerminal, child: SemanticActionResults
     ) -> TypesDict:
         if isinstance(child[0], tuple):
-            types = TypesDict()
-            importer = TypeImporter(self._root, self._grammar, type_program, parse)
-            res = importer.import_types(child[0], self._ir_graph)
-
-            for k, v in res.items():
-                types[k] = v
-
-            return types
+            importer = _type_importer(self._root, self._grammar)
+            # the importer builds a new dict, so it is held as is
+            return TypesDict(importer.import_types(child[0], self._ir_graph))
 
         raise ValueError("type import not tuple?")
 
     def visit_fnimport(self, _: NonTerminal, child: SemanticActionResults) -> FnsDict:
         if isinstance(child[0], tuple):
-            fns = FnsDict()
-            importer = FnImporter(self._root, self._grammar, fn_program, parse)
-            res = importer.import_fns(child[0], self._ir_graph)
-
-            for k, v in res.items():
-                fns[k] = v
-
-            return fns
+            importer = _fn_importer(self._root, self._grammar)
+            return FnsDict(importer.import_fns(child[0], self._ir_graph))
 
         raise ValueError("fn import no tuple?")
 
@@ -604,7 +799,8 @@ class ParserIRVisitor(PTNodeVisitor):
         return child[0] if isinstance(child[0], tuple) else (child[0],)
 
     def visit_many_import(self, _: NonTerminal, child: SemanticActionResults) -> tuple:
-        return tuple(chain.from_iterable(child))
+        # a comprehension is cheaper than ``itertools.chain`` for the few imports a module has
+        return tuple([k for imports in child for k in imports])
 
     def visit_main(
         self, _: NonTerminal, child: SemanticActionResults
@@ -631,30 +827,29 @@ class ParserIRVisitor(PTNodeVisitor):
                     f"something went wrong on composite id with closure {parent_id} ({type(parent_id)})"
                 )
 
-        def _compose_id_group(
-            data: Iterable[Symbol | tuple | list | CompositeSymbol],
-        ) -> tuple[tuple[Symbol, ...], ...]:
-            ids = ()
+        # nested groups are flattened in order, walking them with a stack of iterators
+        res: list[tuple[Symbol, ...]] = []
+        stack: list[Iterator] = [iter(child[1:])]
 
-            for p in data:
+        while stack:
+            for p in stack[-1]:
                 match p:
                     case Symbol():
-                        ids += ((p,),)
+                        res.append((p,))
 
                     case CompositeSymbol():
-                        ids += (p.value,)
+                        res.append(p.value)
 
                     case tuple() | list():
-                        ids += _compose_id_group(p)
+                        stack.append(iter(p))
+                        break
 
                     case _:
-                        raise ValueError(
-                            f"unexpected composite id children {p} ({type(p)})"
-                        )
+                        raise ValueError(f"unexpected composite id children {p} ({type(p)})")
 
-            return ids
+            else:
+                stack.pop()
 
-        res: tuple[tuple[Symbol, ...], ...] = _compose_id_group(child[1:])
         final_ids: tuple[CompositeSymbol, ...] = tuple(
             CompositeSymbol(_root + k) for k in res
         )
@@ -682,10 +877,10 @@ class ParserIRVisitor(PTNodeVisitor):
     def visit_composite_id(
         self, _: NonTerminal, child: SemanticActionResults
     ) -> CompositeSymbol:
-        return CompositeSymbol(value=_resolve_data_to_symbol(child))
+        return CompositeSymbol(_resolve_data_to_symbol(child))
 
     def visit_simple_id(self, node: Terminal, _: None) -> Symbol:
-        return Symbol(value=node.value)
+        return Symbol(node.value)
 
     def visit_ref(self, node: Terminal, _: None) -> Symbol:
         return Reference(value=node.value)
@@ -712,29 +907,47 @@ class ParserIRVisitor(PTNodeVisitor):
     ) -> LiteralArray:
         raise NotImplementedError("complex type not implemented yet")
 
-    def visit_t_null(self, node: Terminal, _: None) -> Literal:
-        return Literal(value=node.value, lit_type=Symbol("null"))
+    # literal types are interned once, when the class is defined, as defaults
 
-    def visit_t_bool(self, node: Terminal, _: None) -> Literal:
-        return Literal(value=node.value, lit_type=Symbol("bool"))
+    def visit_t_null(
+        self, node: Terminal, _: None, *, _type: Symbol = Symbol("null")
+    ) -> Literal:
+        return Literal(value=node.value, lit_type=_type)
 
-    def visit_t_str(self, node: NonTerminal, _: None) -> Literal:
-        return Literal(value=node.value, lit_type=Symbol("str"))
+    def visit_t_bool(
+        self, node: Terminal, _: None, *, _type: Symbol = Symbol("bool")
+    ) -> Literal:
+        return Literal(value=node.value, lit_type=_type)
 
-    def visit_t_int(self, node: Terminal, _: None) -> Literal:
-        return Literal(value=node.value, lit_type=Symbol("int"))
+    def visit_t_str(
+        self, node: NonTerminal, _: None, *, _type: Symbol = Symbol("str")
+    ) -> Literal:
+        return Literal(value=node.value, lit_type=_type)
 
-    def visit_t_float(self, node: Terminal, _: None) -> Literal:
-        return Literal(value=node.value, lit_type=Symbol("float"))
+    def visit_t_int(
+        self, node: Terminal, _: None, *, _type: Symbol = Symbol("int")
+    ) -> Literal:
+        return Literal(value=node.value, lit_type=_type)
 
-    def visit_t_imag(self, node: Terminal, _: None) -> Literal:
-        return Literal(value=node.value, lit_type=Symbol("imag"))
+    def visit_t_float(
+        self, node: Terminal, _: None, *, _type: Symbol = Symbol("float")
+    ) -> Literal:
+        return Literal(value=node.value, lit_type=_type)
 
-    def visit_qt_bool(self, node: Terminal, _: None) -> Literal:
-        return Literal(value=node.value, lit_type=Symbol("@bool"))
+    def visit_t_imag(
+        self, node: Terminal, _: None, *, _type: Symbol = Symbol("imag")
+    ) -> Literal:
+        return Literal(value=node.value, lit_type=_type)
 
-    def visit_qt_int(self, node: Terminal, _: None) -> Literal:
-        return Literal(value=node.value, lit_type=Symbol("@int"))
+    def visit_qt_bool(
+        self, node: Terminal, _: None, *, _type: Symbol = Symbol("@bool")
+    ) -> Literal:
+        return Literal(value=node.value, lit_type=_type)
+
+    def visit_qt_int(
+        self, node: Terminal, _: None, *, _type: Symbol = Symbol("@int")
+    ) -> Literal:
+        return Literal(value=node.value, lit_type=_type)
 
 
 def _resolve_data_to_symbol(
@@ -762,99 +975,23 @@ def _resolve_data_to_symbol(
             return (data,)
 
         case SemanticActionResults() | tuple():
-            pure_data: tuple | tuple[Symbol, ...] = ()
+            pure_data: list[Symbol | CompositeSymbol] = []
 
             for k in data:
                 match k:
                     case Symbol() | CompositeSymbol():
-                        pure_data += (k,)
+                        pure_data.append(k)
 
                     # case str():
-                    #     pure_data += (k,)
+                    #     pure_data.append(k)
 
                     case LiteralArray():
-                        pure_data += k.value
+                        pure_data.extend(k.value)
 
-            return pure_data
+            return tuple(pure_data)
 
         # case str():
         #     return (data,)
 
         case _:
             raise NotImplementedError()
-
-
-@deprecated("'_fetch_struct_size_qsize' function will be deprecated, don't use it")
-def _fetch_struct_size_qsize(
-    obj: SemanticActionResults | tuple[Symbol | CompositeSymbol | BaseTypeDef],
-) -> tuple[Size | None, QSize | None]:
-    """
-    Fetch size and qsize attributes for struct data type. If members are not built-in types,
-    it will be skipped and be resolved later on, when all the types are defined.
-
-    Args:
-        obj: the parser holder of type members
-
-    Returns:
-        A tuple of ``size`` and ``qsize``. They can be ``Size`` or ``None``, and
-        ``QSize`` or ``None``, respectively.
-    """
-
-    count_size = 0
-    count_qsize_min = 0
-    count_qsize_max = 0
-
-    # first, count the size and qsize
-    for member_type, member_name in obj:
-        if isinstance(member_type, BaseTypeDef):
-            count_size += member_type.size.size
-            count_qsize_min += member_type.qsize.min
-            count_qsize_max += member_type.qsize.max or 0
-
-    size = Size(count_size) if count_size > 0 else None
-    qsize = (
-        None
-        if count_qsize_min == 0 and count_qsize_max == 0
-        else QSize(count_qsize_min, count_qsize_max or None)
-    )
-    return size, qsize
-
-
-@deprecated("'_fetch_enum_size_qsize' function will be deprecated soon, don't use it")
-def _fetch_enum_size_qsize(
-    obj: SemanticActionResults | tuple[Symbol | CompositeSymbol | BaseTypeDef],
-) -> tuple[Size | None, QSize | None]:
-    """
-    Fetch size and qsize attributes for enum data type. If members are not built-in types,
-    it will be skipped and be resolved later on, when all the types are defined.
-
-    Args:
-        obj: the parser holder of type members
-
-    Returns:
-        A tuple of ``size`` and ``qsize``. They can be ``Size`` or ``None``, and
-        ``QSize`` or ``None``, respectively.
-    """
-
-    count_size = 0
-    count_qsize_min = 0
-    count_qsize_max = 0
-
-    for member in obj:
-        if isinstance(member, BaseTypeDef):
-            if member.size.size > count_size:
-                count_size = member.size.size
-
-            if member.qsize.min > count_qsize_min:
-                count_qsize_min = member.qsize.min
-
-            if member.qsize.max is not None and member.qsize.max > count_qsize_max:
-                count_qsize_max = member.qsize.max
-
-    size = Size(count_size) if count_size > 0 else None
-    qsize = (
-        None
-        if count_qsize_min == 0
-        else QSize(count_qsize_min, count_qsize_max or None)
-    )
-    return size, qsize
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import re
+from functools import cache
+from typing import Any, Callable, Iterator
+
 from pygments.lexer import RegexLexer, bygroups, words
 from pygments.token import (
+    Error,
     Comment,
     Keyword,
     Literal,
@@ -11,7 +16,6 @@ from pygments.token import (
     Punctuation,
     String,
     Whitespace,
-
 )
 
 from hhat_lang.dialects.heather.grammar import (
@@ -114,7 +118,61 @@ class HhatLexer(RegexLexer):
             (QINT, Number.Integer),
             (INT, Number.Integer),
             (STRING, String),
-            (words(bool_literals), Literal.Boolean),
+            (words(bool_literals, suffix=r"\b"), Literal.Boolean),
             (ID, Name.Variable),
         ],
     }
+
+    def get_tokens_unprocessed(
+        self, text: str, stack: Any = ("root",)
+    ) -> Iterator[tuple[int, Any, str]]:
+        """
+        Tokenize ``text`` with a single fused scanner instead of trying each
+        ``root`` rule in turn. Rules keep their order inside the alternation,
+        so the tokens are the same as ``RegexLexer`` would produce.
+        """
+
+        scan, actions = _root_scanner(type(self))
+        pos, end = 0, len(text)
+
+        while pos < end:
+            m = scan(text, pos)
+
+            if m is None:
+                yield pos, Whitespace if text[pos] == "\n" else Error, text[pos]
+                pos += 1
+                continue
+
+            action, rule_match = actions[m.lastgroup]
+
+            if rule_match is None:
+                yield pos, action, m.group()
+
+            else:
+                # callback rules (``bygroups``) need their own group numbering
+                yield from action(self, rule_match(text, pos))
+
+            pos = m.end()
+
+
+@cache
+def _root_scanner(
+    lexer_cls: type[RegexLexer],
+) -> tuple[Callable, dict[str, tuple[Any, Callable | None]]]:
+    """
+    Fuse the lexer ``root`` rules into one regex of named groups, ``r0``,
+    ``r1``, ..., and map each group name to its token action.
+    """
+
+    parts: list[str] = []
+    actions: dict[str, tuple[Any, Callable | None]] = {}
+
+    for k, (regex, action) in enumerate(lexer_cls.tokens["root"]):
+        pattern = regex.get() if isinstance(regex, words) else regex
+        parts.append(f"(?P<r{k}>{pattern})")
+        actions[f"r{k}"] = (
+            action,
+            re.compile(pattern, lexer_cls.flags).match if callable(action) else None,
+        )
+
+    return re.compile("|".join(parts), lexer_cls.flags).match, actions
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import importlib
-import inspect
-from typing import Any, Iterable, cast
+from functools import cache
+from typing import Any, Callable, Iterable, cast
 
 from hhat_lang.core.code.instructions import (
     QInstrFlag,
@@ -29,6 +29,68 @@ from hhat_lang.core.execution.abstract_base import BaseExecutor
 from hhat_lang.core.lowlevel.abstract_qlang import BaseLLQ, BaseLLQManager
 from hhat_lang.core.utils import Error, Ok, Result
 
+INSTRS_MODULE = "hhat_lang.low_level.quantum_lang.openqasm.v2.instructions"
+"""module holding the OpenQASM v2 instructions classes"""
+
+
+@cache
+def _instrs_table() -> dict[Any, type]:
+    """
+    Instructions classes by their ``name`` attribute. The module is imported and
+    inspected only once; the first class (in the module namespace order) wins on
+    repeated names.
+    """
+
+    instr_module = importlib.import_module(INSTRS_MODULE)
+    table: dict[Any, type] = dict()
+
+    # walk the module namespace directly; no sorting nor getattr per member
+    for obj in vars(instr_module).values():
+        if isinstance(obj, type) and (name := getattr(obj, "name", False)):
+            table.setdefault(name, obj)
+
+    return table
+
+
+def get_instr(name: Any) -> type | None:
+    """OpenQASM v2 instruction class named ``name``, if any."""
+
+    return _instrs_table().get(name)
+
+
+@cache
+def _x_gate(n: int) -> str:
+    """OpenQASM v2 ``x`` gate string on qubit ``n``, formatted once per index."""
+
+    return f"x q[{n}];"
+
+
+def _gen_not_implemented(_llq: LowLeveQLang, _item: Any, **_kwargs: Any) -> Any:
+    # TODO: implement it
+    raise NotImplementedError()
+
+
+_GEN_CODE_FNS: dict[type, Callable[..., Any]] = {
+    Symbol: lambda llq, k, **_kw: llq.gen_var(k, executor=llq._executor),
+    Literal: lambda llq, k, **_kw: llq.gen_literal(k),
+    IRInstr: lambda llq, k, **kw: llq.gen_instrs(instr=k, **kw),
+    CompositeSymbol: _gen_not_implemented,
+    LiteralArray: _gen_not_implemented,
+    ObjTuple: _gen_not_implemented,
+}
+"""code generation handler for each data type that can show up as argument or member"""
+
+
+@cache
+def _gen_handler(kind: type) -> Callable[..., Any] | None:
+    """Handler for ``kind``, or for its closest base class in ``_GEN_CODE_FNS``."""
+
+    for base in kind.__mro__:
+        if (fn := _GEN_CODE_FNS.get(base)) is not None:
+            return fn
+
+    return None
+
 
 class LLQManager(BaseLLQManager):
     """
@@ -81,8 +143,19 @@ class LowLeveQLang:
 
     def _gen_literal_int(self, literal: Literal) -> tuple[str, ...]:
         if literal in self._idx:
-            (literal.type)
-            return tuple(f"x q[{n}];" for n, k in enumerate(literal.bin) if k == "1")
+            # scan only the set bits, from the most significant one, so the
+            # qubit indexes come out in the same order as the ``bin`` string
+            bits = literal.bin
+            width = len(bits)
+            value = int(bits, 2)
+            code: list[str] = []
+
+            while value:
+                top = value.bit_length() - 1
+                code.append(_x_gate(width - 1 - top))
+                value ^= 1 << top
+
+            return tuple(code)
 
         return ("",)
 
@@ -104,110 +177,55 @@ class LowLeveQLang:
 
         return tuple(f"x q[{n}];" for n, k in enumerate(literal.bin) if k == "1")
 
-    def gen_var(
-        self, var: DataDef | Symbol, executor: BaseExecutor
-    ) -> tuple[str, ...] | ErrorHandler:
-        """Generate QASM code from variable data"""
-
-        var_data = executor.mem.heap[var if isinstance(var, Symbol) else var.name]
-        code_tuple: tuple[str, ...] = ()
-
-        for member, data in cast(Iterable[tuple[Any, Any]], var_data):
-            match data:
-                case Symbol():
-                    d_res = self.gen_var(data, executor=self._executor)
-
-                    if isinstance(d_res, tuple):
-                        code_tuple += d_res
-
-                    else:
-                        return d_res
-
-                case Literal():
-                    d_res = self.gen_literal(data)
-
-                    if isinstance(d_res, tuple):
-                        code_tuple += d_res
-
-                    else:
-                        return d_res
-
-                case CompositeSymbol():
-                    # TODO: implement it
-                    raise NotImplementedError()
+    def _gen_items(
+        self, items: Iterable[Any], *, strict: bool, **kwargs: Any
+    ) -> tuple[str, ...] | Any:
+        """
+        Generate QASM code for each of ``items``, dispatching on their type. Items
+        of types without a handler raise ``NotImplementedError`` if ``strict``,
+        otherwise they are skipped. Returns the code tuple or the first error found.
+        """
 
-                case LiteralArray():
-                    # TODO: implement it
-                    raise NotImplementedError()
+        code_parts: list[str] = []
 
-                case ObjTuple():
-                    # TODO: implement it
+        for k in items:
+            if (gen := _gen_handler(type(k))) is None:
+                if strict:
+                    # unknown case, needs investigation
                     raise NotImplementedError()
 
-                case IRInstr():
-                    match res := self.gen_instrs(instr=data, executor=self._executor):
-                        case Ok():
-                            code_tuple += res.result()
-
-                        case Error():
-                            return res.result()
-
-                        case ErrorHandler():
-                            return res
-
-        return code_tuple
-
-    def gen_args(self, args: tuple[Any, ...], **kwargs: Any) -> Result | ErrorHandler:
-        code_tuple: tuple[str, ...] = ()
-
-        for k in args:
-            match k:
-                case Symbol():
-                    res = self.gen_var(k, executor=self._executor)
-
-                    if isinstance(res, tuple):
-                        code_tuple += res
-
-                    else:
-                        return res
-
-                case Literal():
-                    res = self.gen_literal(k)
+                continue
 
-                    if isinstance(res, tuple):
-                        code_tuple += res
+            match res := gen(self, k, **kwargs):
+                case tuple():
+                    code_parts.extend(res)
 
-                    else:
-                        return res
-
-                case CompositeSymbol():
-                    # TODO: implement it
-                    raise NotImplementedError()
-
-                case LiteralArray():
-                    # TODO: implement it
-                    raise NotImplementedError()
+                case Ok():
+                    code_parts.extend(res.result())
 
-                case ObjTuple():
-                    # TODO: implement it
-                    raise NotImplementedError()
+                case Error():
+                    return res.result()
 
-                case IRInstr():
-                    match instr_res := self.gen_instrs(instr=k, **kwargs):
-                        case Ok():
-                            code_tuple += instr_res.result()
+                case _:
+                    return res
 
-                        case Error():
-                            return instr_res.result()
+        return tuple(code_parts)
 
-                        case ErrorHandler():
-                            return instr_res
+    def gen_var(
+        self, var: DataDef | Symbol, executor: BaseExecutor
+    ) -> tuple[str, ...] | ErrorHandler:
+        """Generate QASM code from variable data"""
 
-                case _:
-                    # unknown case, needs investigation
-                    raise NotImplementedError()
+        var_data = executor.mem.heap[var if isinstance(var, Symbol) else var.name]
+        return self._gen_items(
+            (data for _, data in cast(Iterable[tuple[Any, Any]], var_data)),
+            strict=False,
+            executor=self._executor,
+        )
 
-        return Ok(code_tuple)
+    def gen_args(self, args: tuple[Any, ...], **kwargs: Any) -> Result | ErrorHandler:
+        res = self._gen_items(args, strict=True, **kwargs)
+        return Ok(res) if isinstance(res, tuple) else res
 
     def gen_instrs(self, *, instr: IRInstr | IRBlock, **kwargs: Any) -> Result | ErrorHandler:
         """
@@ -226,54 +244,42 @@ class LowLeveQLang:
         if not isinstance(instr, IRInstr):
             return InstrNotFoundError(getattr(instr, "name", None))
 
-        instr_module = importlib.import_module(
-            name="hhat_lang.low_level.quantum_lang.openqasm.v2.instructions",
-        )
+        if (obj := get_instr(instr.name)) is None:
+            # if openQASMv2.0 does not have the instruction, then falls
+            # back to H-hat dialect to execute it
+            # TODO: falls back to dialect execution
+            raise NotImplementedError(
+                f"low-level qlang instr error: {instr.name} ({type(instr.name)})"
+            )
 
-        for name, obj in inspect.getmembers(instr_module, inspect.isclass):
-            if (x := getattr(obj, "name", False)) and x == instr.name:
-                skip_gen = getattr(obj, "flag", QInstrFlag.NONE) == QInstrFlag.SKIP_GEN_ARGS
-
-                if skip_gen:
-                    args: tuple[Any, ...] = tuple(cast(Iterable[Any], instr.args))
-                    if len(args) != 2:
-                        return InstrStatusError(instr.name)
-
-                    mask, body = args
-
-                    body_cls = None
-                    for n, o in inspect.getmembers(instr_module, inspect.isclass):
-                        if getattr(o, "name", False) == body:
-                            body_cls = o
-                            break
-
-                    if body_cls is None:
-                        return InstrNotFoundError(body)
-
-                    res_instr, res_status = obj()(
-                        idxs=self._idx.in_use_by[self._qdata],
-                        mask=mask,
-                        body_instr=body_cls(),
-                        executor=self._executor,
-                    )
-                else:
-                    res_instr, res_status = obj()(
-                        idxs=self._idx.in_use_by[self._qdata],
-                        executor=self._executor,
-                    )
-
-                if res_status == InstrStatus.DONE:
-                    return Ok(res_instr)
+        skip_gen = getattr(obj, "flag", QInstrFlag.NONE) == QInstrFlag.SKIP_GEN_ARGS
 
+        if skip_gen:
+            args: tuple[Any, ...] = tuple(cast(Iterable[Any], instr.args))
+            if len(args) != 2:
                 return InstrStatusError(instr.name)
 
-            # if openQASMv2.0 does not have the instruction, then falls
-            # back to H-hat dialect to execute it
-            else:
-                # TODO: falls back to dialect execution
-                raise NotImplementedError(f"low-level qlang instr error: {x} ({type(x)})")
+            mask, body = args
+
+            if (body_cls := get_instr(body)) is None:
+                return InstrNotFoundError(body)
+
+            res_instr, res_status = obj()(
+                idxs=self._idx.in_use_by[self._qdata],
+                mask=mask,
+                body_instr=body_cls(),
+                executor=self._executor,
+            )
+        else:
+            res_instr, res_status = obj()(
+                idxs=self._idx.in_use_by[self._qdata],
+                executor=self._executor,
+            )
 
-        return InstrNotFoundError(instr.name)
+        if res_status == InstrStatus.DONE:
+            return Ok(res_instr)
+
+        return InstrStatusError(instr.name)
 
     def gen_program(self, **kwargs: Any) -> str:
         """
@@ -286,28 +292,16 @@ class LowLeveQLang:
             A string with the OpenQASM v2 code.
         """
 
-        body_code = ""
-
-        instr_module = importlib.import_module(
-            "hhat_lang.low_level.quantum_lang.openqasm.v2.instructions"
-        )
+        body_parts: list[str] = []
 
         for instr in self._code:  # type: ignore [attr-defined]
-            instr_cls = None
-            for name, obj in inspect.getmembers(instr_module, inspect.isclass):
-                if getattr(obj, "name", False) == instr.name:
-                    instr_cls = obj
-                    break
-
-            skip_gen = False
-            if instr_cls is not None:
-                skip_gen = getattr(instr_cls, "flag", QInstrFlag.NONE) == QInstrFlag.SKIP_GEN_ARGS
-
-            if instr.args and not skip_gen:
+            # the instruction flag only matters when there are arguments to generate
+            if instr.args and (
+                getattr(get_instr(instr.name), "flag", QInstrFlag.NONE) != QInstrFlag.SKIP_GEN_ARGS
+            ):
                 match gen_args := self.gen_args(instr.args):
                     case Ok():
-                        if gen_args.result():
-                            body_code += "\n".join(gen_args.result()) + "\n"
+                        body_parts.extend(gen_args.result())
 
                     # TODO: implement it better
                     case Error():
@@ -318,7 +312,7 @@ class LowLeveQLang:
 
             match gen_instr := self.gen_instrs(instr=instr, idx=self._idx, executor=self._executor):
                 case Ok():
-                    body_code += "\n".join(gen_instr.result())
+                    body_parts.extend(gen_instr.result())
 
                 case Error():
                     raise gen_instr.result()
@@ -327,15 +321,11 @@ class LowLeveQLang:
                 case ErrorHandler():
                     raise gen_instr
 
-        if not body_code:
+        if not body_parts:
             return ""
 
-        code = ""
-        code += "\n".join(self.init_qlang()) + "\n\n"
-        code += body_code
-        code += "\n"
-        code += "\n".join(self.end_qlang()) + "\n"
-        return code
+        # header, a blank line, the body and the footer, joined all at once
+        return "\n".join((*self.init_qlang(), "", *body_parts, *self.end_qlang())) + "\n"
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         pass
@@ -9,6 +9,7 @@ from rich import print
 from rich.console import Console
 from rich.panel import Panel
 
+from hhat_lang.core.error_handlers.errors import ErrorHandler, sys_exit
 from hhat_lang.toolchain.project.new import (
     create_new_fn_file,
     create_new_project,
@@ -248,6 +249,9 @@ def run() -> None:
                 border_style="green",
             )
         )
+    except ErrorHandler as err:
+        # errors raised deep inside the execution are only reported here
+        sys_exit(*err.msg_args, error_fn=err)
     except FileNotFoundError:
         console.print(
             Panel(
@@ -13,8 +13,6 @@ from hhat_lang.toolchain.project import (
     MAIN_FILE_NAME,
     SOURCE_FOLDER_NAME,
     SOURCE_TYPES_PATH,
-    IMPORTS_FOLDER_NAME,
-    TESTS_FOLDER_NAME,
     IMPORTS_PATH,
 )
 from hhat_lang.toolchain.project.utils import str_to_path
@@ -40,15 +38,14 @@ def create_new_project(project_name: Path) -> Any:
 
 
 def _create_template_folders(project_name: Path) -> Any:
-    # create root folder 'project_name' name
+    # create root folder 'project_name' name; fails if it already exists
     os.mkdir(project_name)
 
-    # create project template structure
-    os.mkdir(project_name / SOURCE_FOLDER_NAME)
-    os.mkdir(project_name / SOURCE_TYPES_PATH)
-    os.mkdir(project_name / IMPORTS_PATH)
-    os.mkdir(project_name / DOCS_FOLDER_NAME)
-    os.mkdir(project_name / DOCS_TYPES_PATH)
+    # create project template structure; the source and docs folders are
+    # created as parents of their types folders
+    (project_name / SOURCE_TYPES_PATH).mkdir(parents=True)
+    (project_name / IMPORTS_PATH).mkdir()
+    (project_name / DOCS_TYPES_PATH).mkdir(parents=True)
     # os.mkdir(project_name / TESTS_FOLDER_NAME)  # TODO: once tests are implemented, include them
     # os.mkdir(project_name / "proofs")  # TODO: once proofs are incorporated, include them
 
@@ -66,64 +63,57 @@ def _create_template_files(project_name: Path) -> Any:
 ###################
 
 
-def create_new_fn_file(project_root: Path, file_name: str | Path) -> Path:
-    file_name = str(file_name) + ".hat"
-    doc_file = file_name + ".md"
-    file_path: Path = project_root / SOURCE_FOLDER_NAME / file_name
+def _open_new_file(file_path: Path, flags: int) -> None:
+    """
+    Open ``file_path`` with ``flags`` and close it right away; the parent
+    folders are only created when the first attempt finds them missing.
+    """
 
-    if file_path.is_file():
-        raise FileExistsError(f"File {file_path}.hat already exists")
+    try:
+        fd = os.open(file_path, flags, 0o644)
 
-    if file_path.parent != Path("."):
+    except FileNotFoundError:
         file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(file_path, flags, 0o644)
 
-    doc_path = project_root / DOCS_FOLDER_NAME / doc_file
-    if doc_path.parent != Path("."):
-        doc_path.parent.mkdir(parents=True, exist_ok=True)
+    os.close(fd)
 
-    open(file_path, "w").close()
-    open(doc_path, "w").close()
 
-    return file_path
+def _create_file_pair(src_dir: Path, doc_dir: Path, file_name: str | Path) -> Path:
+    """
+    Create an empty source file ``file_name.hat`` inside ``src_dir`` and its
+    documentation file ``file_name.hat.md`` inside ``doc_dir``.
 
+    The source file is created atomically, so a ``FileExistsError`` is raised
+    if it already exists, without touching the documentation file.
+    """
 
-def create_new_type_file(project_path: Path, file_name: str | Path) -> Path:
     file_name = str(file_name) + ".hat"
-    doc_file = file_name + ".md"
-    file_path: Path = project_path / SOURCE_TYPES_PATH / file_name
+    file_path = src_dir / file_name
 
-    if file_path.is_file():
-        raise FileExistsError(f"File {file_path}.hat already exists")
+    try:
+        _open_new_file(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
 
-    if file_path.parent != Path("."):
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-    doc_path = project_path / DOCS_TYPES_PATH / doc_file
-    if doc_path.parent != Path("."):
-        doc_path.parent.mkdir(parents=True, exist_ok=True)
-
-    open(file_path, "w").close()
-    open(doc_path, "w").close()
+    except FileExistsError:
+        raise FileExistsError(f"File {file_path} already exists") from None
 
+    _open_new_file(doc_dir / (file_name + ".md"), os.O_CREAT | os.O_TRUNC | os.O_WRONLY)
     return file_path
 
 
-def create_new_const_file(project_path: Path, file_name: str | Path) -> Path:
-    file_name = str(file_name) + ".hat"
-    doc_file = file_name + ".md"
-    file_path: Path = project_path / SOURCE_FOLDER_NAME / file_name
-
-    if file_path.is_file():
-        raise FileExistsError(f"File {file_path}.hat already exists")
+def create_new_fn_file(project_root: Path, file_name: str | Path) -> Path:
+    return _create_file_pair(
+        project_root / SOURCE_FOLDER_NAME, project_root / DOCS_FOLDER_NAME, file_name
+    )
 
-    if file_path.parent != Path("."):
-        file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    doc_path = project_path / DOCS_FOLDER_NAME / doc_file
-    if doc_path.parent != Path("."):
-        doc_path.parent.mkdir(parents=True, exist_ok=True)
+def create_new_type_file(project_path: Path, file_name: str | Path) -> Path:
+    return _create_file_pair(
+        project_path / SOURCE_TYPES_PATH, project_path / DOCS_TYPES_PATH, file_name
+    )
 
-    open(file_path, "w").close()
-    open(doc_path, "w").close()
 
-    return file_path
+def create_new_const_file(project_path: Path, file_name: str | Path) -> Path:
+    return _create_file_pair(
+        project_path / SOURCE_FOLDER_NAME, project_path / DOCS_FOLDER_NAME, file_name
+    )
@@ -2,15 +2,24 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from hhat_lang.toolchain.project import MAIN_FILE_NAME, SOURCE_FOLDER_NAME
+
+_PROJ_MARKER = Path(SOURCE_FOLDER_NAME) / MAIN_FILE_NAME
+"""file that marks a folder as the root of a H-hat project"""
+
 
 def str_to_path(obj: str | Path) -> Path:
-    return obj if isinstance(obj, Path) else Path(obj).resolve()
+    """Absolute, resolved ``Path`` for ``obj``, whether it is a ``str`` or a ``Path``."""
+
+    return Path(obj).resolve()
 
 
 def get_proj_dir(path: Path | None = None) -> Path:
-    current = path or Path().absolute()
+    """Walk up from ``path`` (or the current directory) to the H-hat project root."""
+
+    current = (path or Path()).absolute()
     while current != current.parent:
-        if (current / "src" / "main.hat").exists():
+        if (current / _PROJ_MARKER).exists():
             return current
         current = current.parent
     raise ValueError("Not inside a H-hat project directory or src/main.hat missing")
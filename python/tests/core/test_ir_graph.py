@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from hhat_lang.core.code.abstract import IRHash, RefTable
+from hhat_lang.core.code.ir_graph import IRGraph
+from hhat_lang.core.code.symbol_table import SymbolTable
+from hhat_lang.core.data.core import Symbol
+from hhat_lang.dialects.heather.code.simple_ir_builder.ir import IR, IRModule
+
+main_path = Path("src/main.hat")
+math_path = Path("src/math.hat")
+io_path = Path("src/io.hat")
+
+
+def _ir(path: Path) -> IR:
+    return IR(ref_table=RefTable(), ir_module=IRModule(path, SymbolTable()))
+
+
+def _graph() -> tuple[IRGraph, IRHash, IRHash]:
+    ir_graph = IRGraph()
+    math_key = ir_graph.add_node(_ir(math_path))
+    main_key = ir_graph.add_main_node(_ir(main_path))
+    return ir_graph, main_key, math_key
+
+
+def test_add_edge() -> None:
+    ir_graph, main_key, math_key = _graph()
+    s_sin, s_cos = Symbol("sin"), Symbol("cos")
+
+    ir_graph.add_edge(s_sin, node_key=main_key, link_key=math_key)
+    ir_graph.add_edge(s_cos, s_sin, node_key=main_key, link_key=math_key)
+
+    # references already linked are not added again, and keep their order
+    assert ir_graph.edges == {(main_key, math_key): (s_sin, s_cos)}
+
+
+def test_update_node_keeps_position_and_edges() -> None:
+    ir_graph, main_key, math_key = _graph()
+    s_sin = Symbol("sin")
+    ir_graph.add_edge(s_sin, node_key=main_key, link_key=math_key)
+
+    io_key = ir_graph.update_node(math_key, _ir(io_path))
+
+    assert io_key == IRHash(io_path)
+    assert [k.irhash for k in ir_graph.tmp_nodes] == [io_key, main_key]
+    assert ir_graph.edges == {(main_key, io_key): (s_sin,)}
+    assert io_path in ir_graph and math_path not in ir_graph
+
+
+def test_update_main_node() -> None:
+    ir_graph, main_key, _ = _graph()
+
+    new_key = ir_graph.update_node(main_key, _ir(io_path))
+    assert ir_graph.main_node == new_key
+
+
+def test_update() -> None:
+    ir_graph, _, math_key = _graph()
+    new_ir = _ir(math_path)
+
+    ir_graph.update(math_key, new_ir)
+    assert ir_graph.tmp_nodes[0].ir is new_ir
+
+
+def test_update_node_errors() -> None:
+    ir_graph, main_key, math_key = _graph()
+
+    with pytest.raises(ValueError):
+        ir_graph.update_node(IRHash(io_path), _ir(io_path))
+
+    with pytest.raises(ValueError):
+        # another node already has the new key
+        ir_graph.update_node(math_key, _ir(main_path))
+
+
+def test_build_with_edges() -> None:
+    ir_graph, main_key, math_key = _graph()
+    s_sin = Symbol("sin")
+    ir_graph.add_edge(s_sin, node_key=main_key, link_key=math_key)
+
+    ir_graph.build()
+
+    assert ir_graph.is_built
+    assert ir_graph.tmp_nodes == ()
+    assert {k.irhash for k in ir_graph.nodes} == {main_key, math_key}
+    assert ir_graph.edges == {(main_key, math_key): (s_sin,)}
+    assert ir_graph.main_node == main_key
+
+    with pytest.raises(ValueError):
+        ir_graph.build()
+
+
+def test_update_node_built() -> None:
+    ir_graph, _, math_key = _graph()
+    ir_graph.build()
+    new_ir = _ir(math_path)
+
+    assert ir_graph.update_node(math_key, new_ir) == math_key
+    assert ir_graph.nodes[math_key].ir is new_ir
+
+    with pytest.raises(ValueError):
+        # the built node set cannot take new keys
+        ir_graph.update_node(math_key, _ir(io_path))
+
+
+def test_reset() -> None:
+    ir_graph, main_key, math_key = _graph()
+    ir_graph.add_edge(Symbol("sin"), node_key=main_key, link_key=math_key)
+    ir_graph.build()
+
+    ir_graph.reset()
+
+    assert not ir_graph.is_built
+    assert len(ir_graph.nodes) == 0
+    assert ir_graph.tmp_nodes == ()
+    assert ir_graph.edges == {}
+    assert ir_graph.main_node is None
+    assert ir_graph.add_node(_ir(math_path)) == math_key
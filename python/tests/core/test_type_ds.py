@@ -111,8 +111,17 @@ def test_struct_ds_quantum() -> None:
 
 
 def test_struct_ds_quantum_wrong() -> None:
-    qtype = StructTypeDef(name=Symbol("@type"))
-    assert isinstance(qtype.add_member(QU3, Symbol("data")), TypeAndMemberNoMatchError)
+    qtype = StructTypeDef(name=Symbol("@type"), num_members=1)
+    with pytest.raises(SystemExit) as e:
+        qtype.add_member(QU3, Symbol("data"))
+
+    assert e.value.code == TypeAndMemberNoMatchError.error_code.value
+
+    qtype2 = StructTypeDef(name=Symbol("@type2"), num_members=1)
+    with pytest.raises(SystemExit) as e:
+        qtype2.add_member(U32, Symbol("@data"))
+
+    assert e.value.code == TypeAndMemberNoMatchError.error_code.value
 
 
 def test_enum_ds() -> None:
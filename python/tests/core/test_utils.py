@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from hhat_lang.core.data.core import Symbol
+from hhat_lang.core.utils import HatOrderedDict
+
+
+def test_hat_ordered_dict() -> None:
+    data = HatOrderedDict()
+    assert repr(data) == "OrderedDict()"
+
+    data[Symbol("b")] = Symbol("u32")
+    data[Symbol("a")] = Symbol("u64")
+
+    assert tuple(data.keys()) == ("b", "a")
+    assert data == OrderedDict({Symbol("b"): Symbol("u32"), Symbol("a"): Symbol("u64")})
+    assert repr(data) == repr(OrderedDict({Symbol("b"): Symbol("u32"), Symbol("a"): Symbol("u64")}))
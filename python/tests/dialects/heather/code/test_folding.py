@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from hhat_lang.core.code.base import FnHeader
+from hhat_lang.core.code.ir_custom import ArgsBlock, BodyBlock
+from hhat_lang.core.data.core import Literal, Symbol
+from hhat_lang.dialects.heather.code.simple_ir_builder.folding import fold_constants
+from hhat_lang.dialects.heather.code.simple_ir_builder.ir import (
+    AssignInstr,
+    CallInstr,
+    DeclareAssignInstr,
+)
+
+s_int = Symbol("int")
+s_x = Symbol("x")
+s_y = Symbol("y")
+
+
+def _int(value: int) -> Literal:
+    return Literal(str(value), s_int)
+
+
+def _call(name: str, *args: Literal | Symbol) -> CallInstr:
+    return CallInstr(Symbol(name), args=ArgsBlock(*args))
+
+
+def test_fold_call() -> None:
+    body = BodyBlock(DeclareAssignInstr(s_x, s_int, _call("add", _int(1), _int(2))))
+    (instr,) = tuple(fold_constants(body))
+
+    assert isinstance(instr, DeclareAssignInstr)
+    assert instr._value == _int(3)
+
+
+def test_fold_call_statement_dropped() -> None:
+    body = BodyBlock(_call("add", _int(1), _int(2)))
+    assert tuple(fold_constants(body)) == ()
+
+
+def test_fold_propagates_single_assignment() -> None:
+    body = BodyBlock(
+        DeclareAssignInstr(s_x, s_int, _int(5)),
+        DeclareAssignInstr(s_y, s_int, _call("mul", s_x, _int(2))),
+    )
+    _, instr = tuple(fold_constants(body))
+
+    assert instr._value == _int(10)
+
+
+def test_fold_shadowed_call() -> None:
+    body = BodyBlock(DeclareAssignInstr(s_x, s_int, _call("add", _int(1), _int(2))))
+    user_add = FnHeader(fn_name=Symbol("add"), args_types=(s_int, s_int))
+
+    # a user function with the same header replaces the built-in one
+    assert fold_constants(body, shadowed=(user_add,)) is body
+
+
+def test_fold_skips_reassigned_variable() -> None:
+    call = _call("add", s_x, _int(1))
+    body = BodyBlock(
+        DeclareAssignInstr(s_x, s_int, _int(1)),
+        AssignInstr(s_x, _int(2)),
+        DeclareAssignInstr(s_y, s_int, call),
+    )
+    *_, instr = tuple(fold_constants(body))
+
+    assert instr._value is call
+
+
+def test_fold_leaves_division_by_zero() -> None:
+    call = _call("div", _int(1), _int(0))
+    body = BodyBlock(DeclareAssignInstr(s_x, s_int, call))
+
+    # the error is raised on execution, with its proper handling
+    assert fold_constants(body) is body
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+from typing import Final
 
-def math_floor_def() -> str:
-    return """
+MATH_FLOOR_DEF: Final[str] = """
     fn floor (x:f64) i64 {
         xi:i64 = x*i64
         ::if(and(ltz(x) ne(x xi*f64)):sub(xi 1) true:xi)
@@ -10,8 +10,7 @@ def math_floor_def() -> str:
     """
 
 
-def math_mod2pi_def() -> str:
-    return """
+MATH_MOD2PI_DEF: Final[str] = """
     fn mod-2pi (theta:f64) f64 {
         two-pi:f64 = 6.283185307179586
         quot:i64 = floor(div(theta two-pi))
@@ -20,8 +19,7 @@ def math_mod2pi_def() -> str:
     """
 
 
-def math_modpi_def() -> str:
-    return """
+MATH_MODPI_DEF: Final[str] = """
     fn mod-pi (theta:f64) f64 {
         pi:f64 = 3.141592653589793
         two-pi:f64 = 6.283185307179586
@@ -31,8 +29,7 @@ def math_modpi_def() -> str:
     """
 
 
-def math_abs_def() -> str:
-    return """
+MATH_ABS_DEF: Final[str] = """
     fn abs (x:f64) f64 {
         bit63:u64 = 9223372036854775807 // sub(pow(2 63) 1), clear sign bit
         b:u64
@@ -43,8 +40,7 @@ def math_abs_def() -> str:
     """
 
 
-def math_sin_def() -> str:
-    return """
+MATH_SIN_DEF: Final[str] = """
     fn sin (theta:f64) f64 {
         pi:f64 = 3.141592653589793
         pi2:f64 = pow(pi 2.0)
@@ -56,47 +52,46 @@ def math_sin_def() -> str:
     """
 
 
-def math1_types_def() -> str:
-    return """
+MATH1_TYPES_DEF: Final[str] = """
     type point:i64
     type line {x:i32}
     type surface:u64
     """
 
 
-def math2_types_def() -> str:
-    return """
+MATH2_TYPES_DEF: Final[str] = """
     type plane {x:i32 y:i32}
     """
 
 
-def math3_types_def() -> str:
-    return """
+MATH3_TYPES_DEF: Final[str] = """
     type normal {dx:i32 dy:i32 dz:i32}
     """
 
 
-def math4_types_def() -> str:
-    return """
+MATH4_TYPES_DEF: Final[str] = """
     type space {x:i64 y:u64 z:i64}
     type surface:u64
     type volume:u64
     """
 
 
-def math5_types_def() -> str:
-    return """
+MATH5_TYPES_DEF: Final[str] = """
     type form {vol:u64}
     """
 
 
-def io1_types_def() -> str:
-    return """
+IO1_TYPES_DEF: Final[str] = """
     type socket {raw:u32}
     """
 
 
-def qstd1_types_def() -> str:
-    return """
+QSTD1_TYPES_DEF: Final[str] = """
     type @bell_t {@source:@bool @target:@bool}
     """
+
+
+# the math functions as a single source file
+MATH_SINGLE_FILE1: Final[str] = (
+    f"{MATH_FLOOR_DEF}{MATH_MOD2PI_DEF}{MATH_MODPI_DEF}{MATH_ABS_DEF}{MATH_SIN_DEF}"
+)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+
+@pytest.fixture
+def user_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the cache signing key off the user cache folder."""
+
+    path = tmp_path / "user-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(path))
+    return path
+
+
+@pytest.fixture
+def parsed_project(
+    project_recipe1: Path, parser: tuple[Callable, Callable], tmp_path: Path
+) -> tuple[Path, str, tuple, int, tuple[Path, ...]]:
+    from hhat_lang.core.code.ir_graph import IRGraph
+    from hhat_lang.dialects.heather.compiler.cache import cache_key
+    from hhat_lang.dialects.heather.parsing.ir_visitor import parse
+
+    project = Path(shutil.copytree(project_recipe1, tmp_path / project_recipe1.name))
+    main_file = project / "src" / "main.hat"
+    code = main_file.read_text(encoding="utf-8")
+
+    ir_graph = IRGraph()
+    parse(*parser, code, project, main_file, ir_graph)
+    nodes = ir_graph.tmp_nodes
+    main_idx = next(n for n, k in enumerate(nodes) if k.irhash == ir_graph.main_node)
+
+    return (
+        project,
+        cache_key(code),
+        tuple(k.ir for k in nodes),
+        main_idx,
+        tuple(k.path for k in nodes),
+    )
+
+
+def test_cache_hit(parsed_project, user_cache: Path) -> None:
+    from hhat_lang.dialects.heather.compiler.cache import load_cached, store
+
+    project, key, irs, main_idx, paths = parsed_project
+    assert load_cached(project, key) is None
+
+    store(project, key, irs, main_idx, paths)
+    cached = load_cached(project, key)
+
+    assert cached is not None
+    cached_irs, cached_main_idx = cached
+    assert cached_main_idx == main_idx
+    assert [repr(k) for k in cached_irs] == [repr(k) for k in irs]
+
+
+def test_cache_miss_on_imported_module_edit(parsed_project, user_cache: Path) -> None:
+    from hhat_lang.dialects.heather.compiler.cache import load_cached, store
+
+    project, key, irs, main_idx, paths = parsed_project
+    store(project, key, irs, main_idx, paths)
+
+    imported = next(k for k in paths if k.name != "main.hat")
+    imported.write_text(imported.read_text() + "\n")
+
+    assert load_cached(project, key) is None
+
+
+def test_cache_miss_on_missing_module(parsed_project, user_cache: Path) -> None:
+    from hhat_lang.dialects.heather.compiler.cache import load_cached, store
+
+    project, key, irs, main_idx, paths = parsed_project
+    store(project, key, irs, main_idx, paths)
+
+    next(k for k in paths if k.name != "main.hat").unlink()
+
+    assert load_cached(project, key) is None
+
+
+@pytest.mark.parametrize(
+    "content", [b"", b"not a cache entry", b"\x00" * 64], ids=["empty", "text", "zeros"]
+)
+@pytest.mark.parametrize("signed", [False, True], ids=["unsigned", "signed"])
+def test_cache_corrupt_file(parsed_project, user_cache: Path, content: bytes, signed: bool) -> None:
+    from hhat_lang.dialects.heather.compiler.cache import (
+        _cache_file,
+        _sign,
+        load_cached,
+        store,
+    )
+
+    project, key, irs, main_idx, paths = parsed_project
+    store(project, key, irs, main_idx, paths)
+    _cache_file(project, key).write_bytes(_sign(content) + content if signed else content)
+
+    assert load_cached(project, key) is None
+
+
+def test_cache_unsigned_entry(parsed_project, user_cache: Path) -> None:
+    from hhat_lang.dialects.heather.compiler.cache import _cache_file, load_cached, store
+
+    project, key, irs, main_idx, paths = parsed_project
+    store(project, key, irs, main_idx, paths)
+
+    # an entry signed with another user key (e.g. shipped along with the project)
+    shutil.rmtree(user_cache)
+    assert load_cached(project, key) is None
+    assert _cache_file(project, key).is_file()
+
+
+def test_cache_key_covers_core_sources(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from hhat_lang.dialects.heather.compiler import cache
+
+    assert cache._PACKAGE_PATH / "core" in cache._VERSION_PATHS
+
+    source = tmp_path / "core" / "data.py"
+    source.parent.mkdir()
+    source.write_text("A = 1\n", encoding="utf-8")
+    monkeypatch.setattr(cache, "_VERSION_PATHS", (source.parent,))
+
+    try:
+        cache.code_version.cache_clear()
+        key = cache.cache_key("main {}")
+
+        source.write_text("A = 2\n", encoding="utf-8")
+        cache.code_version.cache_clear()
+        assert cache.cache_key("main {}") != key
+
+    finally:
+        cache.code_version.cache_clear()
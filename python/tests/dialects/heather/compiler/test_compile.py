@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.parametrize("project", ["project_recipe1", "project_recipe2"])
+def test_parallel_parse_matches_serial(project: str, request, tmp_path: Path) -> None:
+    from hhat_lang.core.config.base import HhatProjectSettings
+    from hhat_lang.dialects.heather.compiler.core import compile_project_ir
+
+    pristine: Path = request.getfixturevalue(project)
+    project_root = Path(shutil.copytree(pristine, tmp_path / pristine.name))
+    settings = HhatProjectSettings(project_root, current=None, available=None)
+    raw_code = (project_root / "src" / "main.hat").read_text(encoding="utf-8")
+
+    serial = compile_project_ir(settings, raw_code, use_cache=False, max_workers=1)
+    parallel = compile_project_ir(settings, raw_code, use_cache=False, max_workers=2)
+
+    # workers add the modules in another order, so compare them by key
+    assert serial.main_node == parallel.main_node
+    assert sorted(str(k.ir) for k in serial.nodes) == sorted(str(k.ir) for k in parallel.nodes)
+
+
+def test_parallel_parse_skips_unused_modules(project_recipe1: Path, tmp_path: Path) -> None:
+    from hhat_lang.core.config.base import HhatProjectSettings
+    from hhat_lang.dialects.heather.compiler.core import compile_project_ir
+
+    project_root = Path(shutil.copytree(project_recipe1, tmp_path / project_recipe1.name))
+    # a module main does not import is never parsed, so its syntax error is harmless
+    (project_root / "src" / "unused.hat").write_text("fn broken (", encoding="utf-8")
+    settings = HhatProjectSettings(project_root, current=None, available=None)
+    raw_code = (project_root / "src" / "main.hat").read_text(encoding="utf-8")
+
+    serial = compile_project_ir(settings, raw_code, use_cache=False)
+    parallel = compile_project_ir(settings, raw_code, use_cache=False, max_workers=2)
+
+    assert len(serial.nodes) == len(parallel.nodes)
+    assert all(k.path.name != "unused.hat" for k in parallel.nodes)
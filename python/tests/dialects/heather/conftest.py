@@ -3,166 +3,185 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Callable
 
-from pytest import fixture
+from pytest import TempPathFactory, fixture
 
 from .code_samples import (
-    io1_types_def,
-    math1_types_def,
-    math2_types_def,
-    math3_types_def,
-    math4_types_def,
-    math5_types_def,
-    math_abs_def,
-    math_floor_def,
-    math_mod2pi_def,
-    math_modpi_def,
-    math_sin_def,
-    qstd1_types_def,
+    IO1_TYPES_DEF,
+    MATH1_TYPES_DEF,
+    MATH2_TYPES_DEF,
+    MATH3_TYPES_DEF,
+    MATH4_TYPES_DEF,
+    MATH5_TYPES_DEF,
+    MATH_ABS_DEF,
+    MATH_FLOOR_DEF,
+    MATH_MOD2PI_DEF,
+    MATH_MODPI_DEF,
+    MATH_SIN_DEF,
+    MATH_SINGLE_FILE1,
+    QSTD1_TYPES_DEF,
 )
-from .utils import start_new_project
 
 RelativePath = Path | str
 
 
-@fixture
+@fixture(scope="session")
+def parser() -> tuple[Callable, Callable]:
+    """
+    The grammar parser accessor and the program rule to give to ``parse``. The
+    parser is built here, once per session, so every parse reuses it.
+    """
+
+    from hhat_lang.dialects.heather.grammar.fn_grammar import fn_program
+    from hhat_lang.dialects.heather.parsing.ir_visitor import parser_grammar_code
+
+    parser_grammar_code(fn_program)
+    return parser_grammar_code, fn_program
+
+
+@fixture(scope="session")
 def math_floor_fn() -> str:
-    return math_floor_def()
+    return MATH_FLOOR_DEF
 
 
-@fixture
+@fixture(scope="session")
 def math_mod2pi_fn() -> str:
-    return math_mod2pi_def()
+    return MATH_MOD2PI_DEF
 
 
-@fixture
+@fixture(scope="session")
 def math_modpi_fn() -> str:
-    return math_modpi_def()
+    return MATH_MODPI_DEF
 
 
-@fixture
+@fixture(scope="session")
 def math_abs_fn() -> str:
-    return math_abs_def()
+    return MATH_ABS_DEF
 
 
-@fixture
+@fixture(scope="session")
 def math_sin_fn() -> str:
-    return math_sin_def()
+    return MATH_SIN_DEF
 
 
-@fixture
+@fixture(scope="session")
 def math_single_file1() -> tuple[RelativePath, str]:
-    return (
-        "math",
-        f"{math_floor_def()}{math_mod2pi_def()}{math_modpi_def()}{math_abs_def()}{math_sin_def()}",
-    )
+    return "math", MATH_SINGLE_FILE1
 
 
-@fixture
+@fixture(scope="session")
 def empty_file() -> tuple[RelativePath, str]:
     return "", ""
 
 
-@fixture
+@fixture(scope="session")
 def math1_types_file() -> tuple[RelativePath, str]:
     return (
         "math/geometry/euclidian",
-        math1_types_def(),
+        MATH1_TYPES_DEF,
     )
 
 
-@fixture
+@fixture(scope="session")
 def math2_types_file() -> tuple[RelativePath, str]:
     return (
         "math/geometry/euclidian",
-        math2_types_def(),
+        MATH2_TYPES_DEF,
     )
 
 
-@fixture
+@fixture(scope="session")
 def math3_types_file() -> tuple[RelativePath, str]:
-    return "math/geometry/differential", math3_types_def()
+    return "math/geometry/differential", MATH3_TYPES_DEF
 
 
-@fixture
+@fixture(scope="session")
 def math4_types_file() -> tuple[RelativePath, str]:
-    return "math/geometry/differential", math4_types_def()
+    return "math/geometry/differential", MATH4_TYPES_DEF
 
 
-@fixture
+@fixture(scope="session")
 def math5_types_file() -> tuple[RelativePath, str]:
-    return "math/geometry/euclidian", math5_types_def()
+    return "math/geometry/euclidian", MATH5_TYPES_DEF
 
 
-@fixture
+@fixture(scope="session")
 def io1_types_file() -> tuple[RelativePath, str]:
-    return "std/io/net", io1_types_def()
+    return "std/io/net", IO1_TYPES_DEF
 
 
-@fixture
+@fixture(scope="session")
 def qstd1_types_file() -> tuple[RelativePath, str]:
-    return "std/base", qstd1_types_def()
+    return "std/base", QSTD1_TYPES_DEF
 
 
-@fixture
+@fixture(scope="session")
 def project_recipe1(
-    math4_types_file: tuple[RelativePath, str], math5_types_file: tuple[RelativePath, str]
-) -> Callable:
-    def _run() -> Path:
-        main = """
-        use (type:math.geometry.{euclidian.space differential.form})
-    
-        main {
-            p:space =.{x=1.0 y=2.0 z=0.0}
-        }
-        """
-        return start_new_project(
-            "project-test1",
-            types_files=(math4_types_file, math5_types_file),
-            fns_files=(),
-            main_file=main,
-        )
+    tmp_path_factory: TempPathFactory,
+    math4_types_file: tuple[RelativePath, str],
+    math5_types_file: tuple[RelativePath, str],
+) -> Path:
+    """Pristine project scaffold, built once per session; tests must copy it."""
 
-    return _run
+    # imported here so collecting tests that don't need a project skips it
+    from .utils import start_new_project
+
+    main = """
+    use (type:math.geometry.{euclidian.space differential.form})
+    
+    main {
+        p:space =.{x=1.0 y=2.0 z=0.0}
+    }
+    """
+    return start_new_project(
+        "project-test1",
+        types_files=(math4_types_file, math5_types_file),
+        fns_files=(),
+        main_file=main,
+        base_path=tmp_path_factory.mktemp("recipes"),
+    )
 
 
-@fixture
+@fixture(scope="session")
 def project_recipe2(
+    tmp_path_factory: TempPathFactory,
     math1_types_file,
     math2_types_file,
     math3_types_file,
     io1_types_file,
     qstd1_types_file,
     math_single_file1,
-) -> Callable:
-    def _run() -> Path:
-        main = """
-        use (
-            type:[
-              math.geometry.{euclidian.{line plane} differential.normal}
-              std.{io.net.socket base.@bell_t}
-            ]
-            fn:math.{sin floor}
-        )
-        
-        main {
-            l:line=.{x=41}
-            p:plane
-            p.{x=250 y=600}
-            print(sin(0.0))
-            @d:@bell_t=.{@source=@true @target=@false}
-        }
-        """
-        return start_new_project(
-            "project-test2",
-            types_files=(
-                math1_types_file,
-                math2_types_file,
-                math3_types_file,
-                io1_types_file,
-                qstd1_types_file,
-            ),
-            fns_files=(math_single_file1,),
-            main_file=main,
-        )
-
-    return _run
+) -> Path:
+    """Pristine project scaffold, built once per session; tests must copy it."""
+
+    from .utils import start_new_project
+
+    main = """
+    use (
+        type:[
+          math.geometry.{euclidian.{line plane} differential.normal}
+          std.{io.net.socket base.@bell_t}
+        ]
+        fn:math.{sin floor}
+    )
+    
+    main {
+        l:line=.{x=41}
+        p:plane
+        p.{x=250 y=600}
+        print(sin(0.0))
+        @d:@bell_t=.{@source=@true @target=@false}
+    }
+    """
+    return start_new_project(
+        "project-test2",
+        types_files=(
+            math1_types_file,
+            math2_types_file,
+            math3_types_file,
+            io1_types_file,
+            qstd1_types_file,
+        ),
+        fns_files=(math_single_file1,),
+        main_file=main,
+        base_path=tmp_path_factory.mktemp("recipes"),
+    )
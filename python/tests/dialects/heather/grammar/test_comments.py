@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from hhat_lang.dialects.heather.grammar import COMMENT_RE, MULTILINE_COMMENT
+
+LAZY_MULTILINE_COMMENT = re.compile(r"\/\-.*?\-\/", re.MULTILINE)
+"""the multi-line comment pattern it replaces, which ends on the line it starts"""
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "/- comment -/ x",
+        "/--/ x",
+        "/---/ x",
+        "/- a - b -- c -/ -/",
+        "/- a -/ b -/",
+        "/-/ x",
+        "/- unterminated",
+        "/- spans\n two lines -/",
+        "/- ends on\n the next line -/ /- and -/",
+    ],
+)
+def test_multiline_comment(code: str) -> None:
+    match = re.compile(MULTILINE_COMMENT, re.MULTILINE).match(code)
+    expected = LAZY_MULTILINE_COMMENT.match(code)
+
+    assert (match and match.group()) == (expected and expected.group())
+
+
+@pytest.mark.parametrize(
+    "code, comment",
+    [
+        ("// single line\nx", "// single line\n"),
+        ("/- multi-line -/ x", "/- multi-line -/"),
+        ("/- unterminated\n-/ x", None),
+        ("/ x", None),
+    ],
+)
+def test_comment_re(code: str, comment: str | None) -> None:
+    match = COMMENT_RE.match(code)
+    assert (match and match.group()) == comment
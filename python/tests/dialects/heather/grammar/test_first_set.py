@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+import pytest
+
+from ..code_samples import (
+    MATH1_TYPES_DEF,
+    MATH_FLOOR_DEF,
+    MATH_MOD2PI_DEF,
+    MATH_SIN_DEF,
+    MATH_SINGLE_FILE1,
+    QSTD1_TYPES_DEF,
+)
+
+
+def _tree(node: Any) -> tuple:
+    if hasattr(node, "nodes"):
+        return node.rule_name, node.position, node.position_end, tuple(_tree(k) for k in node)
+
+    return node.rule_name, node.position, node.position_end, node.value
+
+
+def _parsers(program: str) -> tuple[Any, Any]:
+    from arpeggio import ParserPython
+
+    from hhat_lang.dialects.heather.grammar import WHITESPACE
+    from hhat_lang.dialects.heather.grammar.first_set import DispatchedChoice
+    from hhat_lang.dialects.heather.grammar.fn_grammar import fn_program
+    from hhat_lang.dialects.heather.grammar.generic_grammar import comment
+    from hhat_lang.dialects.heather.grammar.type_grammar import type_program
+
+    program_fn = fn_program if program == "fn" else type_program
+    options: dict[str, Any] = dict(comment_def=comment, ws=WHITESPACE)
+    dispatched = ParserPython(
+        program_fn, syntax_classes={"OrderedChoice": DispatchedChoice}, **options
+    )
+    return ParserPython(program_fn, **options), dispatched
+
+
+@pytest.mark.parametrize(
+    "pattern, first, nullable",
+    [
+        (r'"([^"]*)"', '"', False),
+        (r"-?([1-9]\d*|0)", "-0123456789", False),
+        (r"\@-?([1-9]\d*|0)", "@", False),
+        (r"a*b", "ab", False),
+        (r"(?i)ab", "aA", False),
+        (r"\d?x", "0123456789x", False),
+        (r"(?=a)b", "b", False),
+        (r"a?", "a", True),
+        (r"", "", True),
+    ],
+)
+def test_regex_first(pattern: str, first: str, nullable: bool) -> None:
+    from hhat_lang.dialects.heather.grammar.first_set import regex_first
+
+    assert regex_first(re.compile(pattern)) == (frozenset(first), nullable)
+
+
+def test_regex_first_negated_class() -> None:
+    from hhat_lang.dialects.heather.grammar.first_set import ASCII, regex_first
+
+    assert regex_first(re.compile("[^a]")) == (ASCII - {"a"}, False)
+
+
+def test_regex_first_unknown() -> None:
+    from hhat_lang.dialects.heather.grammar.first_set import regex_first
+
+    # back references have no FIRST set of their own, so any character may start it
+    assert regex_first(re.compile(r"(a)?\1")) == (None, True)
+    assert regex_first(re.compile(rb"ab")) == (None, True)
+
+
+def test_first_set() -> None:
+    from arpeggio import EOF, OneOrMore, Optional, OrderedChoice, Sequence, StrMatch, ZeroOrMore
+
+    from hhat_lang.dialects.heather.grammar.first_set import first_set
+
+    a, b, c = StrMatch("a"), StrMatch("b"), StrMatch("cd")
+
+    assert first_set(c) == (frozenset("c"), False)
+    assert first_set(StrMatch("Ab", ignore_case=True)) == (frozenset("aA"), False)
+    assert first_set(OrderedChoice(nodes=[a, c])) == (frozenset("ac"), False)
+    assert first_set(Sequence(nodes=[a, b])) == (frozenset("a"), False)
+    assert first_set(Sequence(nodes=[Optional(nodes=[a]), b])) == (frozenset("ab"), False)
+    assert first_set(ZeroOrMore(nodes=[a])) == (frozenset("a"), True)
+    assert first_set(OneOrMore(nodes=[a])) == (frozenset("a"), False)
+    assert first_set(EOF()) == (frozenset(), True)
+
+
+def test_first_set_recursive_rule() -> None:
+    from arpeggio import OrderedChoice, Sequence, StrMatch
+
+    from hhat_lang.dialects.heather.grammar.first_set import first_set
+
+    choice = OrderedChoice(nodes=[StrMatch("a")])
+    choice.nodes.append(Sequence(nodes=[choice, StrMatch("b")]))
+
+    # a rule being computed is unknown (any character) where it is reached again
+    assert first_set(choice) == (None, False)
+
+
+@pytest.mark.parametrize(
+    "program, code",
+    [
+        ("fn", MATH_FLOOR_DEF),
+        ("fn", MATH_MOD2PI_DEF),
+        ("fn", MATH_SIN_DEF),
+        ("fn", MATH_SINGLE_FILE1),
+        ("type", MATH1_TYPES_DEF),
+        ("type", QSTD1_TYPES_DEF),
+    ],
+)
+def test_dispatched_choice_parse_tree(program: str, code: str) -> None:
+    plain, dispatched = _parsers(program)
+    assert _tree(dispatched.parse(code)) == _tree(plain.parse(code))
+
+
+@pytest.mark.parametrize(
+    "code, fewer",
+    [
+        ("main { x:u32 = 1.{ }", False),
+        ("main { x:u32 = add(1 2", False),
+        ("main { ::x }", False),
+        ('main { x:u32 = "abc }', True),
+        ("main { x:u32 = @ }", True),
+    ],
+)
+def test_dispatched_choice_error(code: str, fewer: bool) -> None:
+    from arpeggio import NoMatch
+
+    plain, dispatched = _parsers("fn")
+
+    with pytest.raises(NoMatch) as plain_err:
+        plain.parse(code)
+
+    with pytest.raises(NoMatch) as dispatched_err:
+        dispatched.parse(code)
+
+    expected = {str(k) for k in plain_err.value.rules}
+    reported = {str(k) for k in dispatched_err.value.rules}
+
+    # same error position; on a dispatched character only the alternatives tried
+    # are reported as expected
+    assert dispatched_err.value.position == plain_err.value.position
+    assert reported <= expected
+    assert (reported < expected) is fewer
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import pytest
+
+from ..code_samples import (
+    IO1_TYPES_DEF,
+    MATH1_TYPES_DEF,
+    MATH2_TYPES_DEF,
+    MATH3_TYPES_DEF,
+    MATH4_TYPES_DEF,
+    MATH5_TYPES_DEF,
+    MATH_ABS_DEF,
+    MATH_FLOOR_DEF,
+    MATH_MOD2PI_DEF,
+    MATH_MODPI_DEF,
+    MATH_SIN_DEF,
+    MATH_SINGLE_FILE1,
+    QSTD1_TYPES_DEF,
+)
+
+COMMENTED_MAIN = """
+// leading comment
+main { /- a comment -/ /--/
+  x:u32 = add(1 /- inline - comment -/ 2) // trailing comment
+  print(x)
+}
+"""
+
+FN_SAMPLES = (
+    MATH_FLOOR_DEF,
+    MATH_MOD2PI_DEF,
+    MATH_MODPI_DEF,
+    MATH_ABS_DEF,
+    MATH_SIN_DEF,
+    MATH_SINGLE_FILE1,
+    COMMENTED_MAIN,
+)
+
+TYPE_SAMPLES = (
+    MATH1_TYPES_DEF,
+    MATH2_TYPES_DEF,
+    MATH3_TYPES_DEF,
+    MATH4_TYPES_DEF,
+    MATH5_TYPES_DEF,
+    IO1_TYPES_DEF,
+    QSTD1_TYPES_DEF,
+)
+
+
+def _tree(node: Any) -> tuple:
+    # syntax classes differ between the parsers, so only compare what was matched
+    if hasattr(node, "nodes"):
+        return node.rule_name, node.position, node.position_end, tuple(_tree(k) for k in node)
+
+    return node.rule_name, node.position, node.position_end, node.value
+
+
+def _programs() -> dict[str, Callable]:
+    from hhat_lang.dialects.heather.grammar.fn_grammar import fn_program
+    from hhat_lang.dialects.heather.grammar.type_grammar import type_program
+
+    return {"fn": fn_program, "type": type_program}
+
+
+@pytest.mark.parametrize(
+    "program, code",
+    [("fn", k) for k in FN_SAMPLES] + [("type", k) for k in TYPE_SAMPLES],
+)
+def test_skip_match_parse_tree(program: str, code: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    from arpeggio import ParserPython
+
+    from hhat_lang.dialects.heather.grammar import WHITESPACE
+    from hhat_lang.dialects.heather.grammar.generic_grammar import comment
+    from hhat_lang.dialects.heather.grammar.skip import SkipMatch, SkipStrMatch
+
+    program_fn = _programs()[program]
+    options: dict[str, Any] = dict(comment_def=comment, ws=WHITESPACE)
+
+    with monkeypatch.context() as m:
+        # arpeggio's own whitespace and comment skipping, as the reference
+        m.setattr(SkipMatch, "parse", lambda self, parser: super(SkipMatch, self).parse(parser))
+        expected = _tree(ParserPython(program_fn, **options).parse(code))
+
+    parser = ParserPython(program_fn, syntax_classes={"StrMatch": SkipStrMatch}, **options)
+    assert _tree(parser.parse(code)) == expected
+
+
+def _suppressed(node: Any) -> tuple:
+    from arpeggio import NonTerminal
+
+    if isinstance(node, NonTerminal):
+        return tuple(_suppressed(k) for k in node)
+
+    return node.position, node.suppress
+
+
+@pytest.mark.parametrize("code", FN_SAMPLES)
+def test_str_match_suppressed(code: str) -> None:
+    from arpeggio import ParserPython
+
+    from hhat_lang.dialects.heather.grammar import WHITESPACE
+    from hhat_lang.dialects.heather.grammar.fn_grammar import fn_program
+    from hhat_lang.dialects.heather.grammar.generic_grammar import comment
+    from hhat_lang.dialects.heather.parsing.ir_visitor import parser_grammar_code
+
+    expected = ParserPython(fn_program, comment_def=comment, ws=WHITESPACE).parse(code)
+    assert _suppressed(parser_grammar_code(fn_program).parse(code)) == _suppressed(expected)
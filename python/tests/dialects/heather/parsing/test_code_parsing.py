@@ -6,29 +6,23 @@ from typing import Callable
 
 import pytest
 
-from hhat_lang.core.code.ir_graph import IRGraph
-from hhat_lang.dialects.heather.grammar.fn_grammar import fn_program
-from hhat_lang.dialects.heather.parsing.ir_visitor import parse, parser_grammar_code
-
 
 @pytest.mark.parametrize("project", ["project_recipe1", "project_recipe2"])
-def test_parse(project: Callable, request) -> None:
-    project = request.getfixturevalue(project)
-    _path: Path = project()
+def test_parse(project: str, parser: tuple[Callable, Callable], request, tmp_path: Path) -> None:
+    # the parser stack is heavy to import; load it only when this test runs
+    from hhat_lang.core.code.ir_graph import IRGraph
+    from hhat_lang.dialects.heather.parsing.ir_visitor import parse
+
+    # the recipe fixtures build each project once per session; every test
+    # parses its own copy, which pytest removes along with ``tmp_path``
+    pristine: Path = request.getfixturevalue(project)
+    _path = Path(shutil.copytree(pristine, tmp_path / pristine.name))
     assert _path.exists()
 
     main_file = _path / "src" / "main.hat"
-    code = open(main_file, "r").read()
-    ir_graph = IRGraph()
-
-    try:
-        parse(parser_grammar_code, fn_program, code, _path, main_file, ir_graph)
-        ir_graph.build()
-        print(ir_graph)
+    code = main_file.read_text(encoding="utf-8")
 
-    except Exception as e:
-        shutil.rmtree(_path)
-        raise Exception(e)
-
-    else:
-        shutil.rmtree(_path)
+    ir_graph = IRGraph()
+    parse(*parser, code, _path, main_file, ir_graph)
+    ir_graph.build()
+    print(ir_graph)
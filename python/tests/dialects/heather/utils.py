@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from pathlib import Path
 from typing import Callable
 
@@ -9,8 +10,6 @@ from hhat_lang.toolchain.project.new import (
     create_new_type_file,
 )
 
-THIS_PATH = Path(__file__).parent
-
 RawCode = str
 RelativePath = Path | str
 
@@ -39,13 +38,21 @@ def _resolve_files(
     context_path: Path | str,
     data: tuple[tuple[RelativePath, RawCode], ...],
 ):
+    # group the fragments by file so each file is opened only once
+    files: defaultdict[RelativePath, list[RawCode]] = defaultdict(list)
+
     for relative_path, code in data:
-        full_path = project_path / context_path
+        files[relative_path].append(code)
+
+    full_path = project_path / context_path
+
+    for relative_path, codes in files.items():
+        file = full_path / (relative_path + ".hat")
 
-        if not (full_path / (relative_path + ".hat")).exists():
+        if not file.exists():
             fn(project_path, relative_path)
 
-        _append_file(full_path / (relative_path + ".hat"), code)
+        _append_file(file, "".join(codes))
 
 
 def start_new_project(
@@ -53,8 +60,9 @@ def start_new_project(
     types_files: tuple[tuple[RelativePath, RawCode], ...],
     fns_files: tuple[tuple[RelativePath, RawCode], ...],
     main_file: str,
+    base_path: Path,
 ) -> Path:
-    project_path = Path(THIS_PATH / name).resolve()
+    project_path = Path(base_path / name).resolve()
     create_new_project(project_name=project_path)
 
     _resolve_files(_create_type_file, project_path, "src/hat_types", types_files)
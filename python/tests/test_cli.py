@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import shutil
 from pathlib import Path
 
 import pytest
@@ -11,37 +10,12 @@ from hhat_lang.toolchain.cli.cli import app
 
 runner = CliRunner()
 
-_cwd = os.getcwd()
-
-
-class temp_dir:
-    def __init__(self, project_name: str):
-        self.pn = project_name
-
-    def __enter__(self):
-        if self.pn:
-            if not Path(self.pn).exists():
-                os.mkdir(self.pn)
-            os.chdir(self.pn)
-        return self.pn
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        os.chdir(_cwd)
-        if self.pn:
-            shutil.rmtree(self.pn)
-
 
 @pytest.fixture
-def temp_dir2():
-    """Provide a temporary directory for tests"""
-    original_cwd = os.getcwd()
-    temp_dir = "temp"
-    if not Path(temp_dir).exists():
-        os.mkdir(temp_dir)
-    os.chdir(temp_dir)
-    yield temp_dir
-    os.chdir(original_cwd)
-    shutil.rmtree(temp_dir)
+def tmp_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run the test from its own temporary directory, removed by pytest afterward"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
 def test_help_command():
@@ -63,92 +37,90 @@ def test_help_specific_command():
     assert "--type" in result.stdout
 
 
-def test_create_new_project():
-    with temp_dir("testproject1") as tp:
-        """Test creating a new project succeeds"""
-        result = runner.invoke(app, ["new", tp])
-        assert result.exit_code == 0
-        assert "created successfully" in result.stdout
-        assert (Path() / tp).exists()
-        assert (Path() / tp / "src" / "main.hat").exists()
-
-
-def test_create_project_exists():
-    with temp_dir("testproject2") as tp:
-        """Test creating a project fails when directory exists"""
-        runner.invoke(app, ["new", tp])
-        # Try to create it again
-        result = runner.invoke(app, ["new", tp])
-        assert result.exit_code == 1
-        assert "Error" in result.stdout
-        print(f"{result.stdout}")
-        assert "exists" in result.stdout
-
-
-def test_create_file_in_project():
-    with temp_dir("testproject3") as tp:
-        """Test creating a new file inside a project directory"""
-        runner.invoke(app, ["new", tp])
-        os.chdir(tp)
-        # Create a new file
-        result = runner.invoke(app, ["new", "-f", "module/testfile"])
-        assert result.exit_code == 0
-        assert "created successfully" in result.stdout
-        assert (Path() / "src" / "module" / "testfile.hat").exists()
-
-
-def test_create_file_outside_project():
-    with temp_dir(""):
-        """Test creating a file fails outside project directory"""
-        result = runner.invoke(app, ["new", "-f", "testfile4"])
-        assert result.exit_code == 1
-        assert "Error" in result.stdout
-        assert "project directory" in result.stdout
-
-
-def test_create_existing_file():
-    with temp_dir("testproject5") as tp:
-        """Test creating a file fails when it already exists"""
-        runner.invoke(app, ["new", tp])
-        os.chdir(tp)
-        runner.invoke(app, ["new", "-f", "testfile"])
-        result = runner.invoke(app, ["new", "-f", "testfile"])
-        assert result.exit_code == 1
-        assert "Error" in result.stdout
-        assert "already exists" in result.stdout
-
-
-def test_create_type_file():
-    with temp_dir("testproject6") as tp:
-        """Test creating a new type file inside a project directory"""
-        runner.invoke(app, ["new", tp])
-        os.chdir(tp)
-        result = runner.invoke(app, ["new", "-t", "customtype"])
-        assert result.exit_code == 0
-        assert "created successfully" in result.stdout
-        assert "customtype.hat" in result.stdout
-
-
-def test_run_project():
-    with temp_dir("testproject7") as tp:
-        """Test running a project with empty main.hat"""
-        runner.invoke(app, ["new", tp])
-        os.chdir(tp)
-        # Run the project
-        result = runner.invoke(app, ["run"])
-        assert result.exit_code == 1  # expect an error
-        assert "Error" in result.stdout
-        assert "no implementation yet" in result.stdout
-
-
-def test_run_outside_project():
-    with temp_dir(""):
-        """Test running outside a project directory fails"""
-        result = runner.invoke(app, ["run"])
-        assert result.exit_code == 1
-        assert "Error" in result.stdout
-        # We don't test for the exact error message since it's wrapped in a panel
-        # and the formatting might change
+def test_create_new_project(tmp_cwd: Path):
+    """Test creating a new project succeeds"""
+    tp = "testproject1"
+    result = runner.invoke(app, ["new", tp])
+    assert result.exit_code == 0
+    assert "created successfully" in result.stdout
+    assert (Path() / tp).exists()
+    assert (Path() / tp / "src" / "main.hat").exists()
+
+
+def test_create_project_exists(tmp_cwd: Path):
+    """Test creating a project fails when directory exists"""
+    tp = "testproject2"
+    runner.invoke(app, ["new", tp])
+    # Try to create it again
+    result = runner.invoke(app, ["new", tp])
+    assert result.exit_code == 1
+    assert "Error" in result.stdout
+    print(f"{result.stdout}")
+    assert "exists" in result.stdout
+
+
+def test_create_file_in_project(tmp_cwd: Path):
+    """Test creating a new file inside a project directory"""
+    tp = "testproject3"
+    runner.invoke(app, ["new", tp])
+    os.chdir(tp)
+    # Create a new file
+    result = runner.invoke(app, ["new", "-f", "module/testfile"])
+    assert result.exit_code == 0
+    assert "created successfully" in result.stdout
+    assert (Path() / "src" / "module" / "testfile.hat").exists()
+
+
+def test_create_file_outside_project(tmp_cwd: Path):
+    """Test creating a file fails outside project directory"""
+    result = runner.invoke(app, ["new", "-f", "testfile4"])
+    assert result.exit_code == 1
+    assert "Error" in result.stdout
+    assert "project directory" in result.stdout
+
+
+def test_create_existing_file(tmp_cwd: Path):
+    """Test creating a file fails when it already exists"""
+    tp = "testproject5"
+    runner.invoke(app, ["new", tp])
+    os.chdir(tp)
+    runner.invoke(app, ["new", "-f", "testfile"])
+    result = runner.invoke(app, ["new", "-f", "testfile"])
+    assert result.exit_code == 1
+    assert "Error" in result.stdout
+    assert "already exists" in result.stdout
+
+
+def test_create_type_file(tmp_cwd: Path):
+    """Test creating a new type file inside a project directory"""
+    tp = "testproject6"
+    runner.invoke(app, ["new", tp])
+    os.chdir(tp)
+    result = runner.invoke(app, ["new", "-t", "customtype"])
+    assert result.exit_code == 0
+    assert "created successfully" in result.stdout
+    assert "customtype.hat" in result.stdout
+
+
+def test_run_project(tmp_cwd: Path):
+    """Test running a project with empty main.hat"""
+    tp = "testproject7"
+    runner.invoke(app, ["new", tp])
+    os.chdir(tp)
+    # Run the project
+    result = runner.invoke(app, ["run"])
+    assert result.exit_code == 1  # expect an error
+    assert "Error" in result.stdout
+    assert "no implementation yet" in result.stdout
+
+
+def test_run_outside_project(tmp_cwd: Path):
+    """Test running outside a project directory fails"""
+    result = runner.invoke(app, ["run"])
+    assert result.exit_code == 1
+    assert "Error" in result.stdout
+    # We don't test for the exact error message since it's wrapped in a panel
+    # and the formatting might change
 
 
 def test_version():
@@ -8,21 +8,25 @@ from pygments.token import (
     Punctuation,
     Literal,
     Comment,
+    Whitespace,
 )
 from hhat_lang.dialects.heather.toolchain.pygments.lexer import HhatLexer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def lexer():
-    """Initialize the HhatLexer for testing."""
+    """Initialize the HhatLexer once for the module; it keeps no per-call state."""
     return HhatLexer()
 
 
+def iter_tokens(lexer, code):
+    """Yield token type and value tuples from code as they are lexed, excluding whitespace."""
+    return ((t, v) for t, v in lexer.get_tokens(code) if t is not Whitespace)
+
+
 def get_tokens(lexer, code):
     """Convert code to a list of token type and value tuples, excluding whitespace."""
-    return [
-        (t, v) for t, v in lexer.get_tokens(code) if str(t) != "Token.Text.Whitespace"
-    ]
+    return list(iter_tokens(lexer, code))
 
 
 def test_type_definitions(lexer):
@@ -85,5 +89,24 @@ def test_cast_operator(lexer):
 def test_variadic_operator(lexer):
     """Verify that the variadic triple-dot is identified as an operator."""
     code = "..."
+    assert next(iter_tokens(lexer, code)) == (Operator, "...")
+
+
+def test_bool_literals_whole_words(lexer):
+    """Verify that identifiers starting with a boolean literal are not split."""
+    code = "true trueish @false"
     tokens = get_tokens(lexer, code)
-    assert tokens[0] == (Operator, "...")
+    assert tokens[0] == (Literal.Boolean, "true")
+    assert tokens[1] == (Name.Variable, "trueish")
+    assert tokens[2] == (Literal.Boolean, "@false")
+
+
+def test_comments(lexer):
+    """Verify that comments are tokenized and multi-line ones end on their own line."""
+    code = "// single\nx /- multi -/ y"
+    tokens = get_tokens(lexer, code)
+    assert tokens[0] == (Comment.Single, "// single\n")
+    assert tokens[2] == (Comment.Multiline, "/- multi -/")
+
+    tokens = get_tokens(lexer, "/- not\n closed -/")
+    assert all(t is not Comment.Multiline for t, _ in tokens)